@@ -5,10 +5,14 @@ Eel-based desktop application for scraping and viewing news
 
 import eel
 import json
+import base64
+import copy
 import time
 from datetime import datetime
 from pathlib import Path
+import heapq
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from fastighetsvarlden_scraper import FastighetsVarldenScraper
 from cision_scraper import CisionScraper
 from lokalguiden_scraper import LokalguidenScraper
@@ -17,6 +21,16 @@ from fastighetsnytt_scraper import FastighetsnyttScraper
 from nordicpropertynews_scraper import NordicPropertyNewsScraper
 import logging
 from deep_translator import GoogleTranslator
+from article_store import get_store, normalize_date
+from backfill import ArchiveBackfill
+from parse_pool import shutdown_parse_pool
+from translation_cache import TranslationCache
+from http_cache import UNCHANGED
+from progress_events import ProgressPublisher
+import metrics
+from profiling import profiled
+from scheduler import is_scheduler_active
+from watermark import page_until_watermark
 from config import (
     FASTIGHETSVARLDEN_DATA_FILE, 
     CISION_DATA_FILE, 
@@ -25,6 +39,12 @@ from config import (
     FASTIGHETSNYTT_DATA_FILE,
     NORDICPROPERTYNEWS_DATA_FILE,
     APP_LOG_FILE,
+    PARALLEL_SCRAPING,
+    SCRAPE_MAX_WORKERS,
+    TRANSLATION_BATCH_SIZE,
+    TRANSLATION_MAX_BATCH_CHARS,
+    TRANSLATION_CONCURRENCY,
+    PREFETCH_TTL,
     ensure_data_directory,
     get_data_directory
 )
@@ -50,7 +70,10 @@ eel.init('web')
 scraper = None
 scraping_in_progress = False
 scraping_thread = None
-translator = GoogleTranslator(source='auto', target='en')
+TRANSLATE_FROM = 'auto'
+TRANSLATE_TO = 'en'
+translator = GoogleTranslator(source=TRANSLATE_FROM, target=TRANSLATE_TO)
+translation_cache = TranslationCache()
 
 
 class ScraperProgress:
@@ -63,21 +86,149 @@ class ScraperProgress:
         self.message = ""
         self.current_source = ""
         self.sources_completed = []
+        self.sources_in_progress = []
+        self.source_status = {}
+        self.pages_per_min = 0.0
+
+
+# Legacy per-source JSON files, imported once into the article store
+LEGACY_DATA_FILES = {
+    'fastighetsvarlden': FASTIGHETSVARLDEN_DATA_FILE,
+    'cision': CISION_DATA_FILE,
+    'lokalguiden': LOKALGUIDEN_DATA_FILE,
+    'di': DI_DATA_FILE,
+    'fastighetsnytt': FASTIGHETSNYTT_DATA_FILE,
+    'nordicpropertynews': NORDICPROPERTYNEWS_DATA_FILE,
+}
+
+
+class ArticleCache:
+    """
+    Process-wide cache of stored articles, sorted newest first
+    
+    Each source is cached separately and reloaded only when it changes:
+    either a scraper in this process saved it (store revision) or another
+    process wrote the database (file mtime/size) and the source's stored
+    article count differs from when it was loaded.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sources = {}  # source -> (revision, fingerprint, articles, generation)
+        self._merged = None  # (generations, articles) for "all"
+        self._file_state = None
+        self._generation = 0
+    
+    def get_articles(self, source="all"):
+        """
+        Get all articles of a source (or all sources) sorted newest first
+        
+        Args:
+            source: Source identifier or "all"
+            
+        Returns:
+            Cached list of article dicts (do not modify)
+        """
+        store = get_store()
+        sources = list(LEGACY_DATA_FILES) if source == "all" else [source]
+        
+        with self._lock:
+            file_state = store.file_state()
+            if file_state != self._file_state:
+                # Database written since the last check, verify each cached source
+                for source_name, cached in list(self._sources.items()):
+                    if store.source_fingerprint(source_name) != cached[1]:
+                        del self._sources[source_name]
+                self._file_state = file_state
+            
+            for source_name in sources:
+                cached = self._sources.get(source_name)
+                if cached is None or cached[0] != store.revision(source_name):
+                    self._load_source(store, source_name)
+            
+            if source != "all":
+                return self._sources[source][2]
+            
+            generations = tuple(self._sources[name][3] for name in sources)
+            if self._merged is None or self._merged[0] != generations:
+                merged = list(heapq.merge(
+                    *(self._sources[name][2] for name in sources),
+                    key=_article_sort_key,
+                    reverse=True
+                ))
+                self._merged = (generations, merged)
+            return self._merged[1]
+    
+    def _load_source(self, store, source):
+        """(Re)load one source from the store"""
+        revision = store.revision(source)
+        fingerprint = store.source_fingerprint(source)
+        articles = store.load_articles(source, newest_first=True)
+        self._generation += 1
+        self._sources[source] = (revision, fingerprint, articles, self._generation)
+        logger.info(f"Loaded {len(articles)} {source} articles into cache")
+
+
+def _article_sort_key(article):
+    """Sort key matching the store's ordering (date, then URL)"""
+    return (normalize_date(article.get('date')), article['url'])
 
 
 progress = ScraperProgress()
+progress_lock = threading.Lock()
+article_cache = ArticleCache()
+
+# Listings parsed by check_for_new_articles: source -> (fetched_at, scraper, articles)
+prefetched_listings = {}
+prefetch_lock = threading.Lock()
+
+
+def _progress_snapshot():
+    """Return a copy of the progress state that is safe to send from any thread"""
+    with progress_lock:
+        return copy.deepcopy(progress.__dict__)
+
+
+def _send_progress_delta(delta):
+    """Send a progress delta to the UI without waiting for a reply"""
+    eel.update_scraping_progress(delta)
+
+
+# All progress updates reach the UI through this throttled event channel
+progress_publisher = ProgressPublisher(_send_progress_delta)
+
+
+def _publish_progress(force=False):
+    """
+    Push the current progress to the UI
+    
+    Args:
+        force: Send now instead of waiting for the throttle interval
+    """
+    progress_publisher.publish(_progress_snapshot(), force=force)
 
 
 def translate_title(title):
     """
     Translate article title to English
     
+    The translation cache is checked first, so titles that were already
+    translated (re-runs, duplicates across sources) never hit the network.
+    
     Args:
         title: Original title in any language
         
     Returns:
         Translated title in English (or original if translation fails)
     """
+    cached = translation_cache.get(title, TRANSLATE_FROM, TRANSLATE_TO)
+    if cached is not None:
+        return cached
+    
+    return _translate_uncached(title)
+
+
+def _translate_uncached(title):
+    """Translate a single title remotely and cache the result"""
     try:
         # Skip if title is already in English (rough check)
         if all(ord(char) < 128 for char in title):
@@ -85,10 +236,164 @@ def translate_title(title):
             pass
         
         translated = translator.translate(title)
-        return translated
     except Exception as e:
         logger.warning(f"Translation failed for '{title}': {e}")
         return title  # Return original if translation fails
+    
+    if translated:
+        translation_cache.put(title, translated, TRANSLATE_FROM, TRANSLATE_TO)
+        return translated
+    return title
+
+
+def translate_titles(titles):
+    """
+    Translate many titles with as few remote calls as possible
+    
+    Cached titles are answered locally; the rest are joined into batches
+    (one title per line) and the batches are translated concurrently.
+    
+    Args:
+        titles: Original titles in any language
+        
+    Returns:
+        Dict mapping each original title to its English translation
+    """
+    translations = {}
+    pending = []
+    
+    for title in dict.fromkeys(titles):
+        cached = translation_cache.get(title, TRANSLATE_FROM, TRANSLATE_TO)
+        if cached is not None:
+            translations[title] = cached
+        else:
+            pending.append(title)
+    
+    if not pending:
+        return translations
+    
+    batches = _make_translation_batches(pending)
+    logger.info(f"Translating {len(pending)} titles in {len(batches)} batches")
+    
+    with ThreadPoolExecutor(max_workers=TRANSLATION_CONCURRENCY) as executor:
+        for batch_translations in executor.map(_translate_batch, batches):
+            translations.update(batch_translations)
+    
+    return translations
+
+
+def _make_translation_batches(titles):
+    """Split titles into batches bounded by TRANSLATION_BATCH_SIZE and TRANSLATION_MAX_BATCH_CHARS"""
+    batches = []
+    batch = []
+    batch_chars = 0
+    
+    for title in titles:
+        if '\n' in title:
+            # Multi-line titles would break the line-based batch format
+            batches.append([title])
+            continue
+        
+        if batch and (len(batch) >= TRANSLATION_BATCH_SIZE or
+                      batch_chars + len(title) + 1 > TRANSLATION_MAX_BATCH_CHARS):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        
+        batch.append(title)
+        batch_chars += len(title) + 1
+    
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _translate_batch(batch):
+    """
+    Translate a batch of uncached titles in a single request
+    
+    Falls back to one request per title if the batch fails or the
+    translated text doesn't split back into the same number of lines.
+    """
+    if len(batch) > 1:
+        try:
+            translated = translator.translate('\n'.join(batch))
+            lines = translated.split('\n') if translated else []
+            
+            if len(lines) == len(batch):
+                results = {}
+                for title, line in zip(batch, lines):
+                    results[title] = line.strip() or title
+                    if line.strip():
+                        translation_cache.put(title, results[title], TRANSLATE_FROM, TRANSLATE_TO)
+                return results
+            
+            logger.warning(f"Batch translation returned {len(lines)} lines for {len(batch)} titles, translating one by one")
+        except Exception as e:
+            logger.warning(f"Batch translation failed, translating one by one: {e}")
+    
+    return {title: _translate_uncached(title) for title in batch}
+
+
+def _translate_articles(articles):
+    """
+    Translate the titles of new articles in place
+    
+    Args:
+        articles: Article dicts; 'title' becomes English and the original
+            is kept in 'original_title'
+    """
+    if not articles:
+        return
+    
+    # Callers set 'source' before translating, all articles share it
+    with metrics.get_metrics().timer(articles[0].get('source', 'unknown'), 'translate') as timer:
+        timer.articles = len(articles)
+        translations = translate_titles([article['title'] for article in articles])
+    # Write the cache hits' last-used times once per pass instead of per lookup
+    translation_cache.flush()
+    for article in articles:
+        original_title = article['title']
+        article['title'] = translations.get(original_title, original_title)
+        article['original_title'] = original_title
+
+
+def _push_new_articles(source, new_articles):
+    """
+    Send a source's newly saved articles to the UI without waiting for the
+    other sources, so they show up as soon as they are stored
+    
+    Args:
+        source: Source identifier
+        new_articles: Articles just saved (titles already translated)
+    """
+    if not new_articles:
+        return
+    try:
+        eel.articles_added(source, new_articles)
+    except Exception as e:
+        logger.warning(f"Could not send new {source} articles to the UI: {e}")
+
+
+def _collect_new_articles(scraper, articles, source):
+    """
+    Filter parsed articles down to those not yet stored
+    
+    Args:
+        scraper: Scraper instance used for duplicate checks
+        articles: Articles parsed from a listing page
+        source: Source identifier stored on each new article
+        
+    Returns:
+        List of new articles (URLs are marked as seen on the scraper)
+    """
+    new_articles = []
+    for article in articles:
+        if not scraper._is_duplicate(article['url']):
+            article['source'] = source
+            scraper.article_urls.add(article['url'])
+            new_articles.append(article)
+    return new_articles
 
 
 @eel.expose
@@ -97,28 +402,15 @@ def get_initial_state():
     Get initial application state
     Returns info about existing articles and triggers auto-check for new ones
     """
-    data_file = FASTIGHETSVARLDEN_DATA_FILE
-    
-    if not data_file.exists():
-        # First run - no data exists
-        return {
-            'needs_scraping': True,
-            'article_count': 0,
-            'last_scrape': None
-        }
-    
-    # Load existing data
     try:
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        article_count = data.get('total_articles', 0)
-        last_scrape = data.get('last_incremental_scrape') or data.get('last_full_scrape')
+        store = get_store()
+        article_count = store.count_articles()
         
         return {
-            'needs_scraping': True,  # Always check for new articles on startup
+            # Check for new articles on startup unless the headless scheduler keeps the store fresh
+            'needs_scraping': not is_scheduler_active(),
             'article_count': article_count,
-            'last_scrape': last_scrape
+            'last_scrape': _get_last_scrape("all") if article_count else None
         }
     except Exception as e:
         logger.error(f"Error loading data: {e}")
@@ -141,6 +433,10 @@ def start_scraping():
     progress.message = "Checking for latest news..."
     scraping_in_progress = True
     
+    # A new run starts from a full state on the UI side
+    progress_publisher.reset()
+    _publish_progress(force=True)
+    
     # Start scraping in a separate thread
     scraping_thread = threading.Thread(target=_scrape_worker)
     scraping_thread.daemon = True
@@ -159,11 +455,13 @@ def stop_scraping():
         progress.status = "stopped"
         progress.message = "Scraping stopped by user"
         logger.info("Scraping stopped by user")
+        _publish_progress(force=True)
         return {'success': True, 'message': 'Scraping stopped'}
     
     return {'success': False, 'message': 'No scraping in progress'}
 
 
+@profiled()
 def _scrape_worker():
     """Worker function for scraping (runs in separate thread)"""
     global scraping_in_progress, progress
@@ -172,76 +470,33 @@ def _scrape_worker():
         logger.info("Checking for latest news articles from all sources")
         progress.status = "checking"
         progress.sources_completed = []
-        progress.total_pages = 6  # 6 sources to check
+        progress.sources_in_progress = []
+        progress.source_status = {name: "pending" for name, _ in SCRAPE_SOURCES}
+        progress.total_pages = len(SCRAPE_SOURCES)  # One step per source
         progress.current_page = 0
-        
-        total_new_articles = 0
-        
-        # Scrape Fastighetsvarlden (Site 1)
-        progress.current_source = "Fastighetsvarlden"
-        progress.current_page = 1
-        progress.message = "Checking Fastighetsvarlden for new articles..."
-        eel.update_scraping_progress(progress.__dict__)()
-        
-        new_count_1 = _run_fastighetsvarlden_scrape()
-        total_new_articles += new_count_1
-        progress.sources_completed.append("Fastighetsvarlden")
-        
-        # Scrape Cision (Site 2)
-        progress.current_source = "Cision"
-        progress.current_page = 2
-        progress.message = "Checking Cision for new articles..."
-        eel.update_scraping_progress(progress.__dict__)()
-        
-        new_count_2 = _run_cision_scrape()
-        total_new_articles += new_count_2
-        progress.sources_completed.append("Cision")
-        
-        # Scrape Lokalguiden (Site 3)
-        progress.current_source = "Lokalguiden"
-        progress.current_page = 3
-        progress.message = "Checking Lokalguiden for new articles..."
-        eel.update_scraping_progress(progress.__dict__)()
-        
-        new_count_3 = _run_lokalguiden_scrape()
-        total_new_articles += new_count_3
-        progress.sources_completed.append("Lokalguiden")
-        
-        # Scrape DI (Site 4)
-        progress.current_source = "DI"
-        progress.current_page = 4
-        progress.message = "Checking DI for new articles..."
-        eel.update_scraping_progress(progress.__dict__)()
-        
-        new_count_4 = _run_di_scrape()
-        total_new_articles += new_count_4
-        progress.sources_completed.append("DI")
-        
-        # Scrape Fastighetsnytt (Site 5)
-        progress.current_source = "Fastighetsnytt"
-        progress.current_page = 5
-        progress.message = "Checking Fastighetsnytt for new articles..."
-        eel.update_scraping_progress(progress.__dict__)()
-        
-        new_count_5 = _run_fastighetsnytt_scrape()
-        total_new_articles += new_count_5
-        progress.sources_completed.append("Fastighetsnytt")
-        
-        # Scrape Nordic Property News (Site 6)
-        progress.current_source = "Nordic Property News"
-        progress.current_page = 6
-        progress.message = "Checking Nordic Property News for new articles..."
-        eel.update_scraping_progress(progress.__dict__)()
-        
-        new_count_6 = _run_nordicpropertynews_scrape()
-        total_new_articles += new_count_6
-        progress.sources_completed.append("Nordic Property News")
+        progress.articles_scraped = 0
+        
+        if PARALLEL_SCRAPING:
+            # Check all sources at the same time, wall time is close to the slowest source
+            with ThreadPoolExecutor(max_workers=SCRAPE_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(_run_source_scrape, name, scrape_func)
+                    for name, scrape_func in SCRAPE_SOURCES
+                ]
+                total_new_articles = sum(future.result() for future in futures)
+        else:
+            total_new_articles = sum(
+                _run_source_scrape(name, scrape_func)
+                for name, scrape_func in SCRAPE_SOURCES
+            )
         
         # Complete
-        progress.status = "completed"
-        progress.articles_scraped = total_new_articles
-        progress.message = f"Check completed! Found {total_new_articles} new articles"
-        eel.update_scraping_progress(progress.__dict__)()
+        with progress_lock:
+            progress.status = "completed"
+            progress.current_source = ""
+            progress.articles_scraped = total_new_articles
+            progress.message = f"Check completed! Found {total_new_articles} new articles"
+        _publish_progress(force=True)
         
         # Notify frontend that scraping is done
         eel.scraping_completed()()
@@ -250,329 +505,507 @@ def _scrape_worker():
         logger.error(f"Scraping error: {e}", exc_info=True)
         progress.status = "error"
         progress.message = f"Error: {str(e)}"
-        eel.update_scraping_progress(progress.__dict__)()
+        _publish_progress(force=True)
     
     finally:
         scraping_in_progress = False
+        metrics.get_metrics().write_summary()
+        cache_stats = translation_cache.stats()
+        logger.info(f"Translation cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                    f"({cache_stats['hit_rate']:.0%}), {cache_stats['size']} entries")
 
 
-def _run_full_scrape():
-    """Run a full scrape of all pages"""
-    global progress, scraper
+def _run_source_scrape(name, scrape_func):
+    """
+    Run a single source scrape and record its progress
     
-    # Check if we should resume from a previous page
-    start_page = scraper.articles_data.get('last_page_scraped', 0) + 1
-    if start_page > 1:
-        logger.info(f"Resuming scrape from page {start_page}")
+    Failures are isolated so one broken source never stops the others.
     
-    # Get first page to determine total pages
-    first_page_html = scraper._fetch_page(1)
-    if not first_page_html:
-        raise Exception("Failed to fetch first page")
+    Args:
+        name: Display name of the source
+        scrape_func: One of the _run_*_scrape functions (they raise when
+            the source can't be fetched or scraped)
+        
+    Returns:
+        Number of new articles found (0 on failure)
+    """
+    if not scraping_in_progress:
+        return 0
     
-    max_page = scraper._get_max_page_number(first_page_html)
-    progress.total_pages = max_page
-    scraper.articles_data['total_pages'] = max_page
+    with progress_lock:
+        progress.source_status[name] = "checking"
+        progress.sources_in_progress.append(name)
+        progress.current_source = ", ".join(progress.sources_in_progress)
+        progress.message = f"Checking {progress.current_source} for new articles..."
+    _publish_progress()
     
-    logger.info("=" * 70)
-    if start_page == 1:
-        logger.info(f"STARTING FULL SCRAPE: {max_page} PAGES")
-    else:
-        logger.info(f"RESUMING SCRAPE: Pages {start_page}-{max_page} (Total: {max_page})")
-    logger.info("=" * 70)
+    status = "completed"
+    with metrics.get_metrics().timer(SOURCE_IDS.get(name, name), 'total') as timer:
+        try:
+            new_count = scrape_func()
+        except Exception as e:
+            logger.error(f"Error scraping {name}: {e}", exc_info=True)
+            new_count = 0
+            status = "error"
+        timer.articles = new_count
     
-    # Process pages from start_page to max_page
-    for page_num in range(start_page, max_page + 1):
-        if not scraping_in_progress:
-            logger.warning("Scraping interrupted by user")
-            break
-        
-        progress.current_page = page_num
-        progress.message = f"Scraping page {page_num} of {max_page}..."
-        eel.update_scraping_progress(progress.__dict__)()
-        
-        # Fetch page
-        if page_num == 1 and start_page == 1:
-            html = first_page_html
+    with progress_lock:
+        progress.source_status[name] = status
+        progress.sources_in_progress.remove(name)
+        progress.sources_completed.append(name)
+        progress.current_page = len(progress.sources_completed)
+        progress.articles_scraped += new_count
+        progress.current_source = ", ".join(progress.sources_in_progress)
+        if progress.sources_in_progress:
+            progress.message = f"Checking {progress.current_source} for new articles..."
         else:
-            html = scraper._fetch_page(page_num)
-        
-        if not html:
-            logger.warning(f"Failed to fetch page {page_num}, skipping...")
-            continue
-        
-        # Parse articles
-        articles = scraper._parse_page(html)
-        new_count = 0
-        
-        for article in articles:
-            if not scraper._is_duplicate(article['url']):
-                # Translate title to English
-                original_title = article['title']
-                translated_title = translate_title(original_title)
-                
-                # Store both original and translated
-                article['title'] = translated_title
-                article['original_title'] = original_title
-                
-                scraper.articles_data['articles'].append(article)
-                scraper.article_urls.add(article['url'])
-                new_count += 1
-        
-        progress.articles_scraped = len(scraper.articles_data['articles'])
-        
-        # Update last page scraped
-        scraper.articles_data['last_page_scraped'] = page_num
+            progress.message = f"Finished checking {name}"
+    _publish_progress()
+    
+    return new_count
+
+
+@eel.expose
+def start_full_scrape():
+    """Start a full Fastighetsvarlden archive scrape (resumes where the last one stopped)"""
+    global scraping_in_progress, scraping_thread, progress
+    
+    if scraping_in_progress:
+        return {'success': False, 'message': 'Scraping already in progress'}
+    
+    progress.status = "starting"
+    progress.message = "Starting full archive scrape..."
+    scraping_in_progress = True
+    
+    progress_publisher.reset()
+    _publish_progress(force=True)
+    
+    scraping_thread = threading.Thread(target=_full_scrape_worker)
+    scraping_thread.daemon = True
+    scraping_thread.start()
+    
+    return {'success': True, 'message': 'Scraping the full archive...'}
+
+
+def _full_scrape_worker():
+    """Worker function for the full archive scrape (runs in separate thread)"""
+    global scraping_in_progress, progress
+    
+    try:
+        with progress_lock:
+            progress.status = "scraping"
+            progress.current_source = "Fastighetsvarlden"
+            progress.sources_completed = []
+            progress.sources_in_progress = []
+            progress.source_status = {}
+            progress.current_page = 0
+            progress.articles_scraped = 0
+        _publish_progress()
+        
+        status = _run_full_scrape()
+        
+        with progress_lock:
+            progress.status = "completed" if scraping_in_progress else "stopped"
+            progress.current_source = ""
+            progress.message = (f"Full scrape: {status['completed_pages']} of {status['total_pages']} pages done, "
+                                f"{status['new_articles']} new articles")
+        _publish_progress(force=True)
         
-        logger.info(f"Page {page_num}/{max_page}: Found {len(articles)} articles, {new_count} new (Total: {progress.articles_scraped})")
+        eel.scraping_completed()()
         
-        # Save progress every 10 pages
-        if page_num % 10 == 0:
-            scraper._save_data()
-            logger.info(f"[SAVED] Progress saved at page {page_num}: {progress.articles_scraped} articles")
+    except Exception as e:
+        logger.error(f"Full scrape error: {e}", exc_info=True)
+        progress.status = "error"
+        progress.message = f"Error: {str(e)}"
+        _publish_progress(force=True)
     
-    # Final save
-    scraper.articles_data['last_full_scrape'] = datetime.now().isoformat()
-    scraper._save_data()
+    finally:
+        scraping_in_progress = False
+        # The app keeps running, don't leave the parse processes idle in the background
+        shutdown_parse_pool()
+
+
+@profiled()
+def _run_full_scrape():
+    """
+    Run a full scrape of all Fastighetsvarlden archive pages
+    
+    Returns:
+        Final progress dict of the backfill
+    """
+    global progress
+    
+    scraper = FastighetsVarldenScraper()
+    
+    def on_new_articles(new_articles):
+        for article in new_articles:
+            article['source'] = 'fastighetsvarlden'
+        # Translate all new titles on this page in batches
+        _translate_articles(new_articles)
+    
+    def on_progress(status):
+        with progress_lock:
+            progress.total_pages = status['total_pages']
+            progress.current_page = status['completed_pages']
+            progress.articles_scraped = len(scraper.article_urls)
+            progress.pages_per_min = status['pages_per_min']
+            progress.message = (f"Scraped {status['completed_pages']} of {status['total_pages']} pages "
+                                f"({status['pages_per_min']} pages/min, {status['failed_pages']} to retry)")
+        _publish_progress()
+    
+    backfill = ArchiveBackfill(
+        scraper,
+        on_new_articles=on_new_articles,
+        on_progress=on_progress,
+        should_continue=lambda: scraping_in_progress
+    )
+    
+    logger.info("=" * 70)
+    logger.info("STARTING FULL SCRAPE (resuming from saved page bitmap)")
     logger.info("=" * 70)
-    logger.info("[SUCCESS] FULL SCRAPE COMPLETED!")
-    logger.info(f"Total pages scraped: {max_page}")
-    logger.info(f"Total articles: {progress.articles_scraped}")
+    
+    status = backfill.run()
+    if not scraping_in_progress:
+        logger.warning("Scraping interrupted by user")
+    
+    logger.info("=" * 70)
+    if status['remaining_pages'] == 0:
+        logger.info("[SUCCESS] FULL SCRAPE COMPLETED!")
+    else:
+        logger.info(f"[PARTIAL] {status['remaining_pages']} pages left, {status['failed_pages']} queued for retry")
+    logger.info(f"Pages scraped this run: {status['pages_this_run']} ({status['pages_per_min']} pages/min)")
+    logger.info(f"Total articles: {len(scraper.article_urls)}")
     logger.info("=" * 70)
+    metrics.get_metrics().write_summary()
+    return status
+
+
+def _store_prefetched(source, scraper, articles):
+    """Keep a parsed listing from check_for_new_articles for the next scrape"""
+    with prefetch_lock:
+        prefetched_listings[source] = (time.time(), scraper, articles)
+
+
+def _take_prefetched(source):
+    """
+    Take a prefetched listing if it is still fresh (each listing is used once)
+    
+    Returns:
+        (scraper, articles) or None
+    """
+    with prefetch_lock:
+        entry = prefetched_listings.pop(source, None)
+    
+    if entry and time.time() - entry[0] <= PREFETCH_TTL:
+        return entry[1], entry[2]
+    return None
+
+
+def _load_listing(source, scraper_class, *fetch_args):
+    """
+    Get a scraper and the parsed articles of its first listing page
+    
+    Uses the result of a recent check_for_new_articles call when there
+    is one, so the page isn't downloaded and parsed twice.
+    
+    Args:
+        source: Source identifier
+        scraper_class: Scraper class for the source
+        fetch_args: Arguments for the scraper's _fetch_page
+        
+    Returns:
+        (scraper, articles) where articles is UNCHANGED if the listing
+        hasn't changed, or None if the page could not be fetched
+    """
+    prefetched = _take_prefetched(source)
+    if prefetched:
+        logger.info(f"Using {source} listing fetched by the last check")
+        return prefetched
+    
+    scraper = scraper_class()
+    html = scraper._fetch_page(*fetch_args)
+    if html is UNCHANGED:
+        return scraper, UNCHANGED
+    if not html:
+        return scraper, None
+    return scraper, scraper._parse_page(html)
 
 
 def _run_fastighetsvarlden_scrape():
     """Scrape Fastighetsvarlden (Site 1) - page 1 only"""
     global progress
     
-    try:
-        scraper = FastighetsVarldenScraper()
-        new_articles_count = 0
-        
-        html = scraper._fetch_page(1)
-        if not html:
-            logger.warning("Failed to fetch Fastighetsvarlden page 1")
-            return 0
-        
-        articles = scraper._parse_page(html)
-        logger.info(f"Found {len(articles)} articles on Fastighetsvarlden page 1")
-        
-        for article in articles:
-            if not scraper._is_duplicate(article['url']):
-                # Translate title to English
-                original_title = article['title']
-                translated_title = translate_title(original_title)
-                
-                # Store both original and translated
-                article['title'] = translated_title
-                article['original_title'] = original_title
-                article['source'] = 'fastighetsvarlden'
-                
-                scraper.articles_data['articles'].append(article)
-                scraper.article_urls.add(article['url'])
-                new_articles_count += 1
-                logger.info(f"New Fastighetsvarlden article: {translated_title}")
-        
+    # Reuse the listing parsed by check_for_new_articles if it's still fresh
+    scraper, articles = _load_listing('fastighetsvarlden', FastighetsVarldenScraper, 1)
+    if articles is UNCHANGED:
+        logger.info("Fastighetsvarlden: no new articles (listing unchanged)")
         scraper.articles_data['last_incremental_scrape'] = datetime.now().isoformat()
         scraper._save_data()
-        
-        logger.info(f"Fastighetsvarlden: {new_articles_count} new articles")
-        return new_articles_count
-        
-    except Exception as e:
-        logger.error(f"Error scraping Fastighetsvarlden: {e}")
         return 0
+    if articles is None:
+        raise Exception("Failed to fetch Fastighetsvarlden page 1")
+    
+    logger.info(f"Found {len(articles)} articles on Fastighetsvarlden page 1")
+    
+    # Read further archive pages until the last run's newest article
+    articles = page_until_watermark(scraper, articles, lambda page_num: scraper._fetch_page(page_num, False))
+    new_articles = _collect_new_articles(scraper, articles, 'fastighetsvarlden')
+    
+    # Translate all new titles in batches, storing both original and translated
+    _translate_articles(new_articles)
+    for article in new_articles:
+        logger.info(f"New Fastighetsvarlden article: {article['title']}")
+    
+    scraper.articles_data['articles'].extend(new_articles)
+    new_articles_count = len(new_articles)
+    
+    scraper.articles_data['last_incremental_scrape'] = datetime.now().isoformat()
+    scraper._save_data()
+    _push_new_articles('fastighetsvarlden', new_articles)
+    
+    logger.info(f"Fastighetsvarlden: {new_articles_count} new articles")
+    return new_articles_count
 
 
 def _run_cision_scrape():
     """Scrape Cision (Site 2) - page 1 only"""
     global progress
     
-    try:
-        scraper = CisionScraper()
-        new_articles_count = scraper.scrape_latest()
-        
-        logger.info(f"Cision: {new_articles_count} new articles")
-        return new_articles_count
-        
-    except Exception as e:
-        logger.error(f"Error scraping Cision: {e}")
+    # Reuse the listing parsed by check_for_new_articles if it's still fresh
+    scraper, articles = _load_listing('cision', CisionScraper)
+    if articles is UNCHANGED:
+        logger.info("Cision: no new articles (listing unchanged)")
+        scraper.articles_data['last_scrape'] = datetime.now().isoformat()
+        scraper._save_data()
         return 0
+    if articles is None:
+        raise Exception("Failed to fetch Cision page")
+    
+    # Read further listing pages until the last run's newest article
+    articles = page_until_watermark(scraper, articles, lambda page_num: scraper._fetch_page(page_num, False))
+    
+    # No translation needed - already in English
+    new_articles = _collect_new_articles(scraper, articles, 'cision')
+    for article in new_articles:
+        logger.info(f"New Cision article: {article['title']}")
+    
+    scraper.articles_data['articles'].extend(new_articles)
+    new_articles_count = len(new_articles)
+    
+    scraper.articles_data['last_scrape'] = datetime.now().isoformat()
+    scraper._save_data()
+    _push_new_articles('cision', new_articles)
+    
+    logger.info(f"Cision: {new_articles_count} new articles")
+    return new_articles_count
 
 
 def _run_lokalguiden_scrape():
     """Scrape Lokalguiden (Site 3) - page 1 only"""
     global progress
     
-    try:
-        scraper = LokalguidenScraper()
-        
-        # Scrape without translation first
-        html = scraper._fetch_page()
-        if not html:
-            logger.warning("Failed to fetch Lokalguiden page")
-            return 0
-        
-        articles = scraper._parse_page(html)
-        new_articles_count = 0
-        
-        for article in articles:
-            if not scraper._is_duplicate(article['url']):
-                # Translate title to English
-                original_title = article['title']
-                translated_title = translate_title(original_title)
-                
-                # Store both original and translated
-                article['title'] = translated_title
-                article['original_title'] = original_title
-                article['source'] = 'lokalguiden'
-                
-                scraper.articles_data['articles'].append(article)
-                scraper.article_urls.add(article['url'])
-                new_articles_count += 1
-                logger.info(f"New Lokalguiden article: {translated_title}")
-        
+    # Reuse the listing parsed by check_for_new_articles if it's still fresh
+    scraper, articles = _load_listing('lokalguiden', LokalguidenScraper)
+    if articles is UNCHANGED:
+        logger.info("Lokalguiden: no new articles (listing unchanged)")
         scraper.articles_data['last_scrape'] = datetime.now().isoformat()
         scraper._save_data()
-        
-        logger.info(f"Lokalguiden: {new_articles_count} new articles")
-        return new_articles_count
-        
-    except Exception as e:
-        logger.error(f"Error scraping Lokalguiden: {e}")
         return 0
+    if articles is None:
+        raise Exception("Failed to fetch Lokalguiden page")
+    
+    # Read further listing pages until the last run's newest article
+    articles = page_until_watermark(scraper, articles, lambda page_num: scraper._fetch_page(page_num, False))
+    new_articles = _collect_new_articles(scraper, articles, 'lokalguiden')
+    
+    # Translate all new titles in batches, storing both original and translated
+    _translate_articles(new_articles)
+    for article in new_articles:
+        logger.info(f"New Lokalguiden article: {article['title']}")
+    
+    scraper.articles_data['articles'].extend(new_articles)
+    new_articles_count = len(new_articles)
+    
+    scraper.articles_data['last_scrape'] = datetime.now().isoformat()
+    scraper._save_data()
+    _push_new_articles('lokalguiden', new_articles)
+    
+    logger.info(f"Lokalguiden: {new_articles_count} new articles")
+    return new_articles_count
 
 
 def _run_di_scrape():
     """Scrape DI (Site 4) - page 1 only"""
     global progress
     
-    try:
-        scraper = DIScraper()
-        
-        # Scrape without translation first
-        html = scraper._fetch_page()
-        if not html:
-            logger.warning("Failed to fetch DI page")
-            return 0
-        
-        articles = scraper._parse_page(html)
-        new_articles_count = 0
-        
-        for article in articles:
-            if not scraper._is_duplicate(article['url']):
-                # Translate title to English
-                original_title = article['title']
-                translated_title = translate_title(original_title)
-                
-                # Store both original and translated
-                article['title'] = translated_title
-                article['original_title'] = original_title
-                article['source'] = 'di'
-                
-                scraper.articles_data['articles'].append(article)
-                scraper.article_urls.add(article['url'])
-                new_articles_count += 1
-                logger.info(f"New DI article: {translated_title}")
-        
+    # Reuse the listing parsed by check_for_new_articles if it's still fresh
+    scraper, articles = _load_listing('di', DIScraper)
+    if articles is UNCHANGED:
+        logger.info("DI: no new articles (listing unchanged)")
         scraper.articles_data['last_scrape'] = datetime.now().isoformat()
         scraper._save_data()
-        
-        logger.info(f"DI: {new_articles_count} new articles")
-        return new_articles_count
-        
-    except Exception as e:
-        logger.error(f"Error scraping DI: {e}")
         return 0
+    if articles is None:
+        raise Exception("Failed to fetch DI page")
+    
+    # Read further listing pages until the last run's newest article
+    articles = page_until_watermark(scraper, articles, lambda page_num: scraper._fetch_page(page_num, False))
+    new_articles = _collect_new_articles(scraper, articles, 'di')
+    
+    # Translate all new titles in batches, storing both original and translated
+    _translate_articles(new_articles)
+    for article in new_articles:
+        logger.info(f"New DI article: {article['title']}")
+    
+    scraper.articles_data['articles'].extend(new_articles)
+    new_articles_count = len(new_articles)
+    
+    scraper.articles_data['last_scrape'] = datetime.now().isoformat()
+    scraper._save_data()
+    _push_new_articles('di', new_articles)
+    
+    logger.info(f"DI: {new_articles_count} new articles")
+    return new_articles_count
 
 
 def _run_fastighetsnytt_scrape():
     """Scrape Fastighetsnytt (Site 5) - homepage only"""
     global progress
     
-    try:
-        scraper = FastighetsnyttScraper()
-        
-        # Scrape homepage (parses __NEXT_DATA__ JSON)
-        html = scraper._fetch_page()
-        if not html:
-            logger.warning("Failed to fetch Fastighetsnytt homepage")
-            return 0
-        
-        articles = scraper._parse_page(html)
-        new_articles_count = 0
-        
-        for article in articles:
-            if not scraper._is_duplicate(article['url']):
-                # Translate title to English
-                original_title = article['title']
-                translated_title = translate_title(original_title)
-                
-                # Store both original and translated
-                article['title'] = translated_title
-                article['original_title'] = original_title
-                article['source'] = 'fastighetsnytt'
-                
-                scraper.articles_data['articles'].append(article)
-                scraper.article_urls.add(article['url'])
-                new_articles_count += 1
-                logger.info(f"New Fastighetsnytt article: {translated_title}")
-        
+    # Reuse the listing parsed by check_for_new_articles if it's still fresh
+    scraper, articles = _load_listing('fastighetsnytt', FastighetsnyttScraper)
+    if articles is UNCHANGED:
+        logger.info("Fastighetsnytt: no new articles (listing unchanged)")
         scraper.articles_data['last_scrape'] = datetime.now().isoformat()
         scraper._save_data()
-        
-        logger.info(f"Fastighetsnytt: {new_articles_count} new articles")
-        return new_articles_count
-        
-    except Exception as e:
-        logger.error(f"Error scraping Fastighetsnytt: {e}")
         return 0
+    if articles is None:
+        raise Exception("Failed to fetch Fastighetsnytt homepage")
+    
+    # Single listing page: records the watermark and warns about possible gaps
+    articles = page_until_watermark(scraper, articles)
+    new_articles = _collect_new_articles(scraper, articles, 'fastighetsnytt')
+    
+    # Translate all new titles in batches, storing both original and translated
+    _translate_articles(new_articles)
+    for article in new_articles:
+        logger.info(f"New Fastighetsnytt article: {article['title']}")
+    
+    scraper.articles_data['articles'].extend(new_articles)
+    new_articles_count = len(new_articles)
+    
+    scraper.articles_data['last_scrape'] = datetime.now().isoformat()
+    scraper._save_data()
+    _push_new_articles('fastighetsnytt', new_articles)
+    
+    logger.info(f"Fastighetsnytt: {new_articles_count} new articles")
+    return new_articles_count
 
 
 def _run_nordicpropertynews_scrape():
     """Scrape Nordic Property News (Site 6) - page 1 only"""
     global progress
     
-    try:
-        scraper = NordicPropertyNewsScraper()
-        
-        # Scrape page 1 (no translation needed, already in English)
-        html = scraper._fetch_page()
-        if not html:
-            logger.warning("Failed to fetch Nordic Property News page")
-            return 0
-        
-        articles = scraper._parse_page(html)
-        new_articles_count = 0
-        
-        for article in articles:
-            if not scraper._is_duplicate(article['url']):
-                # No translation needed - already in English
-                article['source'] = 'nordicpropertynews'
-                
-                scraper.articles_data['articles'].append(article)
-                scraper.article_urls.add(article['url'])
-                new_articles_count += 1
-                logger.info(f"New Nordic Property News article: {article['title']}")
-        
+    # Reuse the listing parsed by check_for_new_articles if it's still fresh
+    scraper, articles = _load_listing('nordicpropertynews', NordicPropertyNewsScraper)
+    if articles is UNCHANGED:
+        logger.info("Nordic Property News: no new articles (listing unchanged)")
         scraper.articles_data['last_scrape'] = datetime.now().isoformat()
         scraper._save_data()
-        
-        logger.info(f"Nordic Property News: {new_articles_count} new articles")
-        return new_articles_count
-        
-    except Exception as e:
-        logger.error(f"Error scraping Nordic Property News: {e}")
         return 0
+    if articles is None:
+        raise Exception("Failed to fetch Nordic Property News page")
+    
+    # Single listing page: records the watermark and warns about possible gaps
+    articles = page_until_watermark(scraper, articles)
+    
+    # No translation needed - already in English
+    new_articles = _collect_new_articles(scraper, articles, 'nordicpropertynews')
+    for article in new_articles:
+        logger.info(f"New Nordic Property News article: {article['title']}")
+    
+    scraper.articles_data['articles'].extend(new_articles)
+    new_articles_count = len(new_articles)
+    
+    scraper.articles_data['last_scrape'] = datetime.now().isoformat()
+    scraper._save_data()
+    _push_new_articles('nordicpropertynews', new_articles)
+    
+    logger.info(f"Nordic Property News: {new_articles_count} new articles")
+    return new_articles_count
+
+
+# Listing pages checked by check_for_new_articles: (source, name, scraper class, _fetch_page args)
+CHECK_SOURCES = [
+    ('fastighetsvarlden', "Fastighetsvarlden", FastighetsVarldenScraper, (1,)),
+    ('cision', "Cision", CisionScraper, ()),
+    ('lokalguiden', "Lokalguiden", LokalguidenScraper, ()),
+    ('di', "DI", DIScraper, ()),
+    ('fastighetsnytt', "Fastighetsnytt", FastighetsnyttScraper, ()),
+    ('nordicpropertynews', "Nordic Property News", NordicPropertyNewsScraper, ()),
+]
+
+# Display name -> source identifier, used to label metrics
+SOURCE_IDS = {name: source for source, name, _, _ in CHECK_SOURCES}
+
+# Sources checked by _scrape_worker, in display order
+SCRAPE_SOURCES = [
+    ("Fastighetsvarlden", _run_fastighetsvarlden_scrape),
+    ("Cision", _run_cision_scrape),
+    ("Lokalguiden", _run_lokalguiden_scrape),
+    ("DI", _run_di_scrape),
+    ("Fastighetsnytt", _run_fastighetsnytt_scrape),
+    ("Nordic Property News", _run_nordicpropertynews_scrape),
+]
+
+
+@eel.expose
+def get_metrics():
+    """
+    Get the stage timings of this session
+    
+    Returns:
+        Dict with per-source, per-stage p50/p95/max (ms), bytes transferred
+        and articles/sec (also written to METRICS_FILE after each scrape),
+        plus the translation cache's hit/miss counters
+    """
+    summary = metrics.get_metrics().summary()
+    summary['translation_cache'] = translation_cache.stats()
+    return summary
 
 
 @eel.expose
 def get_scraping_progress():
     """Get current scraping progress"""
-    return progress.__dict__
+    return _progress_snapshot()
+
+
+def _get_last_scrape(source="all"):
+    """
+    Get the most recent scrape time for a source (or all sources)
+    
+    Args:
+        source: Source identifier or "all"
+        
+    Returns:
+        ISO timestamp string or None
+    """
+    store = get_store()
+    sources = LEGACY_DATA_FILES.keys() if source == "all" else [source]
+    last_scrape = None
+    
+    for source_name in sources:
+        meta = store.get_source_meta(source_name)
+        scrape_time = (meta.get('last_scrape') or meta.get('last_incremental_scrape')
+                       or meta.get('last_full_scrape'))
+        if scrape_time and (not last_scrape or scrape_time > last_scrape):
+            last_scrape = scrape_time
+    
+    return last_scrape
 
 
 @eel.expose
+@profiled()
 def get_articles(source="all", search_query="", page=1, per_page=20):
     """
     Get articles for display
@@ -584,129 +1017,23 @@ def get_articles(source="all", search_query="", page=1, per_page=20):
         per_page: Articles per page
     """
     try:
-        articles = []
-        last_scrape = None
-        
-        # Load articles from Fastighetsvarlden
-        if source in ["fastighetsvarlden", "all"]:
-            fv_file = FASTIGHETSVARLDEN_DATA_FILE
-            if fv_file.exists():
-                with open(fv_file, 'r', encoding='utf-8') as f:
-                    fv_data = json.load(f)
-                    fv_articles = fv_data.get('articles', [])
-                    # Ensure source field is set
-                    for article in fv_articles:
-                        if 'source' not in article:
-                            article['source'] = 'fastighetsvarlden'
-                    articles.extend(fv_articles)
-                    last_scrape = fv_data.get('last_incremental_scrape') or fv_data.get('last_full_scrape')
-        
-        # Load articles from Cision
-        if source in ["cision", "all"]:
-            cision_file = CISION_DATA_FILE
-            if cision_file.exists():
-                with open(cision_file, 'r', encoding='utf-8') as f:
-                    cision_data = json.load(f)
-                    cision_articles = cision_data.get('articles', [])
-                    # Ensure source field is set
-                    for article in cision_articles:
-                        if 'source' not in article:
-                            article['source'] = 'cision'
-                    articles.extend(cision_articles)
-                    cision_scrape = cision_data.get('last_scrape')
-                    if cision_scrape:
-                        if not last_scrape or cision_scrape > last_scrape:
-                            last_scrape = cision_scrape
-        
-        # Load articles from Lokalguiden
-        if source in ["lokalguiden", "all"]:
-            lg_file = LOKALGUIDEN_DATA_FILE
-            if lg_file.exists():
-                with open(lg_file, 'r', encoding='utf-8') as f:
-                    lg_data = json.load(f)
-                    lg_articles = lg_data.get('articles', [])
-                    # Ensure source field is set
-                    for article in lg_articles:
-                        if 'source' not in article:
-                            article['source'] = 'lokalguiden'
-                    articles.extend(lg_articles)
-                    lg_scrape = lg_data.get('last_scrape')
-                    if lg_scrape:
-                        if not last_scrape or lg_scrape > last_scrape:
-                            last_scrape = lg_scrape
-        
-        # Load articles from DI
-        if source in ["di", "all"]:
-            di_file = DI_DATA_FILE
-            if di_file.exists():
-                with open(di_file, 'r', encoding='utf-8') as f:
-                    di_data = json.load(f)
-                    di_articles = di_data.get('articles', [])
-                    # Ensure source field is set
-                    for article in di_articles:
-                        if 'source' not in article:
-                            article['source'] = 'di'
-                    articles.extend(di_articles)
-                    di_scrape = di_data.get('last_scrape')
-                    if di_scrape:
-                        if not last_scrape or di_scrape > last_scrape:
-                            last_scrape = di_scrape
-        
-        # Load articles from Fastighetsnytt
-        if source in ["fastighetsnytt", "all"]:
-            fn_file = FASTIGHETSNYTT_DATA_FILE
-            if fn_file.exists():
-                with open(fn_file, 'r', encoding='utf-8') as f:
-                    fn_data = json.load(f)
-                    fn_articles = fn_data.get('articles', [])
-                    # Ensure source field is set
-                    for article in fn_articles:
-                        if 'source' not in article:
-                            article['source'] = 'fastighetsnytt'
-                    articles.extend(fn_articles)
-                    fn_scrape = fn_data.get('last_scrape')
-                    if fn_scrape:
-                        if not last_scrape or fn_scrape > last_scrape:
-                            last_scrape = fn_scrape
-        
-        # Load articles from Nordic Property News
-        if source in ["nordicpropertynews", "all"]:
-            npn_file = NORDICPROPERTYNEWS_DATA_FILE
-            if npn_file.exists():
-                with open(npn_file, 'r', encoding='utf-8') as f:
-                    npn_data = json.load(f)
-                    npn_articles = npn_data.get('articles', [])
-                    # Ensure source field is set
-                    for article in npn_articles:
-                        if 'source' not in article:
-                            article['source'] = 'nordicpropertynews'
-                    articles.extend(npn_articles)
-                    npn_scrape = npn_data.get('last_scrape')
-                    if npn_scrape:
-                        if not last_scrape or npn_scrape > last_scrape:
-                            last_scrape = npn_scrape
+        start_idx = (page - 1) * per_page
         
-        # Filter by search query
         if search_query:
-            query_lower = search_query.lower()
-            articles = [
-                a for a in articles
-                if query_lower in a['title'].lower()
-            ]
-        
-        # Sort by date (newest first)
-        articles = sorted(
-            articles,
-            key=lambda x: x.get('date', '') or '',
-            reverse=True
-        )
+            # Searches go through the store's full-text index
+            page_articles, total = get_store().query_articles(
+                source=source,
+                search_query=search_query,
+                limit=per_page,
+                offset=start_idx
+            )
+        else:
+            # Plain listing and pagination are served from the in-memory cache
+            articles = article_cache.get_articles(source)
+            total = len(articles)
+            page_articles = articles[start_idx:start_idx + per_page]
         
-        # Pagination
-        total = len(articles)
         total_pages = (total + per_page - 1) // per_page if total > 0 else 1
-        start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        page_articles = articles[start_idx:end_idx]
         
         return {
             'success': True,
@@ -714,7 +1041,7 @@ def get_articles(source="all", search_query="", page=1, per_page=20):
             'total': total,
             'page': page,
             'total_pages': total_pages,
-            'last_scrape': last_scrape
+            'last_scrape': _get_last_scrape(source)
         }
     
     except Exception as e:
@@ -729,79 +1056,74 @@ def get_articles(source="all", search_query="", page=1, per_page=20):
         }
 
 
+def _encode_cursor(position):
+    """Encode a (date, url) position as an opaque cursor string"""
+    raw = json.dumps(list(position), ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    """Decode a cursor created by _encode_cursor back into a (date, url) position"""
+    date_norm, url = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    return (str(date_norm), str(url))
+
+
+@eel.expose
+def get_articles_page(source="all", cursor=None, limit=20, search_query=""):
+    """
+    Get the next articles for infinite scroll (keyset pagination)
+    
+    Args:
+        source: Source website or "all"
+        cursor: Opaque cursor returned by the previous call (None for the first page)
+        limit: Number of articles to return
+        search_query: Search filter
+        
+    Returns:
+        Dict with 'articles' and 'next_cursor' (None when there are no more articles)
+    """
+    try:
+        after = _decode_cursor(cursor) if cursor else None
+        
+        # Fetch one extra row to know whether another page exists
+        rows = get_store().query_articles_after(
+            source=source,
+            after=after,
+            limit=limit + 1,
+            search_query=search_query
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        return {
+            'success': True,
+            'articles': [article for article, _ in rows],
+            'next_cursor': _encode_cursor(rows[-1][1]) if has_more else None,
+            'last_scrape': _get_last_scrape(source)
+        }
+    
+    except Exception as e:
+        logger.error(f"Error getting articles page: {e}")
+        return {
+            'success': False,
+            'articles': [],
+            'next_cursor': None,
+            'error': str(e)
+        }
+
+
 @eel.expose
 def check_for_new_articles():
     """
     Check if there are new articles available from all sources
+    
+    The parsed listings are kept for PREFETCH_TTL seconds so the scrape
+    that usually follows doesn't fetch the same pages again.
     """
     try:
-        total_new = 0
-        
-        # Check Fastighetsvarlden
-        try:
-            fv_scraper = FastighetsVarldenScraper()
-            html = fv_scraper._fetch_page(1)
-            if html:
-                articles = fv_scraper._parse_page(html)
-                new_count = sum(1 for a in articles if not fv_scraper._is_duplicate(a['url']))
-                total_new += new_count
-        except Exception as e:
-            logger.warning(f"Error checking Fastighetsvarlden: {e}")
-        
-        # Check Cision
-        try:
-            cision_scraper = CisionScraper()
-            html = cision_scraper._fetch_page()
-            if html:
-                articles = cision_scraper._parse_page(html)
-                new_count = sum(1 for a in articles if not cision_scraper._is_duplicate(a['url']))
-                total_new += new_count
-        except Exception as e:
-            logger.warning(f"Error checking Cision: {e}")
-        
-        # Check Lokalguiden
-        try:
-            lg_scraper = LokalguidenScraper()
-            html = lg_scraper._fetch_page()
-            if html:
-                articles = lg_scraper._parse_page(html)
-                new_count = sum(1 for a in articles if not lg_scraper._is_duplicate(a['url']))
-                total_new += new_count
-        except Exception as e:
-            logger.warning(f"Error checking Lokalguiden: {e}")
-        
-        # Check DI
-        try:
-            di_scraper = DIScraper()
-            html = di_scraper._fetch_page()
-            if html:
-                articles = di_scraper._parse_page(html)
-                new_count = sum(1 for a in articles if not di_scraper._is_duplicate(a['url']))
-                total_new += new_count
-        except Exception as e:
-            logger.warning(f"Error checking DI: {e}")
-        
-        # Check Fastighetsnytt
-        try:
-            fn_scraper = FastighetsnyttScraper()
-            html = fn_scraper._fetch_page()
-            if html:
-                articles = fn_scraper._parse_page(html)
-                new_count = sum(1 for a in articles if not fn_scraper._is_duplicate(a['url']))
-                total_new += new_count
-        except Exception as e:
-            logger.warning(f"Error checking Fastighetsnytt: {e}")
-        
-        # Check Nordic Property News
-        try:
-            npn_scraper = NordicPropertyNewsScraper()
-            html = npn_scraper._fetch_page()
-            if html:
-                articles = npn_scraper._parse_page(html)
-                new_count = sum(1 for a in articles if not npn_scraper._is_duplicate(a['url']))
-                total_new += new_count
-        except Exception as e:
-            logger.warning(f"Error checking Nordic Property News: {e}")
+        with ThreadPoolExecutor(max_workers=SCRAPE_MAX_WORKERS) as executor:
+            new_counts = executor.map(lambda spec: _check_source(*spec), CHECK_SOURCES)
+            total_new = sum(new_counts)
         
         return {
             'has_new': total_new > 0,
@@ -813,6 +1135,30 @@ def check_for_new_articles():
         return {'has_new': False, 'error': str(e)}
 
 
+def _check_source(source, name, scraper_class, fetch_args):
+    """
+    Count the new articles on a source's first listing page
+    
+    Returns:
+        Number of new articles (0 on failure)
+    """
+    try:
+        scraper = scraper_class()
+        html = scraper._fetch_page(*fetch_args)
+        if html is UNCHANGED:
+            _store_prefetched(source, scraper, UNCHANGED)
+            return 0
+        if not html:
+            return 0
+        
+        articles = scraper._parse_page(html)
+        _store_prefetched(source, scraper, articles)
+        return len({a['url'] for a in articles if not scraper._is_duplicate(a['url'])})
+    except Exception as e:
+        logger.warning(f"Error checking {name}: {e}")
+        return 0
+
+
 @eel.expose
 def open_article_link(url):
     """Open article link in default browser"""
@@ -852,11 +1198,24 @@ def open_data_folder(folder_path):
         return {'success': False, 'error': str(e)}
 
 
+def _import_legacy_data():
+    """Import the old per-source JSON files into the article store (runs once per source)"""
+    store = get_store()
+    for source, data_file in LEGACY_DATA_FILES.items():
+        try:
+            store.import_json_file(source, data_file)
+        except Exception as e:
+            logger.error(f"Error importing {data_file}: {e}")
+
+
 def main():
     """Main application entry point"""
     try:
         logger.info("Starting Real Estate News Hub...")
         
+        # Move any existing JSON data into the article store
+        _import_legacy_data()
+        
         # Start the Eel application
         eel.start('index.html', size=(1200, 800), port=8080)
         
@@ -0,0 +1,788 @@
+"""
+Article Store
+SQLite-backed storage shared by all scrapers and the dashboard
+Replaces the per-source JSON files with a single indexed article table
+
+The database runs in write-ahead-log mode: each save appends only the new
+articles to the journal, a background thread compacts the journal into
+the main file, and SQLite replays the journal tail after a crash.
+"""
+
+import sqlite3
+import json
+import re
+import hashlib
+import threading
+import logging
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+from config import (
+    ARTICLE_DB_FILE,
+    DB_CHECKPOINT_INTERVAL,
+    DB_CHECKPOINT_WAL_BYTES,
+    URL_INDEX_COMPACT_ROWS,
+    ensure_data_directory
+)
+
+logger = logging.getLogger(__name__)
+
+# Article keys stored in their own columns, everything else goes to 'extra'
+ARTICLE_COLUMNS = ('url', 'source', 'title', 'original_title', 'date', 'scraped_at')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    original_title TEXT,
+    date TEXT,
+    date_norm TEXT NOT NULL DEFAULT '',
+    scraped_at TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (date_norm DESC, url DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_source_date ON articles (source, date_norm DESC, url DESC);
+DROP INDEX IF EXISTS idx_articles_source_scraped;
+CREATE INDEX IF NOT EXISTS idx_articles_source_article_id ON articles (source, json_extract(extra, '$.article_id'));
+CREATE TABLE IF NOT EXISTS source_meta (
+    source TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS http_cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    fingerprint TEXT
+);
+"""
+
+# Per-source article counts, kept in sync by a trigger
+COUNTS_SCHEMA = """
+CREATE TABLE source_counts (
+    source TEXT PRIMARY KEY,
+    articles INTEGER NOT NULL
+);
+CREATE TRIGGER source_counts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO source_counts (source, articles) VALUES (new.source, 1)
+    ON CONFLICT (source) DO UPDATE SET articles = articles + 1;
+END;
+INSERT INTO source_counts (source, articles)
+SELECT source, COUNT(*) FROM articles GROUP BY source;
+"""
+
+# URL membership index: a sorted array of 64-bit URL hashes per source,
+# stored as one blob, plus a log of the hashes inserted since the blob was
+# written; the log is merged into the blob once it grows (see url_index)
+URL_INDEX_SCHEMA = """
+CREATE TABLE url_index (
+    source TEXT PRIMARY KEY,
+    hashes BLOB NOT NULL,
+    last_log_id INTEGER NOT NULL
+);
+CREATE TABLE url_index_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    hash INTEGER NOT NULL
+);
+CREATE INDEX idx_url_index_log_source ON url_index_log (source, id);
+INSERT INTO url_index_log (source, hash)
+SELECT source, url_hash(url) FROM articles ORDER BY id;
+"""
+
+# Full-text index over title and original_title, kept in sync by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE articles_fts USING fts5 (
+    title, original_title,
+    content = 'articles', content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, original_title)
+    VALUES (new.id, new.title, new.original_title);
+END;
+CREATE TRIGGER articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, original_title)
+    VALUES ('delete', old.id, old.title, old.original_title);
+END;
+CREATE TRIGGER articles_fts_update AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, original_title)
+    VALUES ('delete', old.id, old.title, old.original_title);
+    INSERT INTO articles_fts (rowid, title, original_title)
+    VALUES (new.id, new.title, new.original_title);
+END;
+INSERT INTO articles_fts (articles_fts) VALUES ('rebuild');
+"""
+
+
+def url_hash(url: str) -> int:
+    """Signed 64-bit hash of a URL (fits an SQLite INTEGER)"""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+class UrlIndex:
+    """
+    Membership test for the URLs of one source
+
+    Holds the source's URL hashes as a sorted array, which loads in a few
+    milliseconds even for large archives. A hash hit is confirmed against
+    the articles table, so a hash collision never hides a new article.
+    Behaves like the set of URLs the scrapers used before (in, add, len);
+    len is the source's stored article count, URLs added but not saved
+    yet aren't included.
+    """
+
+    def __init__(self, store: 'ArticleStore', source: str, hashes: array, recent: set):
+        """
+        Initialize index
+
+        Args:
+            store: Store used for the exact check on hash hits
+            source: Source identifier
+            hashes: Sorted URL hashes of the stored articles
+            recent: Hashes of articles stored since the sorted array was written
+        """
+        self.store = store
+        self.source = source
+        self.hashes = hashes
+        self.recent = recent
+        self.added = set()
+
+    def __contains__(self, url: str) -> bool:
+        if url in self.added:
+            return True
+        key = url_hash(url)
+        if key not in self.recent:
+            index = bisect_left(self.hashes, key)
+            if index == len(self.hashes) or self.hashes[index] != key:
+                return False
+        return self.store.has_url(url)
+
+    def add(self, url: str):
+        """Mark a URL as known (it is persisted when its article is saved)"""
+        self.added.add(url)
+
+    def __len__(self) -> int:
+        return self.store.count_articles(self.source)
+
+
+def normalize_date(value) -> str:
+    """
+    Normalize a scraped date to YYYY-MM-DD for sorting
+
+    Args:
+        value: Date string as stored by a scraper (may be None)
+
+    Returns:
+        Normalized date, or '' if the date cannot be parsed
+    """
+    if not value:
+        return ''
+    value = str(value).strip()
+
+    # 2025-10-17, 2025-10-17T06:00:00, 2025-10-17 06:00:00Z
+    match = re.match(r'^(\d{4})-(\d{2})-(\d{2})', value)
+    if match:
+        return match.group(0)
+
+    # 17/10/2025 or 17.10.2025 (day first, as used on Swedish sites)
+    match = re.search(r'(\d{1,2})[/.](\d{1,2})[/.](\d{4})', value)
+    if match:
+        day, month, year = match.groups()
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+
+    return ''
+
+
+def build_fts_query(search_query: str) -> Optional[str]:
+    """
+    Convert a search box query into an FTS5 MATCH expression
+
+    Quoted text is matched as a phrase, every other word as a prefix,
+    and all parts must match (AND). An unbalanced quote only separates
+    words, so the words after it are still searched.
+
+    Args:
+        search_query: Raw query typed by the user
+
+    Returns:
+        FTS5 query string, or None if the query contains no searchable words
+    """
+    terms = []
+    for phrase in re.findall(r'"([^"]*)"', search_query):
+        words = re.findall(r'\w+', phrase)
+        if words:
+            terms.append('"' + ' '.join(words) + '"')
+
+    remainder = re.sub(r'"[^"]*"', ' ', search_query)
+    for word in re.findall(r'\w+', remainder):
+        terms.append(f'"{word}"*')
+
+    return ' AND '.join(terms) if terms else None
+
+
+class ArticleStore:
+    """Single embedded store for articles from all sources"""
+
+    def __init__(self, db_file = None):
+        """
+        Initialize store
+
+        Args:
+            db_file: Path to the SQLite database file
+        """
+        ensure_data_directory()
+        self.db_file = Path(db_file) if db_file else ARTICLE_DB_FILE
+        self._lock = threading.RLock()
+        self._revisions: Dict[str, int] = {}
+        self.conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.create_function('casefold', 1, lambda text: text.casefold() if text else '', deterministic=True)
+        self.conn.create_function('url_hash', 1, url_hash, deterministic=True)
+        with self._lock, self.conn:
+            self.conn.executescript(SCHEMA)
+        self._create_source_counts()
+        self._create_url_index()
+        self.has_fts = self._create_fts_index()
+        self._checkpoint_stop = threading.Event()
+        self._checkpoint_thread = None
+
+    def _create_source_counts(self):
+        """Create the per-source article counter table on first use"""
+        with self._lock:
+            exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'source_counts'"
+            ).fetchone()
+            if not exists:
+                with self.conn:
+                    self.conn.executescript(f"BEGIN; {COUNTS_SCHEMA} COMMIT;")
+
+    def _create_url_index(self):
+        """Create the URL membership index on first use"""
+        with self._lock:
+            exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'url_index'"
+            ).fetchone()
+            if not exists:
+                with self.conn:
+                    self.conn.executescript(f"BEGIN; {URL_INDEX_SCHEMA} COMMIT;")
+                logger.info("Built URL membership index")
+
+    def _create_fts_index(self) -> bool:
+        """Create the full-text index if SQLite supports FTS5"""
+        with self._lock:
+            exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+            ).fetchone()
+            if exists:
+                return True
+            try:
+                with self.conn:
+                    self.conn.executescript(f"BEGIN; {FTS_SCHEMA} COMMIT;")
+                logger.info("Built full-text search index")
+                return True
+            except sqlite3.OperationalError as e:
+                self.conn.rollback()
+                logger.warning(f"Full-text search unavailable, using title scan: {e}")
+                return False
+
+    def close(self):
+        """Stop background compaction and close the database connection"""
+        self.stop_checkpointer()
+        with self._lock:
+            self.conn.close()
+
+    def wal_size(self) -> int:
+        """Size of the write-ahead journal in bytes"""
+        try:
+            return Path(f"{self.db_file}-wal").stat().st_size
+        except OSError:
+            return 0
+
+    def checkpoint(self) -> bool:
+        """
+        Compact the journal into the main database file
+
+        Returns:
+            True if the whole journal was written back and truncated
+        """
+        with self._lock:
+            busy, log_pages, checkpointed = self.conn.execute(
+                "PRAGMA wal_checkpoint(TRUNCATE)"
+            ).fetchone()
+        if busy:
+            logger.debug("Journal compaction deferred, database busy")
+            return False
+        logger.debug(f"Compacted {checkpointed} journal pages into {self.db_file}")
+        return True
+
+    def start_checkpointer(self, interval: float = DB_CHECKPOINT_INTERVAL,
+                           wal_bytes: int = DB_CHECKPOINT_WAL_BYTES):
+        """
+        Start background journal compaction
+
+        Args:
+            interval: Seconds between journal size checks
+            wal_bytes: Journal size that triggers a compaction
+        """
+        if self._checkpoint_thread and self._checkpoint_thread.is_alive():
+            return
+
+        def run():
+            while not self._checkpoint_stop.wait(interval):
+                try:
+                    if self.wal_size() > wal_bytes:
+                        self.checkpoint()
+                except sqlite3.Error as e:
+                    logger.warning(f"Journal compaction failed: {e}")
+
+        self._checkpoint_stop.clear()
+        self._checkpoint_thread = threading.Thread(target=run, name="article-store-checkpoint", daemon=True)
+        self._checkpoint_thread.start()
+
+    def stop_checkpointer(self):
+        """Stop background journal compaction"""
+        self._checkpoint_stop.set()
+        if self._checkpoint_thread:
+            self._checkpoint_thread.join(timeout=5)
+            self._checkpoint_thread = None
+
+    def _article_row(self, source: str, article: Dict) -> Tuple:
+        """Convert an article dict into a row for the articles table"""
+        extra = {k: v for k, v in article.items() if k not in ARTICLE_COLUMNS}
+        return (
+            article['url'],
+            source,
+            article.get('title') or '',
+            article.get('original_title'),
+            article.get('date'),
+            normalize_date(article.get('date')),
+            article.get('scraped_at'),
+            json.dumps(extra, ensure_ascii=False) if extra else None
+        )
+
+    def _row_to_article(self, row) -> Dict:
+        """Convert a database row back into the article dict used by the app"""
+        article = {
+            'title': row['title'],
+            'url': row['url'],
+            'date': row['date'],
+            'scraped_at': row['scraped_at'],
+            'source': row['source']
+        }
+        if row['original_title'] is not None:
+            article['original_title'] = row['original_title']
+        if row['extra']:
+            article.update(json.loads(row['extra']))
+        return article
+
+    def _insert_articles(self, source: str, articles: List[Dict]) -> int:
+        """Insert articles inside the caller's transaction, skipping known URLs"""
+        inserted_hashes = []
+        for article in articles:
+            if not article.get('url'):
+                continue
+            cursor = self.conn.execute(
+                """INSERT OR IGNORE INTO articles
+                   (url, source, title, original_title, date, date_norm, scraped_at, extra)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                self._article_row(source, article)
+            )
+            # Ignored rows (URL already stored) are not logged, so the
+            # URL index only ever holds each stored URL once
+            if cursor.rowcount > 0:
+                inserted_hashes.append((source, url_hash(article['url'])))
+        self.conn.executemany(
+            "INSERT INTO url_index_log (source, hash) VALUES (?, ?)", inserted_hashes
+        )
+        if inserted_hashes:
+            self._bump_revision(source)
+        return len(inserted_hashes)
+
+    def _bump_revision(self, source: str):
+        """Record that a source changed in this process"""
+        self._revisions[source] = self._revisions.get(source, 0) + 1
+
+    def revision(self, source: str) -> int:
+        """
+        Get the in-process change counter of a source
+
+        The counter increases every time articles of the source are
+        inserted through this store instance.
+        """
+        return self._revisions.get(source, 0)
+
+    def source_fingerprint(self, source: str) -> int:
+        """
+        Get a cheap fingerprint of a source's stored articles
+
+        Articles are only ever added, so the trigger-maintained article
+        count changes whenever any process inserts articles for the source.
+        """
+        return self.count_articles(source)
+
+    def insert_articles(self, source: str, articles: List[Dict]) -> int:
+        """
+        Insert articles in a single transaction
+
+        Args:
+            source: Source identifier (e.g. 'cision')
+            articles: Article dicts as produced by the scrapers
+
+        Returns:
+            Number of articles actually inserted
+        """
+        if not articles:
+            return 0
+        with self._lock, self.conn:
+            return self._insert_articles(source, articles)
+
+    def save_source(self, source: str, articles: List[Dict], meta: Dict,
+                    http_validators: Optional[Dict[str, Dict]] = None) -> int:
+        """
+        Insert new articles and replace the source metadata atomically
+
+        Args:
+            source: Source identifier
+            articles: New article dicts to insert
+            meta: Scrape metadata (last_scrape, last_page_scraped, ...)
+            http_validators: Validators of the pages the articles came from,
+                by URL; committed together with the articles so a page is
+                only ever skipped once its articles are stored
+
+        Returns:
+            Number of articles actually inserted
+        """
+        with self._lock, self.conn:
+            inserted = self._insert_articles(source, articles)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO source_meta (source, data) VALUES (?, ?)",
+                (source, json.dumps(meta, ensure_ascii=False))
+            )
+            for url, validators in (http_validators or {}).items():
+                self._set_http_validators(url, validators)
+        return inserted
+
+    def url_index(self, source: str) -> UrlIndex:
+        """
+        Load the URL membership index of a source
+
+        Args:
+            source: Source identifier
+
+        Returns:
+            UrlIndex of the source's stored article URLs
+        """
+        with self._lock:
+            hashes = array('q')
+            last_log_id = 0
+            row = self.conn.execute(
+                "SELECT hashes, last_log_id FROM url_index WHERE source = ?", (source,)
+            ).fetchone()
+            if row:
+                hashes.frombytes(row['hashes'])
+                last_log_id = row['last_log_id']
+
+            # Plain tuples instead of sqlite3.Row, the log can be long
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            log = cursor.execute(
+                "SELECT id, hash FROM url_index_log WHERE source = ? AND id > ? ORDER BY id",
+                (source, last_log_id)
+            ).fetchall()
+
+            if len(log) >= URL_INDEX_COMPACT_ROWS:
+                hashes = self._compact_url_index(source, hashes, log)
+                log = []
+        return UrlIndex(self, source, hashes, {key for _, key in log})
+
+    def _compact_url_index(self, source: str, hashes: array, log: List[Tuple[int, int]]) -> array:
+        """Merge logged hashes into the source's sorted hash array"""
+        merged = array('q', sorted(set(hashes).union(key for _, key in log)))
+        last_log_id = log[-1][0]
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO url_index (source, hashes, last_log_id) VALUES (?, ?, ?)",
+                (source, merged.tobytes(), last_log_id)
+            )
+            self.conn.execute(
+                "DELETE FROM url_index_log WHERE source = ? AND id <= ?", (source, last_log_id)
+            )
+        logger.debug(f"Compacted URL index of {source}: {len(merged)} URLs")
+        return merged
+
+    def has_url(self, url: str) -> bool:
+        """Check whether an article with this URL is stored"""
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM articles WHERE url = ?", (url,)).fetchone() is not None
+
+    def known_article_ids(self, source: str, article_ids) -> set:
+        """
+        Find which site article ids (the 'article_id' some scrapers store) are stored
+
+        Args:
+            source: Source identifier
+            article_ids: Ids to look up
+
+        Returns:
+            Set of the given ids that belong to stored articles
+        """
+        article_ids = list(article_ids)
+        known = set()
+        with self._lock:
+            # Chunked to stay below SQLite's host parameter limit
+            for start in range(0, len(article_ids), 500):
+                chunk = article_ids[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT json_extract(extra, '$.article_id') FROM articles "
+                    f"WHERE source = ? AND json_extract(extra, '$.article_id') IN ({', '.join('?' * len(chunk))})",
+                    [source] + chunk
+                ).fetchall()
+                known.update(row[0] for row in rows)
+        return known
+
+    def get_http_validators(self, url: str) -> Dict:
+        """Get the stored ETag, Last-Modified and listing fingerprint of a page"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, fingerprint FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+        return dict(row) if row else {}
+
+    def set_http_validators(self, url: str, validators: Dict):
+        """Store the ETag, Last-Modified and listing fingerprint of a page"""
+        with self._lock, self.conn:
+            self._set_http_validators(url, validators)
+
+    def _set_http_validators(self, url: str, validators: Dict):
+        """Store page validators inside the caller's transaction"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, fingerprint) VALUES (?, ?, ?, ?)",
+            (url, validators.get('etag'), validators.get('last_modified'), validators.get('fingerprint'))
+        )
+
+    def get_source_meta(self, source: str) -> Dict:
+        """Get the scrape metadata stored for a source"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM source_meta WHERE source = ?", (source,)
+            ).fetchone()
+        return json.loads(row['data']) if row else {}
+
+    def set_source_meta(self, source: str, meta: Dict):
+        """Replace the scrape metadata stored for a source"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO source_meta (source, data) VALUES (?, ?)",
+                (source, json.dumps(meta, ensure_ascii=False))
+            )
+
+    def load_articles(self, source: str, newest_first: bool = False) -> List[Dict]:
+        """
+        Load all articles of a source
+
+        Args:
+            source: Source identifier
+            newest_first: Sort by date (newest first) instead of insertion order
+
+        Returns:
+            List of article dicts
+        """
+        order = "date_norm DESC, url DESC" if newest_first else "id"
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM articles WHERE source = ? ORDER BY {order}", (source,)
+            ).fetchall()
+        return [self._row_to_article(row) for row in rows]
+
+    def file_state(self) -> Tuple:
+        """Get (mtime, size) of the database files, used to spot writes by other processes"""
+        state = []
+        for path in (self.db_file, Path(f"{self.db_file}-wal")):
+            try:
+                stat = path.stat()
+                state.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                state.append(None)
+        return tuple(state)
+
+    def count_articles(self, source: Optional[str] = None) -> int:
+        """Count stored articles, optionally for a single source"""
+        with self._lock:
+            if source:
+                row = self.conn.execute(
+                    "SELECT articles FROM source_counts WHERE source = ?", (source,)
+                ).fetchone()
+            else:
+                row = self.conn.execute("SELECT SUM(articles) FROM source_counts").fetchone()
+        return (row[0] or 0) if row else 0
+
+    def publish_history(self, source: str, since: str) -> Tuple[int, Optional[str]]:
+        """
+        Count a source's articles published on or after a day
+
+        Uses the published date rather than scraped_at, so a backfill
+        storing old articles doesn't look like a burst of new ones.
+
+        Args:
+            source: Source identifier
+            since: YYYY-MM-DD day compared with the normalized date
+
+        Returns:
+            (number of articles, earliest published day of the source or None)
+        """
+        with self._lock:
+            count = self.conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE source = ? AND date_norm >= ?",
+                (source, since)
+            ).fetchone()[0]
+            earliest = self.conn.execute(
+                "SELECT MIN(date_norm) FROM articles WHERE source = ? AND date_norm != ''",
+                (source,)
+            ).fetchone()[0]
+        return count, earliest
+
+    def _add_search_filter(self, search_query: str, conditions: List[str], params: List) -> str:
+        """
+        Add a title search to a query's WHERE conditions
+
+        Returns:
+            JOIN clause needed by the filter ('' for the fallback scan)
+        """
+        fts_query = build_fts_query(search_query) if self.has_fts else None
+        if fts_query:
+            conditions.append("articles_fts MATCH ?")
+            params.append(fts_query)
+            return "JOIN articles_fts ON articles_fts.rowid = a.id"
+
+        conditions.append(
+            "(instr(casefold(a.title), ?) > 0 OR instr(casefold(a.original_title), ?) > 0)"
+        )
+        params.extend([search_query.casefold()] * 2)
+        return ""
+
+    def query_articles(self, source: str = "all", search_query: str = "",
+                       limit: int = 20, offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Query articles newest first
+
+        Args:
+            source: Source identifier or "all"
+            search_query: Words (prefix match) and "quoted phrases" that must
+                all appear in the title or original title
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip
+
+        Returns:
+            Tuple of (articles, total matching articles)
+        """
+        joins = ""
+        conditions = []
+        params = []
+        if source != "all":
+            conditions.append("a.source = ?")
+            params.append(source)
+        if search_query:
+            joins = self._add_search_filter(search_query, conditions, params)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            total = self.conn.execute(
+                f"SELECT COUNT(*) FROM articles a {joins} {where}", params
+            ).fetchone()[0]
+            rows = self.conn.execute(
+                f"SELECT a.* FROM articles a {joins} {where} "
+                f"ORDER BY a.date_norm DESC, a.url DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+        return [self._row_to_article(row) for row in rows], total
+
+    def query_articles_after(self, source: str = "all", after: Optional[Tuple[str, str]] = None,
+                             limit: int = 20, search_query: str = "") -> List[Tuple[Dict, Tuple[str, str]]]:
+        """
+        Keyset pagination: get the next articles after a (date, url) position
+
+        Walks the (date_norm, url) index, so the cost depends on the page
+        size and not on how deep into the archive the position is.
+
+        Args:
+            source: Source identifier or "all"
+            after: (normalized date, url) of the last article already shown,
+                or None to start from the newest article
+            limit: Maximum number of articles to return
+            search_query: Optional full-text filter (see query_articles)
+
+        Returns:
+            List of (article, position) tuples, newest first
+        """
+        joins = ""
+        conditions = []
+        params = []
+        if after is not None:
+            conditions.append("(a.date_norm, a.url) < (?, ?)")
+            params.extend(after)
+        if source != "all":
+            conditions.append("a.source = ?")
+            params.append(source)
+        if search_query:
+            joins = self._add_search_filter(search_query, conditions, params)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT a.* FROM articles a {joins} {where} "
+                f"ORDER BY a.date_norm DESC, a.url DESC LIMIT ?",
+                params + [limit]
+            ).fetchall()
+        return [(self._row_to_article(row), (row['date_norm'], row['url'])) for row in rows]
+
+    def import_json_file(self, source: str, data_file) -> int:
+        """
+        One-time import of a legacy per-source JSON file
+
+        The file is left untouched; the import is recorded in the source
+        metadata so it only ever runs once per source.
+
+        Args:
+            source: Source identifier
+            data_file: Path to the legacy JSON file
+
+        Returns:
+            Number of articles imported
+        """
+        data_file = Path(data_file)
+        meta = self.get_source_meta(source)
+        if meta.get('json_imported') or not data_file.exists():
+            return 0
+
+        try:
+            with open(data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"Corrupted JSON file {data_file}, skipping import")
+            return 0
+
+        articles = data.pop('articles', [])
+        meta.update(data)
+        meta['json_imported'] = str(data_file)
+        imported = self.save_source(source, articles, meta)
+        logger.info(f"Imported {imported} {source} articles from {data_file}")
+        return imported
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ArticleStore:
+    """Get the process-wide article store"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArticleStore()
+            _store.start_checkpointer()
+        return _store
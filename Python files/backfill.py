@@ -0,0 +1,514 @@
+"""
+Archive Backfill
+Parallel, resumable walk over the Fastighetsvarlden archive pages with a
+per-page completion bitmap and a persistent retry queue, and a date-range
+backfill for DI with per-day checkpoints
+"""
+
+import base64
+import queue
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from article_store import normalize_date
+from http_cache import UNCHANGED
+from parse_pool import get_parse_pool, parse_html, reset_parse_pool
+from config import (
+    BACKFILL_CONCURRENCY,
+    BACKFILL_RETRY_PASSES,
+    BACKFILL_SAVE_EVERY,
+    BACKFILL_SAVE_INTERVAL,
+    DI_BACKFILL_CONCURRENCY,
+    DI_BACKFILL_MAX_PAGES_PER_DAY
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PageBitmap:
+    """Compact set of completed page numbers (bit N-1 is page N)"""
+
+    def __init__(self, total_pages: int = 0, encoded: str = ''):
+        """
+        Initialize bitmap
+
+        Args:
+            total_pages: Number of pages the bitmap must hold
+            encoded: Bitmap saved with to_string()
+        """
+        self.bits = bytearray(base64.b64decode(encoded)) if encoded else bytearray()
+        self.resize(total_pages)
+
+    def resize(self, total_pages: int):
+        """Grow the bitmap to hold total_pages pages"""
+        needed = (total_pages + 7) // 8
+        if needed > len(self.bits):
+            self.bits.extend(bytes(needed - len(self.bits)))
+
+    def add(self, page_num: int):
+        """Mark a page as completed"""
+        self.resize(page_num)
+        self.bits[(page_num - 1) // 8] |= 1 << ((page_num - 1) % 8)
+
+    def __contains__(self, page_num: int) -> bool:
+        index = (page_num - 1) // 8
+        return index < len(self.bits) and bool(self.bits[index] & (1 << ((page_num - 1) % 8)))
+
+    def count(self, total_pages: int) -> int:
+        """Number of completed pages among the first total_pages"""
+        return sum(1 for page_num in range(1, total_pages + 1) if page_num in self)
+
+    def to_string(self) -> str:
+        """Encode the bitmap for the source metadata"""
+        return base64.b64encode(bytes(self.bits)).decode('ascii')
+
+
+class ArchiveBackfill:
+    """
+    Backfill engine for FastighetsVarldenScraper
+
+    Pages are fetched with bounded concurrency; the scraper's fetcher keeps
+    requests to the host within its rate limit. Pages are parsed on the
+    parse pool and saved on the calling thread. The completion bitmap and
+    retry queue are saved in the same transaction as the pages' articles
+    (every BACKFILL_SAVE_EVERY pages or BACKFILL_SAVE_INTERVAL seconds, and
+    when the run ends), so an interrupted backfill resumes where its last
+    save left off.
+    """
+
+    def __init__(self, scraper, max_workers: int = BACKFILL_CONCURRENCY,
+                 on_new_articles: Optional[Callable[[List[Dict]], None]] = None,
+                 on_progress: Optional[Callable[[Dict], None]] = None,
+                 should_continue: Optional[Callable[[], bool]] = None):
+        """
+        Initialize backfill
+
+        Args:
+            scraper: FastighetsVarldenScraper to fill
+            max_workers: Maximum number of pages fetched at the same time
+            on_new_articles: Called with each page's new articles before they are saved
+            on_progress: Called with a progress dict after each page
+            should_continue: Returns False to stop the backfill early
+        """
+        self.scraper = scraper
+        self.max_workers = max_workers
+        self.on_new_articles = on_new_articles
+        self.on_progress = on_progress
+        self.should_continue = should_continue or (lambda: True)
+        data = scraper.articles_data
+        self.bitmap = PageBitmap(data.get('total_pages', 0), data.get('backfill_pages_done', ''))
+        # page number -> failed attempts so far
+        self.retry_queue: Dict[int, int] = {int(page): attempts for page, attempts in data.get('backfill_retry_queue', [])}
+        self.total_pages = 0
+        self.completed_pages = 0  # pages in the bitmap, kept up to date by _process_page
+        self.last_page_done = 0
+        self.pages_done = 0
+        self.new_articles = 0
+        self.started = None
+        self.unsaved_pages = 0
+        self.last_save = 0.0
+
+    @property
+    def pages_per_min(self) -> float:
+        """Pages completed per minute in this run"""
+        elapsed = time.monotonic() - self.started if self.started else 0
+        return self.pages_done / elapsed * 60 if elapsed > 0 else 0.0
+
+    def progress(self) -> Dict:
+        """Current backfill progress"""
+        return {
+            'total_pages': self.total_pages,
+            'completed_pages': self.completed_pages,
+            'remaining_pages': self.total_pages - self.completed_pages,
+            'failed_pages': len(self.retry_queue),
+            'pages_this_run': self.pages_done,
+            'new_articles': self.new_articles,
+            'pages_per_min': round(self.pages_per_min, 1)
+        }
+
+    def run(self, start_page: int = 1, end_page: int = None) -> Dict:
+        """
+        Fetch every archive page that hasn't been completed yet
+
+        Args:
+            start_page: First page of the range to fill
+            end_page: Last page of the range (default: last archive page)
+
+        Returns:
+            Final progress dict
+        """
+        self.started = time.monotonic()
+        self.last_save = self.started
+
+        # The first page is always fetched to learn the archive size
+        first_page_html = self.scraper._fetch_page(1, conditional=False)
+        if not first_page_html:
+            raise Exception("Failed to fetch first page")
+
+        self.total_pages = self.scraper._get_max_page_number(first_page_html)
+        self.scraper.articles_data['total_pages'] = self.total_pages
+        self.bitmap.resize(self.total_pages)
+        end_page = min(end_page or self.total_pages, self.total_pages)
+
+        # Counted once here; _process_page keeps both up to date
+        done_pages = [page for page in range(1, self.total_pages + 1) if page in self.bitmap]
+        self.completed_pages = len(done_pages)
+        self.last_page_done = done_pages[-1] if done_pages else 0
+        logger.info(f"Backfilling pages {start_page}-{end_page} of {self.total_pages} "
+                    f"({self.completed_pages} already completed, {len(self.retry_queue)} queued for retry)")
+
+        try:
+            if start_page == 1:
+                self._process_page(1, first_page_html)
+
+            # Pages that failed in earlier runs go first
+            pages = sorted(page for page in self.retry_queue if start_page <= page <= end_page)
+            pages += [page for page in range(max(start_page, 2), end_page + 1)
+                      if page not in self.bitmap and page not in self.retry_queue]
+            self._fetch_pages(pages)
+
+            for retry_pass in range(BACKFILL_RETRY_PASSES):
+                retry_pages = sorted(page for page in self.retry_queue if start_page <= page <= end_page)
+                if not retry_pages or not self.should_continue():
+                    break
+                logger.info(f"Retrying {len(retry_pages)} failed pages (pass {retry_pass + 1}/{BACKFILL_RETRY_PASSES})")
+                self._fetch_pages(retry_pages)
+        finally:
+            # Pages completed since the last throttled save
+            self._save_state(force=True)
+
+        if self.should_continue() and self.completed_pages == self.total_pages:
+            # Archive complete; the next full scrape starts from a clean bitmap
+            self.scraper.articles_data['last_full_scrape'] = datetime.now().isoformat()
+            self.scraper.articles_data['backfill_pages_done'] = ''
+            self.scraper.articles_data['backfill_retry_queue'] = []
+            self.scraper._save_data()
+            logger.info(f"Backfill completed: {self.total_pages} pages")
+
+        return self.progress()
+
+    def _fetch_pages(self, pages: List[int]):
+        """
+        Fetch, parse and save pages as a pipeline
+
+        Fetches run on a thread pool and parses on the process pool (when
+        enabled) while the calling thread saves finished pages, so the
+        three stages overlap.
+        """
+        pending_pages = iter(pages)
+        parse_pool = get_parse_pool()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            fetching = {}
+            parsing = {}
+
+            def fill():
+                # Keep a small window in flight so stopping never leaves a long queue behind
+                while len(fetching) + len(parsing) < self.max_workers * 2 and self.should_continue():
+                    page_num = next(pending_pages, None)
+                    if page_num is None:
+                        return
+                    # The bitmap decides what still needs fetching, so skip the
+                    # conditional request that could report a page as unchanged
+                    # before its articles were saved
+                    fetching[executor.submit(self.scraper._fetch_page, page_num, False)] = page_num
+
+            fill()
+            while fetching or parsing:
+                done, _ = wait(list(fetching) + list(parsing), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetching:
+                        page_num = fetching.pop(future)
+                        try:
+                            html = future.result()
+                        except Exception as e:
+                            logger.error(f"Error fetching page {page_num}: {e}")
+                            html = None
+                        if html and parse_pool:
+                            try:
+                                parsing[parse_pool.submit(parse_html, type(self.scraper), html)] = (page_num, html)
+                                continue
+                            except Exception as e:
+                                logger.warning(f"Parse pool unavailable, parsing in this thread: {e}")
+                                reset_parse_pool()
+                                parse_pool = None
+                        self._process_page(page_num, html)
+                    else:
+                        page_num, html = parsing.pop(future)
+                        try:
+                            articles = future.result()
+                        except Exception as e:
+                            # A crashed worker breaks the whole pool; parse here from now on
+                            logger.warning(f"Parse pool failed on page {page_num}, parsing in this thread: {e}")
+                            reset_parse_pool()
+                            parse_pool = None
+                            articles = None
+                        self._process_page(page_num, html, articles)
+                fill()
+
+    def _process_page(self, page_num: int, html: Optional[str], articles: Optional[List[Dict]] = None):
+        """
+        Save a fetched page's new articles and record the page as done or failed
+
+        Args:
+            page_num: Page number
+            html: Page HTML, UNCHANGED, or None if the fetch failed
+            articles: Articles already parsed from the HTML, if any
+        """
+        if html is UNCHANGED:
+            logger.info(f"Page {page_num} unchanged, already scraped")
+        elif not html:
+            self.retry_queue[page_num] = self.retry_queue.get(page_num, 0) + 1
+            logger.warning(f"Failed to fetch page {page_num}, queued for retry "
+                           f"(attempt {self.retry_queue[page_num]})")
+            self._save_state()
+            return
+        else:
+            if articles is None:
+                articles = self.scraper._parse_page(html)
+            new_articles = [article for article in articles if not self.scraper._is_duplicate(article['url'])]
+            for article in new_articles:
+                self.scraper.article_urls.add(article['url'])
+            if self.on_new_articles:
+                self.on_new_articles(new_articles)
+            self.scraper.articles_data['articles'].extend(new_articles)
+            self.new_articles += len(new_articles)
+            logger.info(f"Page {page_num}/{self.total_pages}: Found {len(articles)} articles, {len(new_articles)} new")
+
+        if page_num not in self.bitmap:
+            self.completed_pages += 1
+            self.last_page_done = max(self.last_page_done, page_num)
+        self.bitmap.add(page_num)
+        self.retry_queue.pop(page_num, None)
+        self.pages_done += 1
+        self.unsaved_pages += 1
+        self._save_state()
+
+        if self.on_progress:
+            self.on_progress(self.progress())
+
+    def _save_state(self, force: bool = False):
+        """
+        Save the bitmap and retry queue together with the new articles
+
+        Args:
+            force: Save now instead of waiting for BACKFILL_SAVE_EVERY
+                pages or BACKFILL_SAVE_INTERVAL seconds
+        """
+        if not force and (self.unsaved_pages < BACKFILL_SAVE_EVERY and
+                          time.monotonic() - self.last_save < BACKFILL_SAVE_INTERVAL):
+            return
+        data = self.scraper.articles_data
+        data['backfill_pages_done'] = self.bitmap.to_string()
+        data['backfill_retry_queue'] = sorted(self.retry_queue.items())
+        data['last_page_scraped'] = self.last_page_done
+        self.scraper._save_data()
+        self.unsaved_pages = 0
+        self.last_save = time.monotonic()
+
+
+class DateRangeBackfill:
+    """
+    Backfill engine for DIScraper, walking the listing's lastday/page
+    parameters backwards over a date range
+
+    The range is split into segments walked concurrently. Within a segment,
+    the listing for lastday=D is paged until it passes day D; every day
+    newer than the oldest date seen is then complete, and the walk jumps
+    to that oldest day. Finished days are checkpointed in the source
+    metadata together with their articles, so an interrupted backfill
+    resumes with the days it hasn't completed. Articles are deduplicated
+    by DI's data-id as well as by URL. Listing items without a date are
+    stored undated instead of with the parser's today fallback.
+    """
+
+    def __init__(self, scraper, max_workers: int = DI_BACKFILL_CONCURRENCY,
+                 on_new_articles: Optional[Callable[[List[Dict]], None]] = None,
+                 on_progress: Optional[Callable[[Dict], None]] = None,
+                 should_continue: Optional[Callable[[], bool]] = None):
+        """
+        Initialize backfill
+
+        Args:
+            scraper: DIScraper to fill
+            max_workers: Number of date segments walked at the same time
+            on_new_articles: Called with each batch of new articles before they are saved
+            on_progress: Called with a progress dict after each checkpoint
+            should_continue: Returns False to stop the backfill early
+        """
+        self.scraper = scraper
+        self.max_workers = max_workers
+        self.on_new_articles = on_new_articles
+        self.on_progress = on_progress
+        self.should_continue = should_continue or (lambda: True)
+        self.days_done = set(scraper.articles_data.get('backfill_days_done', []))
+        self.seen_ids = set()  # data-ids stored before or during this run
+        self.range_days: List[str] = []
+        self.total_days = 0
+        self.days_this_run = 0
+        self.failed_days = 0
+        self.requests = 0
+        self.new_articles = 0
+        self.started = None
+        self._lock = threading.Lock()
+
+    def progress(self) -> Dict:
+        """Current backfill progress"""
+        elapsed = time.monotonic() - self.started if self.started else 0
+        completed = sum(1 for day in self.range_days if day in self.days_done)
+        return {
+            'total_days': self.total_days,
+            'completed_days': completed,
+            'remaining_days': self.total_days - completed,
+            'failed_days': self.failed_days,
+            'requests': self.requests,
+            'new_articles': self.new_articles,
+            'days_per_min': round(self.days_this_run / elapsed * 60, 1) if elapsed > 0 else 0.0
+        }
+
+    def run(self, start_day: date, end_day: date = None) -> Dict:
+        """
+        Fetch every day of a range that hasn't been completed yet
+
+        Args:
+            start_day: Oldest day of the range
+            end_day: Newest day of the range (default: today)
+
+        Returns:
+            Final progress dict
+        """
+        self.started = time.monotonic()
+        end_day = end_day or date.today()
+        self.range_days = [(start_day + timedelta(days=offset)).isoformat()
+                            for offset in range((end_day - start_day).days + 1)]
+        self.total_days = len(self.range_days)
+
+        logger.info(f"DI backfill {start_day} - {end_day}: {self.total_days} days, "
+                    f"{sum(1 for day in self.range_days if day in self.days_done)} already completed")
+
+        # Newest segment first; each walker moves from its end back to its start
+        segment_days = -(-self.total_days // max(self.max_workers, 1))
+        segments = []
+        for first in range(0, self.total_days, segment_days):
+            days = self.range_days[first:first + segment_days]
+            segments.append((date.fromisoformat(days[0]), date.fromisoformat(days[-1])))
+        segments.reverse()
+
+        # Walkers fetch and parse; this thread saves, so the scraper's data
+        # is only ever modified here
+        results = queue.Queue()
+        with ThreadPoolExecutor(max_workers=max(self.max_workers, 1)) as executor:
+            walkers = [executor.submit(self._walk, segment_start, segment_end, results)
+                       for segment_start, segment_end in segments]
+            while True:
+                try:
+                    covered_days, articles = results.get(timeout=0.5)
+                except queue.Empty:
+                    if all(walker.done() for walker in walkers) and results.empty():
+                        break
+                    continue
+                self._checkpoint(covered_days, articles)
+            for walker in walkers:
+                # Surface unexpected walker errors in the log
+                if walker.exception():
+                    logger.error(f"DI backfill walker failed: {walker.exception()}")
+
+        return self.progress()
+
+    def _walk(self, segment_start: date, segment_end: date, results: queue.Queue):
+        """
+        Walk one date segment from its newest day back to its oldest
+
+        Puts (covered days, articles) on the results queue after each
+        listing walk.
+        """
+        day = segment_end
+        while day >= segment_start and self.should_continue():
+            if day.isoformat() in self.days_done:
+                day -= timedelta(days=1)
+                continue
+
+            articles = []
+            oldest = None
+            failed = False
+            listing_ended = False
+            for page_num in range(1, DI_BACKFILL_MAX_PAGES_PER_DAY + 1):
+                html = self.scraper._fetch_page(page_num, conditional=False, day=day)
+                with self._lock:
+                    self.requests += 1
+                if not html:
+                    failed = True
+                    break
+                page = self.scraper._parse_page(html)
+                if not page:
+                    listing_ended = True
+                    break
+                # lastday=D lists nothing newer than D, so a later date is the
+                # parser's today fallback for an undated item: store it undated
+                for article in page:
+                    if normalize_date(article.get('date')) > day.isoformat():
+                        article['date'] = None
+                articles.extend(page)
+                page_dates = [normalize_date(article.get('date')) for article in page]
+                page_oldest = min((value for value in page_dates if value), default=None)
+                if page_oldest:
+                    oldest = min(oldest or page_oldest, page_oldest)
+                if oldest and oldest < day.isoformat():
+                    break
+
+            if failed:
+                logger.warning(f"DI backfill: failed to fetch {day}, it stays open for the next run")
+                with self._lock:
+                    self.failed_days += 1
+                results.put(([], articles))
+                day -= timedelta(days=1)
+                continue
+
+            if listing_ended:
+                # Nothing older in the listing
+                covered_until = segment_start
+            elif oldest and oldest < day.isoformat():
+                covered_until = max(date.fromisoformat(oldest) + timedelta(days=1), segment_start)
+            else:
+                logger.warning(f"DI backfill: {day} fills more than {DI_BACKFILL_MAX_PAGES_PER_DAY} pages, "
+                               f"only those were read")
+                covered_until = day
+            covered_days = [(covered_until + timedelta(days=offset)).isoformat()
+                            for offset in range((day - covered_until).days + 1)]
+            results.put((covered_days, articles))
+
+            # The oldest day seen was only partly listed, so it gets its own walk
+            day = min(covered_until - timedelta(days=1), day - timedelta(days=1))
+
+    def _checkpoint(self, covered_days: List[str], articles: List[Dict]):
+        """Save a walk's new articles together with the days it completed"""
+        # data-ids already stored, so a moved or re-slugged article isn't added twice
+        article_ids = {article['article_id'] for article in articles if article.get('article_id')}
+        self.seen_ids.update(self.scraper.store.known_article_ids(self.scraper.SOURCE, article_ids - self.seen_ids))
+
+        new_articles = []
+        for article in articles:
+            article_id = article.get('article_id')
+            if (article_id and article_id in self.seen_ids) or self.scraper._is_duplicate(article['url']):
+                continue
+            if article_id:
+                self.seen_ids.add(article_id)
+            self.scraper.article_urls.add(article['url'])
+            new_articles.append(article)
+
+        if new_articles and self.on_new_articles:
+            self.on_new_articles(new_articles)
+        self.scraper.articles_data['articles'].extend(new_articles)
+        self.new_articles += len(new_articles)
+
+        self.days_this_run += len(set(covered_days) - self.days_done)
+        self.days_done.update(covered_days)
+        self.scraper.articles_data['backfill_days_done'] = sorted(self.days_done)
+        self.scraper._save_data()
+        if covered_days:
+            logger.info(f"DI backfill: {covered_days[0]} - {covered_days[-1]} done, {len(new_articles)} new articles")
+
+        if self.on_progress:
+            self.on_progress(self.progress())
@@ -4,13 +4,17 @@ Scrapes latest news articles from news.cision.com
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
 import time
 from datetime import datetime
-from typing import List, Dict, Set
+from typing import List, Dict
 import logging
 from pathlib import Path
+from article_store import UrlIndex, get_store
+from fetcher import get_fetcher
+from html_parser import make_soup
+from metrics import get_metrics, timed_stage
+from watermark import page_until_watermark
+from http_cache import UNCHANGED, ANY_LINK_PATTERN, check_listing, conditional_headers
 from config import CISION_DATA_FILE, SCRAPER_LOG_FILE, ensure_data_directory
 
 # Ensure data directory exists
@@ -31,38 +35,43 @@ logger = logging.getLogger(__name__)
 class CisionScraper:
     """Scraper for news.cision.com"""
     
-    BASE_URL = "https://news.cision.com/ListItems?i=04004003&pageIx=1"
-    RATE_LIMIT_DELAY = 2  # seconds between requests
+    SOURCE = "cision"
+    PAGE_URL = "https://news.cision.com/ListItems?i=04004003&pageIx={page}"
+    BASE_URL = PAGE_URL.format(page=1)
+    RATE_LIMIT_DELAY = 2  # minimum seconds between requests to the host
     MAX_RETRIES = 3
     RETRY_DELAY = 5
+    ARTICLE_ID_PATTERN = ANY_LINK_PATTERN  # the listing fragment only links to press releases
     
     def __init__(self, data_file = None):
         """
         Initialize scraper
         
         Args:
-            data_file: Path to JSON file for storing scraped data
+            data_file: Path to legacy JSON file imported into the article store
         """
         self.data_file = Path(data_file) if data_file else CISION_DATA_FILE
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        self.fetcher = get_fetcher()
+        self.store = get_store()
         self.articles_data = self._load_existing_data()
-        self.article_urls: Set[str] = set(article['url'] for article in self.articles_data.get('articles', []))
+        self._saved_count = len(self.articles_data['articles'])
+        self._pending_validators = {}
+        self.article_urls: UrlIndex = self.store.url_index(self.SOURCE)
         
     def _load_existing_data(self) -> Dict:
-        """Load existing data from JSON file"""
-        if self.data_file.exists():
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(f"Loaded {len(data.get('articles', []))} existing articles")
-                    return data
-            except json.JSONDecodeError:
-                logger.warning("Corrupted JSON file, starting fresh")
-                return self._initialize_data_structure()
-        return self._initialize_data_structure()
+        """Load existing data from the article store"""
+        self.store.import_json_file(self.SOURCE, self.data_file)
+        data = self._initialize_data_structure()
+        data.update(self.store.get_source_meta(self.SOURCE))
+        # Only this run's new articles are kept in memory; known URLs
+        # are answered by the store's URL index (article_urls)
+        data['articles'] = []
+        logger.info(f"Found {self.store.count_articles(self.SOURCE)} existing articles")
+        return data
     
     def _initialize_data_structure(self) -> Dict:
         """Initialize the data structure"""
@@ -74,28 +83,49 @@ class CisionScraper:
         }
     
     def _save_data(self):
-        """Save data to JSON file"""
-        self.articles_data['total_articles'] = len(self.articles_data['articles'])
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.articles_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved {self.articles_data['total_articles']} articles to {self.data_file}")
+        """Save new articles and scrape metadata to the article store"""
+        new_articles = self.articles_data['articles'][self._saved_count:]
+        self.articles_data['total_articles'] = self.store.count_articles(self.SOURCE) + len(new_articles)
+        meta = {key: value for key, value in self.articles_data.items() if key != 'articles'}
+        with get_metrics().timer(self.SOURCE, 'save') as timer:
+            timer.articles = len(new_articles)
+            self.store.save_source(self.SOURCE, new_articles, meta, self._pending_validators)
+        self._pending_validators = {}
+        self._saved_count = len(self.articles_data['articles'])
+        logger.info(f"Saved {len(new_articles)} new articles ({self.articles_data['total_articles']} total) to {self.store.db_file}")
     
-    def _fetch_page(self) -> str:
+    def _fetch_page(self, page_num: int = 1, conditional: bool = True) -> str:
         """
-        Fetch the page with retry logic
+        Fetch a listing page with retry logic
+        
+        Args:
+            page_num: Listing page to fetch (1 for the newest articles)
+            conditional: Send the stored ETag/Last-Modified and compare the
+                listed articles with the last saved scrape (otherwise the
+                page's validators aren't recorded either)
         
         Returns:
-            HTML content as string
+            HTML content as string, UNCHANGED if no articles were added,
+            or None on failure
         """
+        url = self.PAGE_URL.format(page=page_num)
+        validators = self.store.get_http_validators(url) if conditional else {}
+        
         for attempt in range(self.MAX_RETRIES):
             try:
-                logger.info(f"Fetching Cision news (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                response = self.session.get(self.BASE_URL, timeout=30)
+                logger.info(f"Fetching Cision news page {page_num} (attempt {attempt + 1}/{self.MAX_RETRIES})")
+                response = self.fetcher.get(self.session, url, self.RATE_LIMIT_DELAY, source=self.SOURCE,
+                                            headers=conditional_headers(validators), timeout=30)
+                
+                if response.status_code == 304:
+                    logger.info(f"Cision news page {page_num} not modified since last scrape")
+                    return UNCHANGED
                 response.raise_for_status()
                 
-                # Rate limiting
-                time.sleep(self.RATE_LIMIT_DELAY)
-                return response.text
+                if not conditional:
+                    return response.text
+                return check_listing(self.store, url, response, validators,
+                                     self.ARTICLE_ID_PATTERN, self._pending_validators)
                 
             except requests.RequestException as e:
                 logger.error(f"Error fetching page: {e}")
@@ -106,6 +136,7 @@ class CisionScraper:
                     logger.error(f"Failed to fetch page after {self.MAX_RETRIES} attempts")
                     return None
     
+    @timed_stage('parse')
     def _parse_page(self, html: str) -> List[Dict]:
         """
         Parse the page and extract articles
@@ -116,7 +147,7 @@ class CisionScraper:
         Returns:
             List of article dictionaries
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         articles = []
         
         # Find all card-item divs
@@ -204,12 +235,18 @@ class CisionScraper:
         
         # Fetch page
         html = self._fetch_page()
+        if html is UNCHANGED:
+            logger.info("No new Cision articles (listing unchanged)")
+            self.articles_data['last_scrape'] = datetime.now().isoformat()
+            self._save_data()
+            return 0
         if not html:
             logger.error("Failed to fetch Cision page")
             return 0
         
         # Parse articles
         articles = self._parse_page(html)
+        articles = page_until_watermark(self, articles, lambda page_num: self._fetch_page(page_num, False))
         new_articles_count = 0
         
         for article in articles:
@@ -224,7 +261,7 @@ class CisionScraper:
         self._save_data()
         
         logger.info(f"Cision scrape completed: {new_articles_count} new articles")
-        logger.info(f"Total Cision articles in database: {len(self.articles_data['articles'])}")
+        logger.info(f"Total Cision articles in database: {len(self.article_urls)}")
         
         return new_articles_count
 
@@ -243,8 +280,8 @@ def main():
     print()
     print("=" * 60)
     print(f"Found {new_count} new articles")
-    print(f"Total articles: {len(scraper.articles_data['articles'])}")
-    print(f"Data saved to: {scraper.data_file}")
+    print(f"Total articles: {len(scraper.article_urls)}")
+    print(f"Data saved to: {scraper.store.db_file}")
     print("=" * 60)
 
 
@@ -18,7 +18,22 @@ DATA_DIR = DOCUMENTS_PATH / "News Dashboard Data"
 # Ensure directory exists
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-# Data file paths
+# Article database (all sources)
+ARTICLE_DB_FILE = DATA_DIR / "articles.db"
+DB_CHECKPOINT_INTERVAL = 30  # seconds between background journal compaction checks
+DB_CHECKPOINT_WAL_BYTES = 1024 * 1024  # compact once the journal grows past this size
+URL_INDEX_COMPACT_ROWS = 1000  # Newly stored URLs logged before the URL index is rewritten
+
+# Translation cache
+TRANSLATION_CACHE_FILE = DATA_DIR / "translation_cache.db"
+TRANSLATION_CACHE_MAX_ENTRIES = 50000
+
+# Batched translation
+TRANSLATION_BATCH_SIZE = 25  # Titles sent per translation request
+TRANSLATION_MAX_BATCH_CHARS = 4500  # Google Translate rejects texts over 5000 characters
+TRANSLATION_CONCURRENCY = 3  # Batches translated at the same time
+
+# Legacy JSON data files (imported once into the article database)
 FASTIGHETSVARLDEN_DATA_FILE = DATA_DIR / "news_data.json"
 CISION_DATA_FILE = DATA_DIR / "cision_news_data.json"
 LOKALGUIDEN_DATA_FILE = DATA_DIR / "lokalguiden_news_data.json"
@@ -30,6 +45,65 @@ NORDICPROPERTYNEWS_DATA_FILE = DATA_DIR / "nordicpropertynews_news_data.json"
 APP_LOG_FILE = DATA_DIR / "app.log"
 SCRAPER_LOG_FILE = DATA_DIR / "scraper.log"
 
+# Opt-in profiling of the scrape and query paths (reports are written next to the app log)
+PROFILING_ENABLED = os.environ.get('NEWS_DASHBOARD_PROFILE', '') == '1'
+PROFILE_DIR = APP_LOG_FILE.parent / "profiles"
+PROFILE_TOP_N = 40  # Functions and allocation sites listed in each report
+
+# Stage timing metrics
+METRICS_FILE = DATA_DIR / "metrics_summary.json"
+METRICS_WINDOW = 200  # Recent timings per source and stage used for p50/p95/max
+
+# Scraping settings
+PARALLEL_SCRAPING = True  # Check all sources at the same time
+SCRAPE_MAX_WORKERS = 6  # Maximum number of sources checked concurrently
+PREFETCH_TTL = 120  # seconds a checked listing may be reused by the following scrape
+PROGRESS_PUSH_INTERVAL = 0.25  # minimum seconds between progress events sent to the UI
+INCREMENTAL_MAX_PAGES = 10  # Listing pages an incremental scrape may read to reach the last run's newest article
+INCREMENTAL_PREFETCH_PAGES = 2  # Listing pages downloaded ahead while paging
+
+# Headless scheduler (scheduler.py)
+SCHEDULER_INTERVALS = {  # seconds between checks of each source (starting point when adaptive)
+    'cision': 600,
+    'di': 900,
+    'fastighetsvarlden': 900,
+    'fastighetsnytt': 1800,
+    'nordicpropertynews': 1800,
+    'lokalguiden': 3600,
+}
+SCHEDULER_DEFAULT_INTERVAL = 1800  # Sources missing from SCHEDULER_INTERVALS
+SCHEDULER_ADAPTIVE = True  # Adjust each interval to the source's observed publish rate
+SCHEDULER_MIN_INTERVAL = 300  # Adaptive intervals stay within these bounds (seconds)
+SCHEDULER_MAX_INTERVAL = 4 * 3600
+SCHEDULER_RATE_WINDOW = 7 * 24  # hours of published dates used to estimate the publish rate
+SCHEDULER_TARGET_NEW_PER_RUN = 1.0  # Aim for about this many new articles per check
+SCHEDULER_BACKOFF_FACTOR = 1.5  # Interval multiplier for each consecutive check that found nothing
+SCHEDULER_JITTER = 0.1  # Each interval varies randomly by up to +/-10%
+SCHEDULER_STATUS_FILE = DATA_DIR / "scheduler_status.json"
+SCHEDULER_HEARTBEAT = 60  # seconds between status file updates while idle
+SCHEDULER_STATUS_STALE = 180  # a status file older than this means no scheduler is running
+
+# Fetch engine settings (per-host spacing is each scraper's RATE_LIMIT_DELAY)
+FETCH_MAX_CONNECTIONS = 8  # Maximum number of requests in flight across all hosts
+HOST_BURST = 1  # Requests a host may receive back to back after being idle
+
+# HTML parser backend used by the scrapers: 'html.parser', 'lxml' or 'fast'
+# ('fast' needs the optional selectolax package). The backends can build
+# slightly different trees, so run parser_benchmark.py --record and --check
+# before switching away from 'html.parser'
+PARSER_BACKEND = 'html.parser'
+
+# Full archive backfill (Fastighetsvarlden)
+BACKFILL_CONCURRENCY = 4  # Archive pages fetched at the same time
+BACKFILL_RETRY_PASSES = 2  # Extra passes over failed pages before a run ends
+BACKFILL_SAVE_EVERY = 20  # Completed pages between two saves of the new articles and resume state
+BACKFILL_SAVE_INTERVAL = 10  # ...or seconds, whichever comes first
+PARSE_POOL_SIZE = 2  # Processes parsing archive pages during a backfill (0 parses in the scraping thread)
+
+# DI date-range backfill
+DI_BACKFILL_CONCURRENCY = 3  # Date segments walked at the same time
+DI_BACKFILL_MAX_PAGES_PER_DAY = 10  # Listing pages read for a single lastday value
+
 def get_data_directory():
     """Get the data directory path"""
     return str(DATA_DIR)
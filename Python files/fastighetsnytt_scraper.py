@@ -5,13 +5,18 @@ Parses Next.js __NEXT_DATA__ JSON structure
 """
 
 import requests
-from bs4 import BeautifulSoup
 import json
 import time
 from datetime import datetime
-from typing import List, Dict, Set
+from typing import List, Dict
 import logging
 from pathlib import Path
+from article_store import UrlIndex, get_store
+from fetcher import get_fetcher
+from html_parser import make_soup
+from metrics import get_metrics, timed_stage
+from watermark import page_until_watermark
+from http_cache import UNCHANGED, check_listing, conditional_headers
 from config import ensure_data_directory
 
 # Get data directory path
@@ -34,17 +39,19 @@ logger = logging.getLogger(__name__)
 class FastighetsnyttScraper:
     """Scraper for fastighetsnytt.se real estate news"""
     
+    SOURCE = "fastighetsnytt"
     BASE_URL = "https://www.fastighetsnytt.se/"
-    RATE_LIMIT_DELAY = 2  # seconds between requests
+    RATE_LIMIT_DELAY = 2  # minimum seconds between requests to the host
     MAX_RETRIES = 3
     RETRY_DELAY = 5
+    ARTICLE_ID_PATTERN = r'"url"\s*:\s*"([^"]+)"'  # article URLs in __NEXT_DATA__
     
     def __init__(self, data_file = None):
         """
         Initialize scraper
         
         Args:
-            data_file: Path to JSON file for storing scraped data
+            data_file: Path to legacy JSON file imported into the article store
         """
         self.data_file = Path(data_file) if data_file else FASTIGHETSNYTT_DATA_FILE
         self.session = requests.Session()
@@ -53,21 +60,23 @@ class FastighetsnyttScraper:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         })
+        self.fetcher = get_fetcher()
+        self.store = get_store()
         self.articles_data = self._load_existing_data()
-        self.article_urls: Set[str] = set(article['url'] for article in self.articles_data.get('articles', []))
+        self._saved_count = len(self.articles_data['articles'])
+        self._pending_validators = {}
+        self.article_urls: UrlIndex = self.store.url_index(self.SOURCE)
         
     def _load_existing_data(self) -> Dict:
-        """Load existing article data from JSON file"""
-        if self.data_file.exists():
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(f"Loaded {len(data.get('articles', []))} existing Fastighetsnytt articles")
-                    return data
-            except json.JSONDecodeError:
-                logger.warning("Corrupted Fastighetsnytt JSON file, starting fresh")
-                return self._initialize_data_structure()
-        return self._initialize_data_structure()
+        """Load existing Fastighetsnytt data from the article store"""
+        self.store.import_json_file(self.SOURCE, self.data_file)
+        data = self._initialize_data_structure()
+        data.update(self.store.get_source_meta(self.SOURCE))
+        # Only this run's new articles are kept in memory; known URLs
+        # are answered by the store's URL index (article_urls)
+        data['articles'] = []
+        logger.info(f"Found {self.store.count_articles(self.SOURCE)} existing Fastighetsnytt articles")
+        return data
     
     def _initialize_data_structure(self) -> Dict:
         """Initialize the data structure for storing articles"""
@@ -78,21 +87,38 @@ class FastighetsnyttScraper:
         }
     
     def _save_data(self):
-        """Save article data to JSON file"""
-        self.articles_data['total_articles'] = len(self.articles_data['articles'])
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.articles_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved {self.articles_data['total_articles']} Fastighetsnytt articles to {self.data_file}")
+        """Save new articles and scrape metadata to the article store"""
+        new_articles = self.articles_data['articles'][self._saved_count:]
+        self.articles_data['total_articles'] = self.store.count_articles(self.SOURCE) + len(new_articles)
+        meta = {key: value for key, value in self.articles_data.items() if key != 'articles'}
+        with get_metrics().timer(self.SOURCE, 'save') as timer:
+            timer.articles = len(new_articles)
+            self.store.save_source(self.SOURCE, new_articles, meta, self._pending_validators)
+        self._pending_validators = {}
+        self._saved_count = len(self.articles_data['articles'])
+        logger.info(f"Saved {len(new_articles)} new Fastighetsnytt articles ({self.articles_data['total_articles']} total) to {self.store.db_file}")
     
     def _fetch_page(self) -> str:
-        """Fetch the homepage"""
+        """
+        Fetch the homepage
+        
+        Returns UNCHANGED instead of the HTML if the server answers 304 or
+        the same articles are listed as in the last saved scrape.
+        """
+        url = self.BASE_URL
+        validators = self.store.get_http_validators(url)
+        
         for attempt in range(self.MAX_RETRIES):
             try:
                 logger.info(f"Fetching Fastighetsnytt homepage (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                response = self.session.get(self.BASE_URL, timeout=30)
+                response = self.fetcher.get(self.session, url, self.RATE_LIMIT_DELAY, source=self.SOURCE,
+                                            headers=conditional_headers(validators), timeout=30)
+                if response.status_code == 304:
+                    logger.info("Fastighetsnytt homepage not modified since last scrape")
+                    return UNCHANGED
                 response.raise_for_status()
-                time.sleep(self.RATE_LIMIT_DELAY)
-                return response.text
+                return check_listing(self.store, url, response, validators,
+                                     self.ARTICLE_ID_PATTERN, self._pending_validators)
             except requests.RequestException as e:
                 logger.error(f"Error fetching Fastighetsnytt homepage: {e}")
                 if attempt < self.MAX_RETRIES - 1:
@@ -102,6 +128,7 @@ class FastighetsnyttScraper:
                     logger.error(f"Failed to fetch Fastighetsnytt homepage after {self.MAX_RETRIES} attempts")
                     return None
     
+    @timed_stage('parse')
     def _parse_page(self, html: str) -> List[Dict]:
         """
         Parse articles from Next.js __NEXT_DATA__ JSON structure
@@ -112,7 +139,7 @@ class FastighetsnyttScraper:
         Returns:
             List of article dictionaries
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         articles = []
         
         try:
@@ -202,10 +229,16 @@ class FastighetsnyttScraper:
         new_articles_count = 0
         
         html = self._fetch_page()
+        if html is UNCHANGED:
+            logger.info("No new Fastighetsnytt articles (listing unchanged)")
+            self.articles_data['last_scrape'] = datetime.now().isoformat()
+            self._save_data()
+            return 0
         if not html:
             return 0
         
         articles = self._parse_page(html)
+        articles = page_until_watermark(self, articles)
         
         for article in articles:
             if not self._is_duplicate(article['url']):
@@ -226,5 +259,5 @@ if __name__ == "__main__":
     print("Starting Fastighetsnytt latest articles scrape...")
     new_count = scraper.scrape_latest()
     print(f"Found {new_count} new articles.")
-    print(f"Total articles in database: {len(scraper.articles_data['articles'])}")
+    print(f"Total articles in database: {len(scraper.article_urls)}")
 
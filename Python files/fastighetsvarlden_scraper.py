@@ -4,15 +4,21 @@ Scrapes all news articles from the archive with rate limiting, pagination, and d
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
 import time
 from datetime import datetime
-from typing import List, Dict, Set
+from typing import List, Dict
 import logging
 from pathlib import Path
 import re
-from config import FASTIGHETSVARLDEN_DATA_FILE, SCRAPER_LOG_FILE, ensure_data_directory
+from bs4 import Comment
+from article_store import UrlIndex, get_store
+from backfill import ArchiveBackfill
+from fetcher import get_fetcher
+from html_parser import make_soup
+from metrics import get_metrics, timed_stage
+from watermark import page_until_watermark
+from http_cache import UNCHANGED, check_listing, conditional_headers
+from config import FASTIGHETSVARLDEN_DATA_FILE, SCRAPER_LOG_FILE, INCREMENTAL_MAX_PAGES, ensure_data_directory
 
 # Ensure data directory exists
 ensure_data_directory()
@@ -32,38 +38,47 @@ logger = logging.getLogger(__name__)
 class FastighetsVarldenScraper:
     """Scraper for fastighetsvarlden.se archive"""
     
+    SOURCE = "fastighetsvarlden"
     BASE_URL = "https://www.fastighetsvarlden.se/arkivet"
-    RATE_LIMIT_DELAY = 2  # seconds between requests
+    RATE_LIMIT_DELAY = 2  # minimum seconds between requests to the host
     MAX_RETRIES = 3
     RETRY_DELAY = 5
+    ARTICLE_ID_PATTERN = r'/(?:notiser|nyheter|analys-fakta|portrattet)/[^"\'\s<>#?]+'
+    # Date section layout of the archive (see _extract_from_date_sections)
+    DATE_SECTION_TAGS = ('h2', 'h3', 'h4', 'p', 'div', 'li', 'ul')
+    DATE_SECTION_URL_PARTS = ('/notiser/', '/nyheter/', '/analys-fakta/', '/portrattet/')
+    DATE_HEADER_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+    DATE_HEADER_LENGTH = len('YYYY-MM-DD')
     
     def __init__(self, data_file = None):
         """
         Initialize scraper
         
         Args:
-            data_file: Path to JSON file for storing scraped data
+            data_file: Path to legacy JSON file imported into the article store
         """
         self.data_file = Path(data_file) if data_file else FASTIGHETSVARLDEN_DATA_FILE
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        self.fetcher = get_fetcher()
+        self.store = get_store()
         self.articles_data = self._load_existing_data()
-        self.article_urls: Set[str] = set(article['url'] for article in self.articles_data.get('articles', []))
+        self._saved_count = len(self.articles_data['articles'])
+        self._pending_validators = {}
+        self.article_urls: UrlIndex = self.store.url_index(self.SOURCE)
         
     def _load_existing_data(self) -> Dict:
-        """Load existing data from JSON file"""
-        if self.data_file.exists():
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(f"Loaded {len(data.get('articles', []))} existing articles")
-                    return data
-            except json.JSONDecodeError:
-                logger.warning("Corrupted JSON file, starting fresh")
-                return self._initialize_data_structure()
-        return self._initialize_data_structure()
+        """Load existing data from the article store"""
+        self.store.import_json_file(self.SOURCE, self.data_file)
+        data = self._initialize_data_structure()
+        data.update(self.store.get_source_meta(self.SOURCE))
+        # Only this run's new articles are kept in memory; known URLs
+        # are answered by the store's URL index (article_urls)
+        data['articles'] = []
+        logger.info(f"Found {self.store.count_articles(self.SOURCE)} existing articles")
+        return data
     
     def _initialize_data_structure(self) -> Dict:
         """Initialize the data structure"""
@@ -77,36 +92,53 @@ class FastighetsVarldenScraper:
         }
     
     def _save_data(self):
-        """Save data to JSON file"""
-        self.articles_data['total_articles'] = len(self.articles_data['articles'])
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.articles_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved {self.articles_data['total_articles']} articles to {self.data_file}")
+        """Save new articles and scrape metadata to the article store"""
+        new_articles = self.articles_data['articles'][self._saved_count:]
+        self.articles_data['total_articles'] = self.store.count_articles(self.SOURCE) + len(new_articles)
+        meta = {key: value for key, value in self.articles_data.items() if key != 'articles'}
+        with get_metrics().timer(self.SOURCE, 'save') as timer:
+            timer.articles = len(new_articles)
+            self.store.save_source(self.SOURCE, new_articles, meta, self._pending_validators)
+        self._pending_validators = {}
+        self._saved_count = len(self.articles_data['articles'])
+        logger.info(f"Saved {len(new_articles)} new articles ({self.articles_data['total_articles']} total) to {self.store.db_file}")
     
-    def _fetch_page(self, page_num: int) -> str:
+    def _fetch_page(self, page_num: int, conditional: bool = True) -> str:
         """
         Fetch a page with retry logic
         
         Args:
             page_num: Page number to fetch (1 for first page)
+            conditional: Send the stored ETag/Last-Modified and compare the
+                listed articles with the last saved scrape (otherwise the
+                page's validators aren't recorded either)
             
         Returns:
-            HTML content as string
+            HTML content as string, UNCHANGED if no articles were added,
+            or None on failure
         """
         if page_num == 1:
             url = self.BASE_URL
         else:
             url = f"{self.BASE_URL}/page/{page_num}/"
         
+        validators = self.store.get_http_validators(url) if conditional else {}
+        
         for attempt in range(self.MAX_RETRIES):
             try:
                 logger.info(f"Fetching page {page_num} (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                response = self.session.get(url, timeout=30)
+                response = self.fetcher.get(self.session, url, self.RATE_LIMIT_DELAY, source=self.SOURCE,
+                                            headers=conditional_headers(validators), timeout=30)
+                
+                if response.status_code == 304:
+                    logger.info(f"Page {page_num} not modified since last scrape")
+                    return UNCHANGED
                 response.raise_for_status()
                 
-                # Rate limiting
-                time.sleep(self.RATE_LIMIT_DELAY)
-                return response.text
+                if not conditional:
+                    return response.text
+                return check_listing(self.store, url, response, validators,
+                                     self.ARTICLE_ID_PATTERN, self._pending_validators)
                 
             except requests.RequestException as e:
                 logger.error(f"Error fetching page {page_num}: {e}")
@@ -117,6 +149,7 @@ class FastighetsVarldenScraper:
                     logger.error(f"Failed to fetch page {page_num} after {self.MAX_RETRIES} attempts")
                     return None
     
+    @timed_stage('parse')
     def _parse_page(self, html: str) -> List[Dict]:
         """
         Parse a page and extract articles
@@ -127,7 +160,7 @@ class FastighetsVarldenScraper:
         Returns:
             List of article dictionaries
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         articles = []
         
         # Primary method: Extract from date sections (most reliable for this site)
@@ -200,8 +233,17 @@ class FastighetsVarldenScraper:
             return None
     
     def _extract_from_date_sections(self, soup) -> List[Dict]:
-        """Extract articles organized by date sections"""
+        """
+        Extract articles organized by date sections
+        
+        Walks the content once in document order. An h2/h3/h4/p/div/li/ul
+        element whose text is a date (YYYY-MM-DD) is a date header, and the
+        article links in these elements get the date of the last header
+        before them. Each URL is returned once.
+        """
         articles = []
+        seen_urls = set()
+        current_date = None
         
         # Find main content area first
         main_content = soup.find(['main', 'div'], id=lambda x: x and 'content' in str(x).lower())
@@ -210,53 +252,72 @@ class FastighetsVarldenScraper:
         if not main_content:
             main_content = soup
         
-        # Find all elements that could be date headers or articles
-        all_elements = main_content.find_all(['h2', 'h3', 'h4', 'p', 'div', 'li', 'ul'])
-        
-        current_date = None
-        
-        for elem in all_elements:
-            # Get text content
-            elem_text = elem.get_text(strip=True)
+        def add_link(link):
+            title = link.get_text(strip=True)
+            url = link.get('href')
             
-            # Check if this element is a date header (format: YYYY-MM-DD)
-            date_match = re.match(r'^(\d{4})-(\d{2})-(\d{2})$', elem_text)
-            if date_match:
-                current_date = elem_text
-                logger.debug(f"Found date header: {current_date}")
-                continue
+            if not url or not title:
+                return
+            
+            # Make URL absolute
+            if url.startswith('/'):
+                url = f"https://www.fastighetsvarlden.se{url}"
             
-            # If we have a current date, look for article links in this element
-            if current_date:
-                # Find all links within this element
-                links = elem.find_all('a', href=True)
+            # Filter to only include article URLs (notiser, nyheter, analys-fakta, etc.)
+            # Exclude pagination and navigation links
+            if (url.startswith('https://www.fastighetsvarlden.se/') and
+                any(section in url for section in self.DATE_SECTION_URL_PARTS) and
+                '/page/' not in url and
+                '/arkivet/' not in url and
+                len(title) > 5 and  # Ensure title is substantial
+                url not in seen_urls):
                 
-                for link in links:
-                    title = link.get_text(strip=True)
-                    url = link.get('href')
-                    
-                    if not url or not title:
-                        continue
-                    
-                    # Make URL absolute
-                    if url.startswith('/'):
-                        url = f"https://www.fastighetsvarlden.se{url}"
-                    
-                    # Filter to only include article URLs (notiser, nyheter, analys-fakta, etc.)
-                    # Exclude pagination and navigation links
-                    if (url.startswith('https://www.fastighetsvarlden.se/') and
-                        any(section in url for section in ['/notiser/', '/nyheter/', '/analys-fakta/', '/portrattet/']) and
-                        '/page/' not in url and
-                        '/arkivet/' not in url and
-                        len(title) > 5):  # Ensure title is substantial
-                        
-                        articles.append({
-                            'title': title,
-                            'url': url,
-                            'date': current_date,
-                            'scraped_at': datetime.now().isoformat()
-                        })
-                        logger.debug(f"  - Added: {title} ({current_date})")
+                seen_urls.add(url)
+                articles.append({
+                    'title': title,
+                    'url': url,
+                    'date': current_date,
+                    'scraped_at': datetime.now().isoformat()
+                })
+                logger.debug(f"  - Added: {title} ({current_date})")
+        
+        def join_text(text, part):
+            # Only short texts can be date headers, longer ones aren't kept
+            if text is None or part is None:
+                return None
+            text += part
+            return text if len(text) <= self.DATE_HEADER_LENGTH else None
+        
+        # Explicit stack instead of recursion: html.parser nests unclosed
+        # tags, so the tree can be deeper than Python's recursion limit.
+        # Frame: [element, children iterator, inside a section, first article index, text]
+        stack = [[main_content, iter(main_content.children), False, 0, '']]
+        
+        while stack:
+            frame = stack[-1]
+            child = next(frame[1], None)
+            
+            if child is None:
+                # Element finished; its text decides whether it was a date header
+                elem, _, _, first_article, text = stack.pop()
+                if not stack:
+                    break
+                if text and elem.name in self.DATE_SECTION_TAGS and self.DATE_HEADER_PATTERN.match(text):
+                    # A link making up a date header's text isn't an article
+                    for article in articles[first_article:]:
+                        seen_urls.discard(article['url'])
+                    del articles[first_article:]
+                    current_date = text
+                    logger.debug(f"Found date header: {current_date}")
+                stack[-1][4] = join_text(stack[-1][4], text)
+            elif isinstance(child, str):
+                if not isinstance(child, Comment):
+                    frame[4] = join_text(frame[4], child.strip())
+            elif child.name not in ('script', 'style', 'template'):
+                in_section = frame[2] or child.name in self.DATE_SECTION_TAGS
+                if child.name == 'a' and in_section and current_date and child.get('href') is not None:
+                    add_link(child)
+                stack.append([child, iter(child.children), in_section, len(articles), ''])
         
         logger.info(f"Extracted {len(articles)} articles with dates")
         return articles
@@ -317,7 +378,7 @@ class FastighetsVarldenScraper:
     
     def _get_max_page_number(self, html: str) -> int:
         """Get the maximum page number from pagination"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # Look for pagination elements
         pagination = soup.find(['div', 'nav', 'ul'], class_=lambda x: x and any(
@@ -367,116 +428,66 @@ class FastighetsVarldenScraper:
         """
         Scrape all pages from the archive
         
+        Pages are fetched concurrently and checkpointed individually, so an
+        interrupted scrape resumes with the pages it hasn't completed and
+        retries the ones that failed.
+        
         Args:
             start_page: Page to start from (default: 1)
             end_page: Page to end at (default: None, will scrape until last page)
         """
         logger.info("Starting full archive scrape...")
         
-        # Get first page to determine total pages
-        first_page_html = self._fetch_page(start_page)
-        if not first_page_html:
-            logger.error("Failed to fetch first page")
+        backfill = ArchiveBackfill(self, on_progress=lambda status: logger.info(
+            f"Progress: {status['completed_pages']}/{status['total_pages']} pages, "
+            f"{status['failed_pages']} failed, {status['pages_per_min']} pages/min"
+        ))
+        try:
+            status = backfill.run(start_page, end_page)
+        except Exception as e:
+            logger.error(f"{e}")
             return
         
-        # Determine max page if not specified
-        if end_page is None:
-            max_page = self._get_max_page_number(first_page_html)
-            logger.info(f"Detected {max_page} total pages")
-            end_page = max_page
-        
-        # Process first page
-        logger.info(f"Processing page {start_page}")
-        articles = self._parse_page(first_page_html)
-        new_articles_count = 0
-        
-        for article in articles:
-            if not self._is_duplicate(article['url']):
-                self.articles_data['articles'].append(article)
-                self.article_urls.add(article['url'])
-                new_articles_count += 1
-        
-        logger.info(f"Page {start_page}: Found {len(articles)} articles, {new_articles_count} new")
-        
-        # Save after first page
-        self._save_data()
-        
-        # Process remaining pages
-        for page_num in range(start_page + 1, end_page + 1):
-            html = self._fetch_page(page_num)
-            if not html:
-                logger.warning(f"Skipping page {page_num} due to fetch error")
-                continue
-            
-            logger.info(f"Processing page {page_num}/{end_page}")
-            articles = self._parse_page(html)
-            new_articles_count = 0
-            
-            for article in articles:
-                if not self._is_duplicate(article['url']):
-                    self.articles_data['articles'].append(article)
-                    self.article_urls.add(article['url'])
-                    new_articles_count += 1
-            
-            logger.info(f"Page {page_num}: Found {len(articles)} articles, {new_articles_count} new")
-            
-            # Save every 10 pages
-            if page_num % 10 == 0:
-                self._save_data()
-                logger.info(f"Progress saved. Total articles: {len(self.articles_data['articles'])}")
-        
-        # Final save
-        self.articles_data['last_full_scrape'] = datetime.now().isoformat()
-        self._save_data()
-        logger.info(f"Full scrape completed! Total articles: {len(self.articles_data['articles'])}")
+        logger.info(f"Full scrape finished: {status['completed_pages']}/{status['total_pages']} pages, "
+                    f"{status['failed_pages']} queued for retry. Total articles: {len(self.article_urls)}")
     
-    def scrape_latest(self, max_pages: int = 5):
+    def scrape_latest(self, max_pages: int = INCREMENTAL_MAX_PAGES):
         """
         Scrape only the latest pages for daily updates
         
+        Reads archive pages until the newest article of the previous run
+        (the stored watermark) is reached.
+        
         Args:
-            max_pages: Maximum number of pages to check (default: 5)
+            max_pages: Maximum number of pages to check
         """
         logger.info("Starting incremental scrape for latest articles...")
         
         new_articles_count = 0
-        pages_checked = 0
-        pages_with_new_content = 0
         
-        for page_num in range(1, max_pages + 1):
-            html = self._fetch_page(page_num)
-            if not html:
-                continue
-            
-            pages_checked += 1
-            logger.info(f"Checking page {page_num} for new articles...")
-            articles = self._parse_page(html)
-            
-            page_new_count = 0
-            for article in articles:
-                if not self._is_duplicate(article['url']):
-                    self.articles_data['articles'].append(article)
-                    self.article_urls.add(article['url'])
-                    new_articles_count += 1
-                    page_new_count += 1
-            
-            if page_new_count > 0:
-                pages_with_new_content += 1
-                logger.info(f"Page {page_num}: Found {page_new_count} new articles")
-            else:
-                logger.info(f"Page {page_num}: No new articles found")
-                # If no new articles on this page, likely no new articles on next pages either
-                if page_num > 1:
-                    logger.info("No new articles found, stopping incremental scrape")
-                    break
+        html = self._fetch_page(1)
+        if html is UNCHANGED:
+            logger.info("Page 1: No new articles (listing unchanged)")
+            articles = []
+        elif not html:
+            logger.error("Failed to fetch page 1")
+            return
+        else:
+            articles = page_until_watermark(self, self._parse_page(html),
+                                            lambda page_num: self._fetch_page(page_num, False), max_pages)
+        
+        for article in articles:
+            if not self._is_duplicate(article['url']):
+                self.articles_data['articles'].append(article)
+                self.article_urls.add(article['url'])
+                new_articles_count += 1
         
         self.articles_data['last_incremental_scrape'] = datetime.now().isoformat()
         self._save_data()
         
         logger.info(f"Incremental scrape completed!")
-        logger.info(f"Pages checked: {pages_checked}")
         logger.info(f"New articles found: {new_articles_count}")
-        logger.info(f"Total articles in database: {len(self.articles_data['articles'])}")
+        logger.info(f"Total articles in database: {len(self.article_urls)}")
 
 
 def main():
@@ -492,8 +503,8 @@ def main():
     print()
     
     # Check if there's existing data
-    if scraper.articles_data['articles']:
-        print(f"Found existing data: {len(scraper.articles_data['articles'])} articles")
+    if scraper.article_urls:
+        print(f"Found existing data: {len(scraper.article_urls)} articles")
         response = input("Continue scraping from where you left off? (y/n): ")
         if response.lower() != 'y':
             print("Scraping cancelled.")
@@ -508,8 +519,8 @@ def main():
     print()
     print("=" * 60)
     print(f"Scraping completed in {elapsed_time/60:.2f} minutes")
-    print(f"Total articles scraped: {len(scraper.articles_data['articles'])}")
-    print(f"Data saved to: {scraper.data_file}")
+    print(f"Total articles scraped: {len(scraper.article_urls)}")
+    print(f"Data saved to: {scraper.store.db_file}")
     print("=" * 60)
 
 
@@ -0,0 +1,159 @@
+"""
+Fetch Engine
+Shared asyncio fetch loop used by all scrapers, with a token-bucket rate
+limiter per host instead of a fixed sleep after every request
+"""
+
+import asyncio
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+from metrics import get_metrics
+from config import FETCH_MAX_CONNECTIONS, HOST_BURST
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket limiting how often requests may be sent to one host"""
+
+    def __init__(self, interval: float, burst: int = 1):
+        """
+        Initialize bucket
+
+        Args:
+            interval: Seconds needed to earn one token (minimum spacing of requests)
+            burst: Maximum number of tokens that can be saved up
+        """
+        self.interval = interval
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the tokens earned since the last update"""
+        now = time.monotonic()
+        if self.interval > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+        else:
+            self.tokens = self.capacity
+        self.updated = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        # The lock keeps waiters in FIFO order so no request starves
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) * self.interval)
+                self._refill()
+            self.tokens -= 1
+
+
+class Fetcher:
+    """
+    Runs an asyncio event loop in a background thread and sends requests
+    through it, so requests to different hosts run concurrently while each
+    host is limited by its own token bucket.
+    """
+
+    def __init__(self, max_connections: int = FETCH_MAX_CONNECTIONS, burst: int = HOST_BURST):
+        """
+        Initialize fetcher
+
+        Args:
+            max_connections: Maximum number of requests in flight across all hosts
+            burst: Requests a host may receive back to back after being idle
+        """
+        self.burst = burst
+        self.buckets: Dict[str, TokenBucket] = {}
+        # requests is blocking, so responses are awaited on a thread pool
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix='fetch')
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='fetch-loop', daemon=True)
+        self._thread.start()
+
+    def _bucket(self, url: str, interval: float) -> TokenBucket:
+        """Get the token bucket of a URL's host (called on the loop thread)"""
+        host = urlsplit(url).netloc.lower()
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = self.buckets[host] = TokenBucket(interval, self.burst)
+        return bucket
+
+    async def fetch(self, session, url: str, interval: float, source: str = None, **kwargs):
+        """
+        Send a GET request once the host's rate limit allows it
+
+        Args:
+            session: requests.Session to send the request with
+            url: URL to fetch
+            interval: Minimum seconds between requests to the host
+            source: Source the timings are recorded under (default: the host)
+            kwargs: Extra arguments for session.get
+
+        Returns:
+            requests.Response
+        """
+        metrics = get_metrics()
+        source = source or urlsplit(url).netloc.lower()
+
+        started = time.perf_counter()
+        await self._bucket(url, interval).acquire()
+        sent = time.perf_counter()
+        metrics.record(source, 'fetch_wait', sent - started)
+
+        try:
+            response = await self._loop.run_in_executor(self._executor, lambda: session.get(url, **kwargs))
+        except Exception:
+            metrics.record(source, 'fetch_connect', time.perf_counter() - sent, error=True)
+            raise
+
+        # elapsed runs until the headers are parsed (DNS, connect, server time),
+        # the rest of the call is reading the body
+        total = time.perf_counter() - sent
+        connect = min(response.elapsed.total_seconds(), total)
+        metrics.record(source, 'fetch_connect', connect, error=response.status_code >= 400)
+        metrics.record(source, 'fetch_transfer', total - connect, bytes_in=len(response.content))
+        return response
+
+    def get(self, session, url: str, interval: float, source: str = None, **kwargs):
+        """
+        Blocking wrapper around fetch for the scrapers' _fetch_page
+
+        Returns:
+            requests.Response (request errors are raised as usual)
+        """
+        future = asyncio.run_coroutine_threadsafe(self.fetch(session, url, interval, source, **kwargs), self._loop)
+        return future.result()
+
+    def get_many(self, session, urls: List[str], interval: float, source: str = None, **kwargs) -> List:
+        """
+        Fetch several URLs concurrently, each within its host's rate limit
+
+        Returns:
+            List with a requests.Response or the raised exception per URL
+        """
+        async def fetch_all():
+            return await asyncio.gather(
+                *(self.fetch(session, url, interval, source, **kwargs) for url in urls),
+                return_exceptions=True
+            )
+        return asyncio.run_coroutine_threadsafe(fetch_all(), self._loop).result()
+
+
+_fetcher: Optional[Fetcher] = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher() -> Fetcher:
+    """Get the process-wide fetcher shared by all scrapers"""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = Fetcher()
+        return _fetcher
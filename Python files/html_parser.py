@@ -0,0 +1,257 @@
+"""
+HTML Parser Backends
+Builds the document tree used by the scrapers' _parse_page with the backend
+selected in config (PARSER_BACKEND):
+
+- 'html.parser': BeautifulSoup with Python's built-in parser (slowest)
+- 'lxml': BeautifulSoup with the lxml parser
+- 'fast': selectolax (lexbor) tree queried with CSS selectors, wrapped in the
+  small part of the BeautifulSoup API the scrapers use
+"""
+
+import json
+import logging
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup
+from config import PARSER_BACKEND
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'fast')
+
+# Text inside these tags isn't part of get_text() (same as BeautifulSoup)
+NON_TEXT_TAGS = ('script', 'style', 'template')
+NON_TEXT_SELECTOR = ', '.join(NON_TEXT_TAGS)
+
+
+def available_backends() -> List[str]:
+    """Backends that can be used with the installed packages"""
+    return [backend for backend in PARSER_BACKENDS if backend != 'fast' or LexborHTMLParser]
+
+
+def make_soup(html: str, backend: str = None):
+    """
+    Parse HTML with the configured backend
+
+    Args:
+        html: HTML content
+        backend: Backend name overriding PARSER_BACKEND
+
+    Returns:
+        BeautifulSoup document, or FastNode for the 'fast' backend
+    """
+    backend = backend or PARSER_BACKEND
+    if backend == 'fast':
+        if LexborHTMLParser:
+            return FastNode(LexborHTMLParser(html).root, document=True)
+        logger.warning("selectolax is not installed, using lxml parser instead")
+        backend = 'lxml'
+    return BeautifulSoup(html, backend)
+
+
+def _css_string(value: str) -> str:
+    """Quote a value for use in a CSS attribute selector"""
+    return json.dumps(value)
+
+
+def _attr_matches(value, matcher) -> bool:
+    """Match an attribute value the way BeautifulSoup's find does"""
+    if matcher is True:
+        return value is not None
+    if value is None:
+        return bool(callable(matcher) and matcher(None))
+    if callable(matcher):
+        return bool(matcher(value))
+    if hasattr(matcher, 'search'):
+        return matcher.search(value) is not None
+    return value == matcher
+
+
+class FastNode:
+    """
+    BeautifulSoup-like wrapper around a selectolax node
+
+    Supports find, find_all, find_parent, children, get, get_text, string,
+    name, attrs and has_attr with the same matching rules as BeautifulSoup.
+    Tag names, True and plain string attribute filters are turned into a
+    CSS selector; callables and regexes are applied to the selected nodes.
+    """
+
+    __slots__ = ('node', 'document', '_attrs')
+
+    def __init__(self, node, document: bool = False):
+        self.node = node
+        self.document = document
+        self._attrs = None
+
+    def __repr__(self):
+        return f"<FastNode {self.name}>"
+
+    def __eq__(self, other):
+        return isinstance(other, FastNode) and self.node.mem_id == other.node.mem_id
+
+    def __hash__(self):
+        return self.node.mem_id
+
+    @property
+    def name(self) -> str:
+        return '[document]' if self.document else self.node.tag
+
+    @property
+    def attrs(self) -> Dict:
+        """Attributes with 'class' split into a list, like BeautifulSoup"""
+        if self._attrs is None:
+            self._attrs = {}
+            for key, value in self.node.attributes.items():
+                value = value or ''
+                self._attrs[key] = value.split() if key == 'class' else value
+        return self._attrs
+
+    def get(self, key: str, default=None):
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key: str):
+        return self.attrs[key]
+
+    def has_attr(self, key: str) -> bool:
+        return key in self.attrs
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        """Text of all descendants, skipping comments and script/style contents"""
+        if not separator and self.node.css_first(NON_TEXT_SELECTOR) is None:
+            # Fast path: lexbor joins the text nodes itself
+            return self.node.text(deep=True, separator='', strip=strip)
+
+        parts = []
+        for child in self.node.traverse(include_text=True):
+            if not child.is_text_node or child.parent.tag in NON_TEXT_TAGS:
+                continue
+            text = child.text_content or ''
+            if strip:
+                text = text.strip()
+                if not text:
+                    continue
+            parts.append(text)
+        return separator.join(parts)
+
+    @property
+    def children(self):
+        """Child elements as FastNode and text nodes as str (comments skipped)"""
+        for child in self.node.iter(include_text=True):
+            if child.is_text_node:
+                yield child.text_content or ''
+            elif child.is_element_node:
+                yield FastNode(child)
+
+    @property
+    def string(self) -> Optional[str]:
+        """Text of the only child, like BeautifulSoup's Tag.string"""
+        child = self.node.child
+        if child is None or child.next is not None:
+            return None
+        if child.is_text_node:
+            return child.text_content
+        return FastNode(child).string
+
+    def _matches(self, node, names, attrs: Dict) -> bool:
+        """Check a node against a tag name filter and attribute filters"""
+        if names and node.tag not in names:
+            return False
+        if not attrs:
+            return True
+        wrapped = FastNode(node)
+        for key, matcher in attrs.items():
+            value = wrapped.attrs.get(key)
+            if key == 'class' and value is not None and not isinstance(matcher, str):
+                # Multi-valued: try each class, then the whole attribute
+                if any(_attr_matches(item, matcher) for item in value):
+                    continue
+                value = ' '.join(value)
+            elif key == 'class' and value is not None:
+                if matcher in value:
+                    continue
+                value = ' '.join(value)
+            if not _attr_matches(value, matcher):
+                return False
+        return True
+
+    @staticmethod
+    def _filters(name, attrs: Optional[Dict], kwargs: Dict):
+        """Split find() arguments into tag names and attribute filters"""
+        if isinstance(name, str):
+            names = (name,)
+        else:
+            names = tuple(name) if name else ()
+        filters = dict(attrs or {})
+        for key, value in kwargs.items():
+            filters['class' if key == 'class_' else key] = value
+        return names, filters
+
+    @staticmethod
+    def _selector(names, filters: Dict) -> str:
+        """Build the CSS selector for the parts of a filter CSS can express"""
+        conditions = ''
+        for key, matcher in filters.items():
+            if matcher is True:
+                conditions += f'[{key}]'
+            elif isinstance(matcher, str):
+                if key == 'class' and ' ' not in matcher:
+                    conditions += f'[class~={_css_string(matcher)}]'
+                else:
+                    conditions += f'[{key}={_css_string(matcher)}]'
+        return ', '.join(f'{tag}{conditions}' for tag in (names or ('*',)))
+
+    @staticmethod
+    def _python_filters(filters: Dict) -> Dict:
+        """Attribute filters the CSS selector can't express (callables, regexes)"""
+        return {key: matcher for key, matcher in filters.items()
+                if matcher is not True and not isinstance(matcher, str)}
+
+    def find_all(self, name=None, attrs: Dict = None, text=None, string=None, **kwargs) -> List:
+        """
+        Find all matching descendants in document order
+
+        Returns:
+            List of FastNode, or of strings when searching by text/string
+        """
+        text = text if text is not None else string
+        if text is not None:
+            return [
+                child.text_content for child in self.node.traverse(include_text=True)
+                if child.is_text_node and _attr_matches(child.text_content, text)
+            ]
+
+        names, filters = self._filters(name, attrs, kwargs)
+        checks = self._python_filters(filters)
+        results = []
+        for node in self.node.css(self._selector(names, filters)):
+            # css() also matches the node itself, find_all doesn't
+            if node.mem_id == self.node.mem_id:
+                continue
+            if not checks or self._matches(node, (), checks):
+                results.append(FastNode(node))
+        return results
+
+    def find(self, name=None, attrs: Dict = None, **kwargs) -> Optional['FastNode']:
+        """Find the first matching descendant"""
+        names, filters = self._filters(name, attrs, kwargs)
+        checks = self._python_filters(filters)
+        for node in self.node.css(self._selector(names, filters)):
+            if node.mem_id != self.node.mem_id and (not checks or self._matches(node, (), checks)):
+                return FastNode(node)
+        return None
+
+    def find_parent(self, name=None, attrs: Dict = None, **kwargs) -> Optional['FastNode']:
+        """Find the closest matching ancestor"""
+        names, filters = self._filters(name, attrs, kwargs)
+        node = self.node.parent
+        while node is not None and not node.is_document_node:
+            if self._matches(node, names, filters):
+                return FastNode(node)
+            node = node.parent
+        return None
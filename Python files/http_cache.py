@@ -0,0 +1,114 @@
+"""
+HTTP Cache Helpers
+Conditional requests and listing fingerprints used by the scrapers to skip
+listing pages that haven't changed since the last scrape
+"""
+
+import hashlib
+import re
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Matches every link on a page; used for listings where all links are articles
+ANY_LINK_PATTERN = r'href=["\']([^"\']+)'
+
+
+class _Unchanged(str):
+    """Empty (falsy) string marking a listing page that hasn't changed"""
+
+    def __repr__(self):
+        return 'UNCHANGED'
+
+
+# Returned by the scrapers' _fetch_page instead of HTML when the server
+# answered 304 or the page lists exactly the same articles as last time.
+# It is falsy, so code that only checks `if not html` treats it as
+# "nothing to parse".
+UNCHANGED = _Unchanged()
+
+
+def conditional_headers(validators: Dict) -> Dict:
+    """
+    Build conditional request headers from stored validators
+
+    Args:
+        validators: Dict with optional 'etag' and 'last_modified'
+
+    Returns:
+        Headers for requests.get
+    """
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+def listing_fingerprint(html: str, pattern: str) -> Optional[str]:
+    """
+    Fingerprint the articles listed on a page without parsing it
+
+    Args:
+        html: Raw HTML of a listing page
+        pattern: Regex whose matches (or first group) identify the articles
+
+    Returns:
+        Hex digest of the article identifiers, or None if none were found
+    """
+    matches = re.findall(pattern, html)
+    if not matches:
+        return None
+    identifiers = sorted(set(match if isinstance(match, str) else match[0] for match in matches))
+    return hashlib.sha1('\n'.join(identifiers).encode('utf-8')).hexdigest()
+
+
+def response_validators(response, fingerprint: Optional[str]) -> Dict:
+    """
+    Collect the validators to store for a fetched page
+
+    Args:
+        response: requests.Response of the page
+        fingerprint: Listing fingerprint of the page
+
+    Returns:
+        Dict with 'etag', 'last_modified' and 'fingerprint'
+    """
+    return {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'fingerprint': fingerprint
+    }
+
+
+def check_listing(store, url: str, response, validators: Dict, pattern: str, pending: Dict) -> str:
+    """
+    Decide whether a freshly fetched listing page needs to be parsed
+
+    Args:
+        store: ArticleStore holding the page validators
+        url: URL of the page
+        response: requests.Response of the page (status 200)
+        validators: Validators stored for the page before the request
+        pattern: Regex identifying the listed articles (see listing_fingerprint)
+        pending: Dict of validators waiting to be saved with the page's articles
+
+    Returns:
+        The page HTML, or UNCHANGED if it lists the same articles as last time
+    """
+    fingerprint = listing_fingerprint(response.text, pattern)
+    new_validators = response_validators(response, fingerprint)
+
+    if fingerprint and fingerprint == validators.get('fingerprint'):
+        # Same articles as the last saved scrape; refresh ETag/Last-Modified
+        # so the next request can be answered with a 304
+        store.set_http_validators(url, new_validators)
+        logger.info(f"Article list unchanged since last scrape: {url}")
+        return UNCHANGED
+
+    # Only committed once the page's articles are saved, so a failed
+    # scrape never causes the page to be skipped next time
+    pending[url] = new_validators
+    return response.text
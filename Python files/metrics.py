@@ -0,0 +1,178 @@
+"""
+Scrape Metrics
+Lightweight per-source timers and counters for each refresh stage (fetch
+wait/connect/transfer, parse, translate, save), summarised as p50/p95/max
+over a rolling window and written to METRICS_FILE
+"""
+
+import json
+import math
+import threading
+import time
+import logging
+from collections import deque
+from datetime import datetime
+from functools import wraps
+from typing import Dict, Optional
+from config import METRICS_FILE, METRICS_WINDOW
+
+logger = logging.getLogger(__name__)
+
+
+class StageStats:
+    """Timings of one stage of one source"""
+
+    def __init__(self, window: int):
+        self.durations = deque(maxlen=window)  # seconds, most recent runs only
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.bytes = 0
+        self.articles = 0
+
+    def add(self, seconds: float, bytes_in: int, articles: int, error: bool):
+        self.durations.append(seconds)
+        self.count += 1
+        self.errors += int(error)
+        self.total_seconds += seconds
+        self.bytes += bytes_in
+        self.articles += articles
+
+    def summary(self) -> Dict:
+        """p50/p95/max of the window plus lifetime counters"""
+        ordered = sorted(self.durations)
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'p50_ms': round(_percentile(ordered, 50) * 1000, 2),
+            'p95_ms': round(_percentile(ordered, 95) * 1000, 2),
+            'max_ms': round((ordered[-1] if ordered else 0) * 1000, 2),
+            'bytes': self.bytes,
+            'articles': self.articles,
+            'articles_per_sec': round(self.articles / self.total_seconds, 1) if self.total_seconds > 0 else 0.0
+        }
+
+
+def _percentile(ordered, percent: float) -> float:
+    """Nearest-rank percentile of a sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class StageTimer:
+    """Timer returned by Metrics.timer; set bytes/articles before it ends"""
+
+    def __init__(self, metrics: 'Metrics', source: str, stage: str):
+        self.metrics = metrics
+        self.source = source
+        self.stage = stage
+        self.bytes = 0
+        self.articles = 0
+        self.started = None
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.record(self.source, self.stage, time.perf_counter() - self.started,
+                            bytes_in=self.bytes, articles=self.articles, error=exc_type is not None)
+        return False
+
+
+class Metrics:
+    """Thread-safe collection of StageStats keyed by source and stage"""
+
+    def __init__(self, window: int = METRICS_WINDOW):
+        """
+        Initialize metrics
+
+        Args:
+            window: Number of recent timings kept per stage for the percentiles
+        """
+        self.window = window
+        self.stages: Dict[str, Dict[str, StageStats]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def record(self, source: str, stage: str, seconds: float,
+               bytes_in: int = 0, articles: int = 0, error: bool = False):
+        """
+        Record one timing
+
+        Args:
+            source: Source identifier (or host for requests without one)
+            stage: Stage name, e.g. 'fetch_transfer' or 'parse'
+            seconds: Duration of the stage
+            bytes_in: Bytes downloaded in the stage
+            articles: Articles handled in the stage
+            error: Whether the stage failed
+        """
+        with self._lock:
+            stats = self.stages.setdefault(source, {}).get(stage)
+            if stats is None:
+                stats = self.stages[source][stage] = StageStats(self.window)
+            stats.add(seconds, bytes_in, articles, error)
+
+    def timer(self, source: str, stage: str) -> StageTimer:
+        """Context manager timing a block as one stage run"""
+        return StageTimer(self, source, stage)
+
+    def summary(self) -> Dict:
+        """Summary of every source and stage"""
+        with self._lock:
+            sources = {
+                source: {stage: stats.summary() for stage, stats in sorted(stages.items())}
+                for source, stages in sorted(self.stages.items())
+            }
+        return {
+            'updated': datetime.now().isoformat(),
+            'window': self.window,
+            'sources': sources
+        }
+
+    def write_summary(self, path=None):
+        """Write the summary as JSON (replacing the previous one)"""
+        path = path or METRICS_FILE
+        # Sources finishing together must not share the temporary file
+        with self._write_lock:
+            try:
+                temp_path = path.with_suffix('.tmp')
+                temp_path.write_text(json.dumps(self.summary(), indent=2), encoding='utf-8')
+                temp_path.replace(path)
+            except OSError as e:
+                logger.warning(f"Could not write metrics summary: {e}")
+
+
+def timed_stage(stage: str):
+    """
+    Decorator timing a scraper method as a stage of the scraper's SOURCE
+
+    A list result is counted as the articles handled. Methods run in the
+    parse pool are recorded in the worker process and don't show up here.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with get_metrics().timer(self.SOURCE, stage) as timer:
+                result = method(self, *args, **kwargs)
+                if isinstance(result, list):
+                    timer.articles = len(result)
+                return result
+        return wrapper
+    return decorator
+
+
+_metrics: Optional[Metrics] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> Metrics:
+    """Get the process-wide metrics"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = Metrics()
+        return _metrics
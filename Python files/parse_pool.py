@@ -0,0 +1,68 @@
+"""
+Parse Pool
+Process pool that runs the scrapers' _parse_page on raw HTML, so parsing
+large listing pages doesn't hold the GIL in the app process
+"""
+
+import threading
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from config import PARSE_POOL_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def parse_html(scraper_class, html: str) -> List[Dict]:
+    """
+    Parse a page in a worker process
+
+    Args:
+        scraper_class: Scraper class whose _parse_page is used
+        html: Raw HTML of the page
+
+    Returns:
+        List of article dictionaries
+    """
+    # _parse_page needs no store or HTTP session, so skip __init__
+    scraper = scraper_class.__new__(scraper_class)
+    return scraper._parse_page(html)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared parse pool, started on first use
+
+    Returns:
+        ProcessPoolExecutor, or None when PARSE_POOL_SIZE is 0
+    """
+    global _pool
+    if PARSE_POOL_SIZE <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            logger.info(f"Starting parse pool with {PARSE_POOL_SIZE} processes")
+            _pool = ProcessPoolExecutor(max_workers=PARSE_POOL_SIZE)
+        return _pool
+
+
+def reset_parse_pool():
+    """Drop a broken pool so the next get_parse_pool starts a new one"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def shutdown_parse_pool():
+    """Stop the worker processes once a backfill is over (the next get_parse_pool starts new ones)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
@@ -0,0 +1,209 @@
+"""
+Parser Benchmark
+Times each scraper's _parse_page with every HTML parser backend on recorded
+listing pages, and checks that all backends extract identical articles
+
+Usage:
+    python parser_benchmark.py --record          # save the current listing pages
+    python parser_benchmark.py                   # benchmark the recorded pages
+    python parser_benchmark.py --check           # conformance check (exit code 1 on mismatch)
+    python parser_benchmark.py --date-sections   # old vs single-pass FV date section extraction
+"""
+
+import argparse
+import logging
+import re
+import sys
+import time
+import html_parser
+from fastighetsvarlden_scraper import FastighetsVarldenScraper
+from cision_scraper import CisionScraper
+from lokalguiden_scraper import LokalguidenScraper
+from di_scraper import DIScraper
+from fastighetsnytt_scraper import FastighetsnyttScraper
+from nordicpropertynews_scraper import NordicPropertyNewsScraper
+from fetcher import get_fetcher
+from config import DATA_DIR, ensure_data_directory
+
+RECORDED_PAGES_DIR = DATA_DIR / "recorded_pages"
+ARCHIVE_PAGES_RECORDED = 3  # Fastighetsvarlden archive pages saved by --record
+
+SCRAPERS = [
+    FastighetsVarldenScraper,
+    CisionScraper,
+    LokalguidenScraper,
+    DIScraper,
+    FastighetsnyttScraper,
+    NordicPropertyNewsScraper,
+]
+
+
+def record_pages():
+    """Download each source's listing page into RECORDED_PAGES_DIR"""
+    ensure_data_directory()
+    RECORDED_PAGES_DIR.mkdir(exist_ok=True)
+    for scraper_class in SCRAPERS:
+        scraper = scraper_class()
+        response = get_fetcher().get(scraper.session, scraper.BASE_URL, scraper.RATE_LIMIT_DELAY, timeout=30)
+        response.raise_for_status()
+        path = RECORDED_PAGES_DIR / f"{scraper.SOURCE}.html"
+        path.write_text(response.text, encoding='utf-8')
+        print(f"Recorded {scraper.BASE_URL} -> {path}")
+    
+    # Deeper archive pages for the date section benchmark
+    scraper = FastighetsVarldenScraper()
+    for page_num in range(2, ARCHIVE_PAGES_RECORDED + 1):
+        url = f"{scraper.BASE_URL}/page/{page_num}/"
+        response = get_fetcher().get(scraper.session, url, scraper.RATE_LIMIT_DELAY, timeout=30)
+        response.raise_for_status()
+        path = RECORDED_PAGES_DIR / f"{scraper.SOURCE}_page{page_num}.html"
+        path.write_text(response.text, encoding='utf-8')
+        print(f"Recorded {url} -> {path}")
+
+
+def parse_with(scraper, html: str, backend: str):
+    """Parse a page with a specific backend (restoring the configured one afterwards)"""
+    configured = html_parser.PARSER_BACKEND
+    html_parser.PARSER_BACKEND = backend
+    try:
+        return scraper._parse_page(html)
+    finally:
+        html_parser.PARSER_BACKEND = configured
+
+
+def comparable(articles):
+    """Article list without the fields that depend on when it was parsed"""
+    return [{key: value for key, value in article.items() if key != 'scraped_at'} for article in articles]
+
+
+def legacy_extract_from_date_sections(soup):
+    """
+    The date section extraction before the single-pass rewrite, kept as the
+    baseline: every candidate element re-reads its whole subtree
+    """
+    articles = []
+    main_content = soup.find(['main', 'div'], id=lambda x: x and 'content' in str(x).lower())
+    if not main_content:
+        main_content = soup.find(['main', 'div'], class_=lambda x: x and 'content' in str(x).lower())
+    if not main_content:
+        main_content = soup
+    
+    current_date = None
+    for elem in main_content.find_all(['h2', 'h3', 'h4', 'p', 'div', 'li', 'ul']):
+        elem_text = elem.get_text(strip=True)
+        if re.match(r'^(\d{4})-(\d{2})-(\d{2})$', elem_text):
+            current_date = elem_text
+            continue
+        if current_date:
+            for link in elem.find_all('a', href=True):
+                title = link.get_text(strip=True)
+                url = link.get('href')
+                if not url or not title:
+                    continue
+                if url.startswith('/'):
+                    url = f"https://www.fastighetsvarlden.se{url}"
+                if (url.startswith('https://www.fastighetsvarlden.se/') and
+                    any(section in url for section in ['/notiser/', '/nyheter/', '/analys-fakta/', '/portrattet/']) and
+                    '/page/' not in url and
+                    '/arkivet/' not in url and
+                    len(title) > 5):
+                    articles.append({'title': title, 'url': url, 'date': current_date})
+    return articles
+
+
+def benchmark_date_sections(repeat: int) -> int:
+    """
+    Time the old and the single-pass date section extraction on the
+    recorded Fastighetsvarlden pages
+
+    Returns:
+        Number of pages where the unique articles differ
+    """
+    scraper = FastighetsVarldenScraper.__new__(FastighetsVarldenScraper)
+    paths = sorted(RECORDED_PAGES_DIR.glob(f"{FastighetsVarldenScraper.SOURCE}*.html"))
+    if not paths:
+        print("No recorded Fastighetsvarlden pages (run with --record)")
+        return 0
+    
+    differences = 0
+    print(f"{'page':<32}{'backend':<13}{'before':>11}{'after':>11}{'links before':>14}{'after':>7}")
+    for path in paths:
+        html = path.read_text(encoding='utf-8')
+        for backend in html_parser.available_backends():
+            soup = html_parser.make_soup(html, backend)
+            
+            start = time.perf_counter()
+            for _ in range(repeat):
+                before = legacy_extract_from_date_sections(soup)
+            before_ms = (time.perf_counter() - start) / repeat * 1000
+            
+            start = time.perf_counter()
+            for _ in range(repeat):
+                after = scraper._extract_from_date_sections(soup)
+            after_ms = (time.perf_counter() - start) / repeat * 1000
+            
+            # The old version repeats links once per enclosing element
+            unique_before = list({article['url']: article['title'] for article in before}.items())
+            unique_after = [(article['url'], article['title']) for article in after]
+            if unique_before != unique_after:
+                differences += 1
+                print(f"{path.name:<32}{backend:<13}MISMATCH in extracted links")
+                continue
+            print(f"{path.name:<32}{backend:<13}{before_ms:>8.2f} ms{after_ms:>8.2f} ms{len(before):>14}{len(after):>7}")
+    return differences
+
+
+def main():
+    """Run the benchmark or conformance check"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--record', action='store_true', help="download the listing pages first")
+    parser.add_argument('--check', action='store_true', help="only check that all backends agree")
+    parser.add_argument('--date-sections', action='store_true',
+                        help="benchmark the Fastighetsvarlden date section extraction")
+    parser.add_argument('--repeat', type=int, default=20, help="parses per backend and page")
+    args = parser.parse_args()
+
+    if args.record:
+        record_pages()
+
+    # Keep per-article log lines out of the timings
+    logging.disable(logging.INFO)
+    if args.date_sections:
+        sys.exit(1 if benchmark_date_sections(args.repeat) else 0)
+    backends = html_parser.available_backends()
+    failures = 0
+
+    print(f"{'source':<22}" + ''.join(f"{backend:>14}" for backend in backends) + f"{'articles':>10}")
+    for scraper_class in SCRAPERS:
+        path = RECORDED_PAGES_DIR / f"{scraper_class.SOURCE}.html"
+        if not path.exists():
+            print(f"{scraper_class.SOURCE:<22}no recorded page (run with --record)")
+            continue
+        html = path.read_text(encoding='utf-8')
+        # Parsing needs no store or HTTP session
+        scraper = scraper_class.__new__(scraper_class)
+
+        results = {backend: comparable(parse_with(scraper, html, backend)) for backend in backends}
+        reference = results[backends[0]]
+        mismatched = [backend for backend in backends if results[backend] != reference]
+        if mismatched:
+            failures += 1
+            print(f"{scraper_class.SOURCE:<22}MISMATCH: {', '.join(mismatched)} differ from {backends[0]}")
+            continue
+        if args.check:
+            print(f"{scraper_class.SOURCE:<22}ok ({len(reference)} articles)")
+            continue
+
+        timings = []
+        for backend in backends:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                parse_with(scraper, html, backend)
+            timings.append((time.perf_counter() - start) / args.repeat * 1000)
+        print(f"{scraper_class.SOURCE:<22}" + ''.join(f"{ms:>11.2f} ms" for ms in timings) + f"{len(reference):>10}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
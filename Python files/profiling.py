@@ -0,0 +1,108 @@
+"""
+Profiling Hooks
+Opt-in cProfile and tracemalloc sessions around the scrape and query paths.
+Enabled with PROFILING_ENABLED in config or the NEWS_DASHBOARD_PROFILE=1
+environment variable; each profiled call writes timestamped reports to
+PROFILE_DIR (next to the app log).
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+import tracemalloc
+import logging
+from datetime import datetime
+from functools import wraps
+from config import PROFILING_ENABLED, PROFILE_DIR, PROFILE_TOP_N
+
+logger = logging.getLogger(__name__)
+
+# tracemalloc is process-wide, so it runs while any profiled call is active
+_tracing_users = 0
+_tracing_lock = threading.Lock()
+
+
+def _start_tracing():
+    global _tracing_users
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    global _tracing_users
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _write_reports(name: str, profiler, snapshot):
+    """
+    Write the profile and top allocations of one call
+
+    Args:
+        name: Name of the profiled function
+        profiler: Finished cProfile.Profile, or None if it couldn't run
+        snapshot: tracemalloc snapshot taken at the end of the call
+    """
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+
+    if profiler is not None:
+        profiler.dump_stats(str(PROFILE_DIR / f"{name}_{stamp}.prof"))
+        text = io.StringIO()
+        stats = pstats.Stats(profiler, stream=text).strip_dirs().sort_stats('cumulative')
+        stats.print_stats(PROFILE_TOP_N)
+        (PROFILE_DIR / f"{name}_{stamp}_profile.txt").write_text(text.getvalue(), encoding='utf-8')
+
+    lines = [f"Top {PROFILE_TOP_N} allocations still held at the end of {name}", ""]
+    for stat in snapshot.statistics('lineno')[:PROFILE_TOP_N]:
+        lines.append(str(stat))
+    current, peak = tracemalloc.get_traced_memory()
+    lines += ["", f"Traced memory: {current / 1024:.1f} KiB current, {peak / 1024:.1f} KiB peak"]
+    (PROFILE_DIR / f"{name}_{stamp}_allocations.txt").write_text('\n'.join(lines), encoding='utf-8')
+    logger.info(f"Wrote {name} profile reports to {PROFILE_DIR}")
+
+
+def profiled(name: str = None):
+    """
+    Decorator running a function under cProfile and tracemalloc when
+    profiling is enabled (otherwise the function is returned unchanged)
+
+    cProfile only sees the calling thread; work handed to thread pools
+    shows up as time spent waiting on their futures.
+
+    Args:
+        name: Report file prefix (default: the function name)
+    """
+    def decorator(func):
+        if not PROFILING_ENABLED:
+            return func
+        report_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError as e:
+                # Only one profiler can be active at a time (Python 3.12+)
+                logger.info(f"Not profiling {report_name}: {e}")
+                profiler = None
+            _start_tracing()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+                try:
+                    _write_reports(report_name, profiler, tracemalloc.take_snapshot())
+                except Exception as e:
+                    logger.warning(f"Could not write {report_name} profile reports: {e}")
+                finally:
+                    _stop_tracing()
+        return wrapper
+    return decorator
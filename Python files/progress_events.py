@@ -0,0 +1,90 @@
+"""
+Progress Events
+Single channel for pushing scraping progress to the UI: updates are
+coalesced, throttled to PROGRESS_PUSH_INTERVAL and sent as deltas holding
+only the fields that changed since the last event
+"""
+
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional
+from config import PROGRESS_PUSH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressPublisher:
+    """
+    Throttled, delta-based progress event sender
+
+    publish() may be called from any thread as often as the scrapers like.
+    The first update after a quiet period is sent at once; updates arriving
+    within the interval are merged and sent together when it ends, so the
+    UI always ends up with the latest state.
+    """
+
+    def __init__(self, send: Callable[[Dict], None], interval: float = PROGRESS_PUSH_INTERVAL):
+        """
+        Initialize publisher
+
+        Args:
+            send: Delivers one delta dict to the UI
+            interval: Minimum seconds between two events
+        """
+        self.send = send
+        self.interval = interval
+        self.sent_state: Dict = {}
+        self.pending_state: Optional[Dict] = None
+        self.last_sent = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Forget what was sent, so the next event carries the full state"""
+        with self._lock:
+            self.sent_state = {}
+
+    def publish(self, state: Dict, force: bool = False):
+        """
+        Queue a new progress state for the UI
+
+        Args:
+            state: Complete progress state (a copy the caller won't modify)
+            force: Send immediately, e.g. for completion and errors
+        """
+        with self._lock:
+            self.pending_state = state
+            wait = self.last_sent + self.interval - time.monotonic()
+            if force or wait <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(wait, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush(self):
+        """Send the pending state when the throttle interval has passed"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Send the changed fields of the pending state (lock must be held)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.pending_state is None:
+            return
+
+        state, self.pending_state = self.pending_state, None
+        delta = {key: value for key, value in state.items()
+                 if key not in self.sent_state or self.sent_state[key] != value}
+        self.sent_state = state
+        self.last_sent = time.monotonic()
+        if not delta:
+            return
+        try:
+            self.send(delta)
+        except Exception as e:
+            # A closed window must not stop the scrape
+            logger.warning(f"Could not send progress update: {e}")
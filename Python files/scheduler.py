@@ -0,0 +1,326 @@
+"""
+Headless Scheduler
+Long-running process that checks each source on its own interval (with
+jitter) and saves new articles to the same article store as the desktop
+app, so the archive stays warm without the Eel window open.
+
+With SCHEDULER_ADAPTIVE, each interval follows the source's publish rate
+(articles per hour, learned from the stored articles' published dates) and backs off
+while checks keep finding nothing.
+
+Usage:
+    python scheduler.py            # run until stopped (Ctrl+C)
+    python scheduler.py --once     # check every source once and exit
+    python scheduler.py --status   # print the running scheduler's status
+
+The scheduler's state is written to SCHEDULER_STATUS_FILE after every run.
+"""
+
+import argparse
+import json
+import os
+import random
+import signal
+import sys
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from article_store import get_store
+from metrics import get_metrics
+from config import (
+    SCHEDULER_INTERVALS,
+    SCHEDULER_DEFAULT_INTERVAL,
+    SCHEDULER_ADAPTIVE,
+    SCHEDULER_MIN_INTERVAL,
+    SCHEDULER_MAX_INTERVAL,
+    SCHEDULER_RATE_WINDOW,
+    SCHEDULER_TARGET_NEW_PER_RUN,
+    SCHEDULER_BACKOFF_FACTOR,
+    SCHEDULER_JITTER,
+    SCHEDULER_STATUS_FILE,
+    SCHEDULER_HEARTBEAT,
+    SCHEDULER_STATUS_STALE,
+    SCRAPE_MAX_WORKERS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SourceSchedule:
+    """When a source runs next and how its last runs went"""
+
+    def __init__(self, source: str, name: str, scrape_func: Callable[[], int], interval: float):
+        """
+        Initialize schedule
+
+        Args:
+            source: Source identifier
+            name: Display name
+            scrape_func: Runs one incremental scrape, returns the new article
+                count (raises if the source couldn't be scraped)
+            interval: Seconds between runs (before jitter), the starting
+                point when intervals are adaptive
+        """
+        self.source = source
+        self.name = name
+        self.scrape_func = scrape_func
+        self.interval = interval
+        self.rate_per_hour = None
+        self.empty_runs = 0
+        self.next_run = time.time()
+        self.last_run = None
+        self.last_duration = None
+        self.last_new_articles = None
+        self.last_error = None
+        self.runs = 0
+        self.running = False
+
+    def adapt(self, new_articles: int, rate_per_hour: float):
+        """
+        Set the interval from the publish rate and the last run's result
+
+        The interval aims for SCHEDULER_TARGET_NEW_PER_RUN new articles per
+        check, and grows by SCHEDULER_BACKOFF_FACTOR for every consecutive
+        check that found nothing (or failed).
+
+        Args:
+            new_articles: New articles found by the last run
+            rate_per_hour: Articles published per hour over SCHEDULER_RATE_WINDOW
+        """
+        self.rate_per_hour = rate_per_hour
+        self.empty_runs = 0 if new_articles else self.empty_runs + 1
+
+        if rate_per_hour > 0:
+            interval = 3600 * SCHEDULER_TARGET_NEW_PER_RUN / rate_per_hour
+        else:
+            interval = SCHEDULER_MAX_INTERVAL
+        interval *= SCHEDULER_BACKOFF_FACTOR ** self.empty_runs
+        self.interval = min(max(interval, SCHEDULER_MIN_INTERVAL), SCHEDULER_MAX_INTERVAL)
+
+    def reschedule(self):
+        """Set the next run one interval (+/- jitter) from now"""
+        jitter = random.uniform(-SCHEDULER_JITTER, SCHEDULER_JITTER)
+        self.next_run = time.time() + self.interval * (1 + jitter)
+
+    def status(self) -> Dict:
+        """Status for the status file"""
+        return {
+            'name': self.name,
+            'interval': round(self.interval),
+            'rate_per_hour': round(self.rate_per_hour, 2) if self.rate_per_hour is not None else None,
+            'empty_runs': self.empty_runs,
+            'next_run': datetime.fromtimestamp(self.next_run).isoformat(),
+            'last_run': datetime.fromtimestamp(self.last_run).isoformat() if self.last_run else None,
+            'last_duration': round(self.last_duration, 2) if self.last_duration is not None else None,
+            'last_new_articles': self.last_new_articles,
+            'last_error': self.last_error,
+            'runs': self.runs,
+            'running': self.running
+        }
+
+
+class Scheduler:
+    """
+    Runs due sources on a thread pool; each source is rescheduled when its
+    run finishes, so a slow source never delays the others.
+    """
+
+    def __init__(self, schedules: List[SourceSchedule], max_workers: int = SCRAPE_MAX_WORKERS):
+        """
+        Initialize scheduler
+
+        Args:
+            schedules: One SourceSchedule per source
+            max_workers: Maximum number of sources scraped at the same time
+        """
+        self.schedules = schedules
+        self.max_workers = max_workers
+        self.started = None
+        self.status_written = 0.0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def stop(self):
+        """Ask the run loop to finish after the runs in progress"""
+        self._stop.set()
+
+    def run(self, once: bool = False):
+        """
+        Run until stopped
+
+        Args:
+            once: Run every source a single time and return
+        """
+        self.started = time.time()
+        logger.info(f"Scheduler started for {len(self.schedules)} sources")
+        self._write_status()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if once:
+                list(executor.map(self._run_source, self.schedules))
+                self._stop.set()
+
+            while not self._stop.is_set():
+                now = time.time()
+                with self._lock:
+                    due = [schedule for schedule in self.schedules
+                           if not schedule.running and schedule.next_run <= now]
+                    for schedule in due:
+                        schedule.running = True
+                for schedule in due:
+                    executor.submit(self._run_source, schedule)
+
+                with self._lock:
+                    waiting = [schedule.next_run for schedule in self.schedules if not schedule.running]
+                # Wake up for the next due source (or to see finished runs)
+                delay = min(waiting, default=now + 1) - time.time()
+                self._stop.wait(min(max(delay, 0.5), SCHEDULER_HEARTBEAT))
+
+                # Keep the status file fresh so the app knows the scheduler is alive
+                if time.time() - self.status_written >= SCHEDULER_HEARTBEAT:
+                    self._write_status()
+
+        logger.info("Scheduler stopped")
+        self._write_status()
+
+    def _run_source(self, schedule: SourceSchedule):
+        """Scrape one source and schedule its next run"""
+        schedule.running = True
+        started = time.time()
+        try:
+            schedule.last_new_articles = schedule.scrape_func()
+            schedule.last_error = None
+            logger.info(f"Scheduler: {schedule.name} found {schedule.last_new_articles} new articles")
+        except Exception as e:
+            logger.error(f"Scheduler: error scraping {schedule.name}: {e}", exc_info=True)
+            schedule.last_new_articles = 0
+            schedule.last_error = str(e)
+
+        rate_per_hour = self._publish_rate(schedule.source) if SCHEDULER_ADAPTIVE else None
+
+        with self._lock:
+            schedule.last_run = started
+            schedule.last_duration = time.time() - started
+            schedule.runs += 1
+            schedule.running = False
+            if rate_per_hour is not None:
+                schedule.adapt(schedule.last_new_articles, rate_per_hour)
+            schedule.reschedule()
+        if rate_per_hour is not None:
+            logger.info(f"Scheduler: {schedule.name} publishes {rate_per_hour:.2f} articles/hour, "
+                        f"next check in {schedule.interval / 60:.0f} min")
+        self._write_status()
+        get_metrics().write_summary()
+
+    def _publish_rate(self, source: str) -> Optional[float]:
+        """
+        Articles per hour a source published over SCHEDULER_RATE_WINDOW
+
+        Published dates are whole days, so the window starts at midnight.
+
+        Returns:
+            Rate, or None if the store could not be read
+        """
+        now = datetime.now()
+        try:
+            since = (now - timedelta(hours=SCHEDULER_RATE_WINDOW)).date().isoformat()
+            count, earliest = get_store().publish_history(source, since)
+            # A source with less history than the window is measured over what it has
+            start = max(since, earliest or since)
+            hours = max((now - datetime.fromisoformat(start)).total_seconds() / 3600, 1)
+            return count / hours
+        except Exception as e:
+            logger.warning(f"Scheduler: could not read the {source} publish rate: {e}")
+            return None
+
+    def _write_status(self):
+        """Write the status file (replaced atomically so readers never see half of it)"""
+        with self._lock:
+            status = {
+                'pid': os.getpid(),
+                'started': datetime.fromtimestamp(self.started).isoformat() if self.started else None,
+                'updated': datetime.now().isoformat(),
+                'stopping': self._stop.is_set(),
+                'sources': {schedule.source: schedule.status() for schedule in self.schedules}
+            }
+            try:
+                temp_path = SCHEDULER_STATUS_FILE.with_suffix('.tmp')
+                temp_path.write_text(json.dumps(status, indent=2), encoding='utf-8')
+                temp_path.replace(SCHEDULER_STATUS_FILE)
+                self.status_written = time.time()
+            except OSError as e:
+                logger.warning(f"Could not write scheduler status: {e}")
+
+
+def read_status() -> Optional[Dict]:
+    """
+    Read the scheduler status file
+
+    Returns:
+        Status dict, or None if no scheduler has written one
+    """
+    try:
+        return json.loads(SCHEDULER_STATUS_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def is_scheduler_active() -> bool:
+    """Whether a scheduler has written its status within SCHEDULER_STATUS_STALE seconds"""
+    try:
+        age = time.time() - SCHEDULER_STATUS_FILE.stat().st_mtime
+    except OSError:
+        return False
+    status = read_status()
+    return age <= SCHEDULER_STATUS_STALE and bool(status) and not status.get('stopping')
+
+
+def build_schedules() -> List[SourceSchedule]:
+    """One schedule per source the desktop app checks, with the configured intervals"""
+    # Imported here: app sets up logging, the store and the translator
+    import app
+    return [
+        SourceSchedule(
+            app.SOURCE_IDS[name],
+            name,
+            scrape_func,
+            SCHEDULER_INTERVALS.get(app.SOURCE_IDS[name], SCHEDULER_DEFAULT_INTERVAL)
+        )
+        for name, scrape_func in app.SCRAPE_SOURCES
+    ]
+
+
+def main():
+    """Run the scheduler from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--once', action='store_true', help="check every source once and exit")
+    parser.add_argument('--status', action='store_true', help="print the scheduler status and exit")
+    args = parser.parse_args()
+
+    if args.status:
+        status = read_status()
+        if not status:
+            print("No scheduler status found")
+            sys.exit(1)
+        print(json.dumps(status, indent=2))
+        print(f"Active: {is_scheduler_active()}")
+        return
+
+    scheduler = Scheduler(build_schedules())
+    if is_scheduler_active():
+        logger.warning(f"Another scheduler updated {SCHEDULER_STATUS_FILE} recently, both will scrape")
+
+    def handle_signal(signum, frame):
+        logger.info("Stopping scheduler...")
+        scheduler.stop()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+    scheduler.run(once=args.once)
+
+
+if __name__ == "__main__":
+    main()
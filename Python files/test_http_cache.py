@@ -0,0 +1,84 @@
+"""
+HTTP Cache Tests
+A scrape that finds the listing unchanged (304, or the same articles listed)
+must still record the scrape and the page's validators
+
+Usage:
+    python -m pytest test_http_cache.py
+"""
+
+import hashlib
+from pathlib import Path
+import pytest
+import requests
+import article_store
+from article_store import ArticleStore
+from fastighetsnytt_scraper import FastighetsnyttScraper
+from lokalguiden_scraper import LokalguidenScraper
+from nordicpropertynews_scraper import NordicPropertyNewsScraper
+
+FIXTURE_PAGES_DIR = Path(__file__).parent / "fixtures" / "pages"
+
+SCRAPERS = [LokalguidenScraper, FastighetsnyttScraper, NordicPropertyNewsScraper]
+
+
+class FakeResponse:
+    """The parts of requests.Response the scrapers use"""
+
+    def __init__(self, status_code: int, text: str = '', etag: str = None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = {'ETag': etag} if etag else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSite:
+    """Serves a fixture page as the listing, with or without ETags"""
+
+    def __init__(self, listing_url: str, html: str, send_etag: bool):
+        self.listing_url = listing_url
+        self.html = html
+        self.send_etag = send_etag
+        self.not_modified = 0
+
+    def get(self, session, url, delay, source=None, headers=None, timeout=None):
+        if url != self.listing_url:
+            # Deeper listing pages are empty
+            return FakeResponse(200, '<html><body></body></html>')
+        etag = hashlib.sha1(self.html.encode('utf-8')).hexdigest() if self.send_etag else None
+        if etag and headers and headers.get('If-None-Match') == etag:
+            self.not_modified += 1
+            return FakeResponse(304)
+        return FakeResponse(200, self.html, etag)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Fresh article store used by the scrapers"""
+    store = ArticleStore(tmp_path / "articles.db")
+    monkeypatch.setattr(article_store, '_store', store)
+    yield store
+    store.close()
+
+
+@pytest.mark.parametrize('send_etag', [True, False], ids=['304', 'fingerprint'])
+@pytest.mark.parametrize('scraper_class', SCRAPERS, ids=lambda scraper_class: scraper_class.SOURCE)
+def test_unchanged_listing_records_scrape(store, tmp_path, scraper_class, send_etag):
+    html = (FIXTURE_PAGES_DIR / f"{scraper_class.SOURCE}.html").read_text(encoding='utf-8')
+    site = FakeSite(scraper_class.BASE_URL, html, send_etag)
+
+    def scrape():
+        scraper = scraper_class(tmp_path / f"{scraper_class.SOURCE}.json")
+        scraper.fetcher = site
+        return scraper.scrape_latest()
+
+    assert scrape() > 0
+    first_scrape = store.get_source_meta(scraper_class.SOURCE)['last_scrape']
+    assert store.get_http_validators(scraper_class.BASE_URL)
+
+    assert scrape() == 0
+    assert site.not_modified == (1 if send_etag else 0)
+    assert store.get_source_meta(scraper_class.SOURCE)['last_scrape'] > first_scrape
@@ -0,0 +1,150 @@
+"""
+Parser Backend Tests
+Every available HTML parser backend must extract the same articles from the
+fixture listing pages, and FastNode must answer the BeautifulSoup calls the
+scrapers make the same way BeautifulSoup does
+
+Usage:
+    python -m pytest test_parsers.py
+"""
+
+import re
+from pathlib import Path
+import pytest
+from bs4 import Comment
+import html_parser
+from html_parser import available_backends, make_soup
+from fastighetsvarlden_scraper import FastighetsVarldenScraper
+from parser_benchmark import SCRAPERS, comparable, legacy_extract_from_date_sections, parse_with
+
+FIXTURE_PAGES_DIR = Path(__file__).parent / "fixtures" / "pages"
+
+needs_fast = pytest.mark.skipif('fast' not in available_backends(), reason="selectolax is not installed")
+
+SNIPPET = """
+<html><body>
+<div id="content" class="main wide" data-id="7">
+  <h2 class="title headline">Rubrik <b>ett</b></h2>
+  <!-- kommentar -->
+  <ul>
+    <li class="item"><a href="/notiser/a/">Notis A</a> text</li>
+    <li class="item first"><a href="/nyheter/b/" class="link">Nyhet B</a></li>
+    <li><a name="anchor">Ankare</a><span class="date">2025-10-09</span></li>
+  </ul>
+  <p>Sida <span>1</span> av <span>12</span></p>
+  <script>var skip = "<a href='/script/'>x</a>";</script>
+  <time class="date published" datetime="2025-10-08">8 okt</time>
+</div>
+</body></html>
+"""
+
+
+def describe(result):
+    """Backend-independent view of a find()/find_all() result"""
+    if result is None or isinstance(result, str):
+        return result
+    if isinstance(result, list):
+        return [describe(item) for item in result]
+    return (result.name, dict(result.attrs), result.get_text(strip=True))
+
+
+@pytest.mark.parametrize('scraper_class', SCRAPERS, ids=lambda scraper_class: scraper_class.SOURCE)
+def test_backends_extract_identical_articles(scraper_class):
+    html = (FIXTURE_PAGES_DIR / f"{scraper_class.SOURCE}.html").read_text(encoding='utf-8')
+    # Parsing needs no store or HTTP session
+    scraper = scraper_class.__new__(scraper_class)
+
+    backends = available_backends()
+    results = {backend: comparable(parse_with(scraper, html, backend)) for backend in backends}
+    assert results[backends[0]]
+    for backend in backends[1:]:
+        assert results[backend] == results[backends[0]], f"{backend} differs from {backends[0]}"
+
+
+@pytest.mark.parametrize('backend', available_backends())
+@pytest.mark.parametrize('page', ['fastighetsvarlden.html', 'fastighetsvarlden_archive.html'])
+def test_date_sections_match_legacy_extraction(page, backend):
+    soup = make_soup((FIXTURE_PAGES_DIR / page).read_text(encoding='utf-8'), backend)
+    scraper = FastighetsVarldenScraper.__new__(FastighetsVarldenScraper)
+
+    # The legacy walk repeats a link once per enclosing element, first with its date
+    legacy = {}
+    for article in legacy_extract_from_date_sections(soup):
+        legacy.setdefault(article['url'], article['date'])
+    extracted = [(article['url'], article['date']) for article in scraper._extract_from_date_sections(soup)]
+    assert extracted
+    assert extracted == list(legacy.items())
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_date_header_link_is_not_an_article(backend):
+    html = """<main id="content"><h3>2025-10-01</h3><ul>
+        <li><a href="/notiser/forsta/">Första notisen</a></li>
+        <li><a href="/notiser/2025-09-30/">2025-09-30</a></li>
+        <li><a href="/notiser/andra/">Andra notisen</a></li></ul></main>"""
+    scraper = FastighetsVarldenScraper.__new__(FastighetsVarldenScraper)
+    articles = scraper._extract_from_date_sections(make_soup(html, backend))
+    assert [(article['url'].rsplit('/', 2)[1], article['date']) for article in articles] == [
+        ('forsta', '2025-10-01'), ('andra', '2025-09-30')]
+
+
+def test_parse_with_restores_configured_backend():
+    configured = html_parser.PARSER_BACKEND
+    scraper_class = SCRAPERS[0]
+    parse_with(scraper_class.__new__(scraper_class), '<html></html>', 'lxml')
+    assert html_parser.PARSER_BACKEND == configured
+
+
+@needs_fast
+@pytest.mark.parametrize('query', [
+    lambda soup: soup.find_all('li'),
+    lambda soup: soup.find_all(['h2', 'time']),
+    lambda soup: soup.find_all('li', class_='item'),
+    lambda soup: soup.find_all(class_='date'),
+    lambda soup: soup.find_all('a', href=True),
+    lambda soup: soup.find_all('a', href=lambda x: x and '/nyheter/' in x),
+    lambda soup: soup.find_all('a', href=re.compile(r'^/notiser/')),
+    lambda soup: soup.find_all('div', class_='main wide', attrs={'data-id': True}),
+    lambda soup: soup.find_all('div', class_='wide main'),
+    lambda soup: soup.find(['main', 'div'], id=lambda x: x and 'content' in str(x).lower()),
+    lambda soup: soup.find(['h2', 'h3'], class_=lambda x: x and 'headline' in str(x).lower()),
+    lambda soup: soup.find('time', class_='published'),
+    lambda soup: soup.find('section'),
+    lambda soup: soup.find('p').find_all(text=re.compile(r'\d+')),
+    lambda soup: soup.find('p').find_all(string='Sida '),
+    lambda soup: soup.find('b').find_parent('h2', class_='title'),
+    lambda soup: soup.find('a', class_='link').find_parent(),
+    lambda soup: soup.find('a', class_='link').find_parent('li', class_=lambda x: x and 'first' in x),
+    lambda soup: soup.find('span').find_parent('table'),
+])
+def test_fast_node_find_matches_beautifulsoup(query):
+    assert describe(query(make_soup(SNIPPET, 'fast'))) == describe(query(make_soup(SNIPPET, 'html.parser')))
+
+
+@needs_fast
+def test_fast_node_text_and_attributes_match_beautifulsoup():
+    for backend_soup in (make_soup(SNIPPET, 'fast'), make_soup(SNIPPET, 'html.parser')):
+        content = backend_soup.find('div', id='content')
+        time_elem = content.find('time')
+        assert content.get('class') == ['main', 'wide']
+        assert content.get('missing', 'default') == 'default'
+        assert time_elem.has_attr('datetime') and time_elem['datetime'] == '2025-10-08'
+        assert not content.has_attr('href')
+        # Script contents and comments aren't text
+        assert 'skip' not in content.get_text()
+        assert 'kommentar' not in content.get_text()
+        assert content.find('h2').get_text(' ', strip=True) == 'Rubrik ett'
+        assert content.find('a').string == 'Notis A'
+        assert content.find('h2').string is None
+        assert content.find('span', class_='date').string == '2025-10-09'
+
+
+@needs_fast
+def test_fast_node_children_match_beautifulsoup():
+    def child_view(soup):
+        # BeautifulSoup also yields comments, FastNode skips them
+        content = soup.find('div', id='content')
+        return [child.strip() if isinstance(child, str) else child.name
+                for child in content.children if not isinstance(child, Comment)]
+
+    assert child_view(make_soup(SNIPPET, 'fast')) == child_view(make_soup(SNIPPET, 'html.parser'))
@@ -0,0 +1,121 @@
+"""
+Watermark Tests
+Incremental scrapes against a fake Cision listing: a run that fails part-way
+must leave the gap for the next run to fill
+
+Usage:
+    python -m pytest test_watermark.py
+"""
+
+import hashlib
+import re
+import pytest
+import requests
+import article_store
+from article_store import ArticleStore
+from cision_scraper import CisionScraper
+
+PAGE_SIZE = 10
+
+
+class FakeResponse:
+    """The parts of requests.Response the scrapers use"""
+
+    def __init__(self, status_code: int, text: str = '', etag: str = None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = {'ETag': etag} if etag else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeListing:
+    """Cision listing served page by page, newest first, with ETags"""
+
+    def __init__(self):
+        self.articles = []  # (id, date), newest first
+        self.failing_pages = set()
+        self.requested_pages = []
+
+    def publish(self, count: int, day: str):
+        start = len(self.articles)
+        self.articles = [(f"a{start + offset}", day) for offset in reversed(range(count))] + self.articles
+
+    def page_html(self, page_num: int) -> str:
+        cards = ''.join(
+            f'<div class="card-item"><article><a class="bodytext content" href="/news/{article_id}">'
+            f'<h2>Title {article_id}</h2><time datetime="{day}T06:00:00Z"></time></a></article></div>'
+            for article_id, day in self.articles[(page_num - 1) * PAGE_SIZE:page_num * PAGE_SIZE]
+        )
+        return f"<html><body>{cards}</body></html>"
+
+    def get(self, session, url, delay, source=None, headers=None, timeout=None):
+        page_num = int(re.search(r'pageIx=(\d+)', url).group(1))
+        self.requested_pages.append(page_num)
+        if page_num in self.failing_pages:
+            raise requests.ConnectionError(f"page {page_num} unavailable")
+        html = self.page_html(page_num)
+        etag = hashlib.sha1(html.encode('utf-8')).hexdigest()
+        if headers and headers.get('If-None-Match') == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, html, etag)
+
+
+@pytest.fixture
+def listing(tmp_path, monkeypatch):
+    """Fake listing with a fresh article store"""
+    store = ArticleStore(tmp_path / "articles.db")
+    monkeypatch.setattr(article_store, '_store', store)
+    monkeypatch.setattr(CisionScraper, 'RETRY_DELAY', 0)
+    yield FakeListing()
+    store.close()
+
+
+def scrape(listing, tmp_path) -> CisionScraper:
+    """Run one incremental scrape against the fake listing"""
+    scraper = CisionScraper(tmp_path / "cision.json")
+    scraper.fetcher = listing
+    scraper.scrape_latest()
+    return scraper
+
+
+def stored_urls(scraper):
+    return {article['url'] for article in scraper.store.load_articles(scraper.SOURCE)}
+
+
+def expected_urls(listing):
+    return {f"https://news.cision.com/news/{article_id}" for article_id, _ in listing.articles}
+
+
+@pytest.mark.parametrize('with_watermark', [True, False])
+def test_failed_page_is_filled_by_next_run(listing, tmp_path, with_watermark):
+    listing.publish(PAGE_SIZE, '2025-10-01')
+    if with_watermark:
+        # First run stores the front page and sets the watermark
+        scraper = scrape(listing, tmp_path)
+        assert scraper.articles_data.get('watermark')
+    else:
+        # Articles stored before the source had a watermark
+        scraper = CisionScraper(tmp_path / "cision.json")
+        scraper.fetcher = listing
+        scraper.store.insert_articles(scraper.SOURCE, scraper._parse_page(listing.page_html(1)))
+
+    # Two and a half pages published between runs; page 2 fails once
+    listing.publish(2 * PAGE_SIZE + 5, '2025-10-09')
+    listing.failing_pages = {2}
+    scraper = scrape(listing, tmp_path)
+    assert len(stored_urls(scraper)) < len(listing.articles)
+
+    listing.failing_pages = set()
+    listing.requested_pages = []
+    scraper = scrape(listing, tmp_path)
+    assert listing.requested_pages[:3] == [1, 2, 3]
+    assert stored_urls(scraper) == expected_urls(listing)
+    assert not scraper.articles_data.get('listing_incomplete')
+
+    # Caught up: the next run stops at the unchanged front page
+    listing.requested_pages = []
+    scrape(listing, tmp_path)
+    assert listing.requested_pages == [1]
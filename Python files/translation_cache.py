@@ -0,0 +1,166 @@
+"""
+Translation Cache
+Disk-backed cache of title translations, consulted before any remote call
+
+Lookups never write: the last-used times of hits are collected in memory
+and written in one batch with the next put, flush or close.
+"""
+
+import sqlite3
+import threading
+import time
+import unicodedata
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from config import TRANSLATION_CACHE_FILE, TRANSLATION_CACHE_MAX_ENTRIES, ensure_data_directory
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    text TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (source_lang, target_lang, text)
+);
+CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Normalize source text so equivalent titles share a cache entry"""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+class TranslationCache:
+    """Size-bounded, least-recently-used translation cache stored in SQLite"""
+
+    def __init__(self, cache_file = None, max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES):
+        """
+        Initialize cache
+
+        Args:
+            cache_file: Path to the SQLite cache file
+            max_entries: Maximum number of cached translations before eviction
+        """
+        ensure_data_directory()
+        self.cache_file = Path(cache_file) if cache_file else TRANSLATION_CACHE_FILE
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (source_lang, target_lang, text) -> last hit time, not yet written
+        self._touched: Dict[Tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+        with self._lock, self.conn:
+            self.conn.executescript(SCHEMA)
+            # Kept up to date by put and _evict, so eviction never counts the table
+            self.size = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def get(self, text: str, source_lang: str = 'auto', target_lang: str = 'en') -> Optional[str]:
+        """
+        Look up a cached translation
+
+        Args:
+            text: Source text
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Cached translation, or None on a miss
+        """
+        key = (source_lang, target_lang, normalize_text(text))
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT translation FROM translations WHERE source_lang = ? AND target_lang = ? AND text = ?",
+                key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+        return row[0]
+
+    def put(self, text: str, translation: str, source_lang: str = 'auto', target_lang: str = 'en'):
+        """
+        Store a translation, evicting the least recently used entries if full
+
+        Args:
+            text: Source text
+            translation: Translated text
+            source_lang: Source language code
+            target_lang: Target language code
+        """
+        key = (source_lang, target_lang, normalize_text(text))
+        with self._lock, self.conn:
+            self._flush_touched()
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO translations (source_lang, target_lang, text, translation, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                key + (translation, time.time())
+            )
+            if cursor.rowcount > 0:
+                self.size += 1
+            else:
+                self.conn.execute(
+                    "UPDATE translations SET translation = ?, last_used = ? "
+                    "WHERE source_lang = ? AND target_lang = ? AND text = ?",
+                    (translation, time.time()) + key
+                )
+            self._evict()
+
+    def flush(self):
+        """Write the last-used times of the hits since the last write"""
+        with self._lock, self.conn:
+            self._flush_touched()
+
+    def close(self):
+        """Write pending last-used times and close the cache file"""
+        with self._lock:
+            with self.conn:
+                self._flush_touched()
+            self.conn.close()
+
+    def _flush_touched(self):
+        """Write pending last-used times inside the caller's transaction"""
+        if not self._touched:
+            return
+        self.conn.executemany(
+            "UPDATE translations SET last_used = ? WHERE source_lang = ? AND target_lang = ? AND text = ?",
+            [(last_used,) + key for key, last_used in self._touched.items()]
+        )
+        self._touched = {}
+
+    def _evict(self):
+        """Drop the oldest entries once the cache grows past max_entries"""
+        if self.size <= self.max_entries:
+            return
+
+        # Evict down to 90% so eviction doesn't run on every insert
+        excess = self.size - int(self.max_entries * 0.9)
+        cursor = self.conn.execute(
+            "DELETE FROM translations WHERE rowid IN "
+            "(SELECT rowid FROM translations ORDER BY last_used LIMIT ?)",
+            (excess,)
+        )
+        self.size -= cursor.rowcount
+        self.evictions += cursor.rowcount
+        logger.info(f"Evicted {cursor.rowcount} old translations from cache")
+
+    def stats(self) -> Dict:
+        """Get cache hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'size': self.size,
+                'max_entries': self.max_entries
+            }
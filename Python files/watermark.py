@@ -0,0 +1,170 @@
+"""
+Incremental Watermarks
+Each source remembers its high-water mark: the newest article (URL and
+date) its last incremental scrape saw. The next scrape pages forward
+through the listing only until it reaches that mark (or, before the source
+has one, an article that is already stored), so it reads no more pages than
+needed and doesn't leave a gap when several pages were published between
+runs.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from article_store import normalize_date
+from config import INCREMENTAL_MAX_PAGES, INCREMENTAL_PREFETCH_PAGES
+
+logger = logging.getLogger(__name__)
+
+
+def make_watermark(articles: List[Dict]) -> Optional[Dict]:
+    """
+    Build the watermark of a listing's first page
+
+    Args:
+        articles: Articles of the first listing page, newest first
+
+    Returns:
+        Dict with the newest 'url', the newest 'date' and when it was
+        recorded, or None for an empty page
+    """
+    if not articles:
+        return None
+    return {
+        'url': articles[0]['url'],
+        'date': max(normalize_date(article.get('date')) for article in articles),
+        'updated': datetime.now().isoformat()
+    }
+
+
+def reached_watermark(articles: List[Dict], watermark: Optional[Dict]) -> bool:
+    """
+    Check whether a listing page reaches the previous run's watermark
+
+    A page reaches it when it lists the watermark article, or an article
+    dated before the watermark (so the mark was passed, e.g. because the
+    article was removed from the listing).
+
+    Args:
+        articles: Articles of one listing page
+        watermark: Stored watermark, None if the source has none yet
+
+    Returns:
+        True if the page reaches the watermark
+    """
+    if not watermark:
+        return False
+    if any(article['url'] == watermark['url'] for article in articles):
+        return True
+    if watermark.get('date'):
+        dates = [normalize_date(article.get('date')) for article in articles]
+        return any(date and date < watermark['date'] for date in dates)
+    return False
+
+
+def listing_caught_up(scraper, articles: List[Dict], watermark: Optional[Dict]) -> bool:
+    """
+    Check whether older listing pages can be skipped
+
+    With a watermark, only reaching it counts: a stored article on the
+    page doesn't mean the pages up to the watermark were read, since the
+    last run may have stopped at a failed page. Without one, the first
+    stored article ends the paging, unless the last run was incomplete.
+
+    Args:
+        scraper: Scraper used for the duplicate check
+        articles: Articles of one listing page
+        watermark: Stored watermark, None if the source has none yet
+
+    Returns:
+        True when the page reaches the watermark, or (without a
+        watermark) lists a stored article
+    """
+    if watermark:
+        return reached_watermark(articles, watermark)
+    if scraper.articles_data.get('listing_incomplete'):
+        return False
+    if any(scraper._is_duplicate(article['url']) for article in articles):
+        return True
+    # Nothing stored yet: older articles are the archive backfill's job
+    return len(scraper.article_urls) == 0
+
+
+def page_until_watermark(scraper, first_page: List[Dict],
+                         fetch_page: Optional[Callable[[int], Optional[str]]] = None,
+                         max_pages: int = INCREMENTAL_MAX_PAGES,
+                         prefetch: int = INCREMENTAL_PREFETCH_PAGES) -> List[Dict]:
+    """
+    Collect listing articles from the first page until the watermark
+
+    Once a second page is needed, the following pages are downloaded
+    ahead (up to prefetch at a time) while the current one is parsed; the
+    fetcher keeps them within the host's rate limit.
+
+    The new watermark is set in scraper.articles_data, so it is saved
+    together with the articles by the scraper's next _save_data. It isn't
+    moved when a page failed to download, so the next run fills the gap;
+    the first page's pending conditional-GET validators are dropped then
+    too, so that run doesn't see the listing as unchanged and skip it.
+    listing_incomplete is set as well, so a source without a watermark
+    yet doesn't stop at its first stored article next time.
+
+    Args:
+        scraper: Scraper whose articles_data holds the watermark
+        first_page: Articles parsed from the first listing page
+        fetch_page: Returns the HTML of a listing page by number (None
+            if the page can't be fetched); None for sources without paging
+        max_pages: Maximum number of listing pages to read
+        prefetch: Listing pages downloaded ahead of the one being read
+
+    Returns:
+        Articles of all pages read, in listing order
+    """
+    watermark = scraper.articles_data.get('watermark')
+    articles = list(first_page)
+    page_num = 1
+
+    complete = True
+    caught_up = listing_caught_up(scraper, first_page, watermark)
+    if not caught_up and fetch_page is None:
+        logger.warning(f"{scraper.SOURCE}: no known article on the listing page, "
+                       f"articles published in between may be missing")
+    elif not caught_up:
+        with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+            pending = {}
+            next_page = 2
+            while True:
+                # Keep the next pages downloading while this one is checked
+                while next_page <= max_pages and len(pending) < max(prefetch, 1):
+                    pending[next_page] = executor.submit(fetch_page, next_page)
+                    next_page += 1
+                if page_num >= max_pages:
+                    logger.warning(f"{scraper.SOURCE}: watermark not reached after {max_pages} pages, "
+                                   f"older articles are left to the archive backfill")
+                    break
+                page_num += 1
+                html = pending.pop(page_num).result()
+                if not html:
+                    logger.warning(f"{scraper.SOURCE}: could not fetch listing page {page_num}, stopping early")
+                    complete = False
+                    break
+                page = scraper._parse_page(html)
+                articles.extend(page)
+                if not page or listing_caught_up(scraper, page, watermark):
+                    break
+            for future in pending.values():
+                future.cancel()
+
+    if page_num > 1:
+        logger.info(f"{scraper.SOURCE}: read {page_num} listing pages to reach the last run's newest article")
+
+    if complete:
+        scraper.articles_data.pop('listing_incomplete', None)
+    else:
+        scraper.articles_data['listing_incomplete'] = True
+        scraper._pending_validators = {}
+    new_watermark = make_watermark(first_page)
+    if new_watermark and complete:
+        scraper.articles_data['watermark'] = new_watermark
+    return articles
@@ -8,7 +8,8 @@ let currentSource = 'all';
 let currentPage = 1;
 let totalPages = 1;
 let searchQuery = '';
-let scrapingInterval = null;
+let scrapingProgress = {};
+let totalArticles = 0;
 
 // Initialize app on page load
 document.addEventListener('DOMContentLoaded', async () => {
@@ -106,11 +107,6 @@ function hideScrapingSidebar() {
 
     // Hide the scraping status button
     statusBtn.style.display = 'none';
-    
-    if (scrapingInterval) {
-        clearInterval(scrapingInterval);
-        scrapingInterval = null;
-    }
 }
 
 /**
@@ -156,16 +152,15 @@ async function stopScraping() {
 /**
  * Start tracking scraping progress
  */
-function startProgressTracking() {
-    // Update progress every 500ms
-    scrapingInterval = setInterval(async () => {
-        try {
-            const progress = await eel.get_scraping_progress()();
-            updateProgressDisplay(progress);
-        } catch (error) {
-            console.error('Error getting progress:', error);
-        }
-    }, 500);
+async function startProgressTracking() {
+    // Updates are pushed by Python; fetch the state once in case the first event was missed
+    try {
+        const progress = await eel.get_scraping_progress()();
+        scrapingProgress = Object.assign({}, progress, scrapingProgress);
+        updateProgressDisplay(scrapingProgress);
+    } catch (error) {
+        console.error('Error getting progress:', error);
+    }
 }
 
 /**
@@ -229,11 +224,59 @@ function scraping_completed() {
 }
 
 /**
- * Called by Python to update scraping progress
+ * Called by Python with the new articles of a source as soon as they are saved
+ * (the full list is reloaded in date order when the check completes)
+ */
+eel.expose(articles_added);
+function articles_added(source, articles) {
+    // Searches and other sources are refreshed by the reload at the end
+    if (searchQuery || (currentSource !== 'all' && currentSource !== source)) {
+        return;
+    }
+    
+    const container = document.getElementById('articles-container');
+    const countText = document.getElementById('article-count-text');
+    const shownUrls = new Set(Array.from(container.querySelectorAll('[data-url]'), card => card.dataset.url));
+    const fresh = articles.filter(article => !shownUrls.has(article.url));
+    if (fresh.length === 0) {
+        return;
+    }
+    
+    totalArticles += fresh.length;
+    
+    if (currentPage === 1) {
+        if (shownUrls.size === 0) {
+            // Replace the "No articles found" placeholder
+            container.innerHTML = '';
+        }
+        fresh.sort((a, b) => (b.date || '').localeCompare(a.date || ''));
+        container.insertAdjacentHTML('afterbegin', fresh.map(article => createArticleCard(article)).join(''));
+        
+        // Keep the page at 20 cards
+        const cards = container.querySelectorAll('[data-url]');
+        for (let i = 20; i < cards.length; i++) {
+            cards[i].remove();
+        }
+        const shown = Math.min(cards.length, 20);
+        countText.textContent = `Showing 1-${shown} of ${totalArticles} articles`;
+    } else {
+        const startNum = ((currentPage - 1) * 20) + 1;
+        const endNum = startNum + container.querySelectorAll('[data-url]').length - 1;
+        countText.textContent = `Showing ${startNum}-${endNum} of ${totalArticles} articles`;
+    }
+}
+
+/**
+ * Called by Python with the progress fields that changed since the last update
  */
 eel.expose(update_scraping_progress);
-function update_scraping_progress(progress) {
-    updateProgressDisplay(progress);
+function update_scraping_progress(delta) {
+    if (delta.status === 'starting') {
+        // A new run sends its full state first
+        scrapingProgress = {};
+    }
+    Object.assign(scrapingProgress, delta);
+    updateProgressDisplay(scrapingProgress);
 }
 
 /**
@@ -263,6 +306,7 @@ async function loadArticles() {
         
         // Update state
         totalPages = result.total_pages;
+        totalArticles = result.total;
         
         // Debug logging
         console.log('Articles loaded:', {
@@ -341,7 +385,7 @@ function createArticleCard(article) {
     }
     
     return `
-        <div class="flex flex-col sm:flex-row items-start sm:items-center justify-between p-4 bg-white dark:bg-background-dark rounded-xl shadow-sm hover:shadow-lg transition-shadow fade-in">
+        <div data-url="${escapeHtml(article.url)}" class="flex flex-col sm:flex-row items-start sm:items-center justify-between p-4 bg-white dark:bg-background-dark rounded-xl shadow-sm hover:shadow-lg transition-shadow fade-in">
             <div class="flex flex-col gap-2 flex-grow">
                 <div class="flex flex-wrap items-center gap-2">
                     <p class="text-[#0e171b] dark:text-white text-base font-medium leading-normal">